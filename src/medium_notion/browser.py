@@ -1,10 +1,14 @@
 """Medium 記事取得 — Playwright ブラウザ自動化"""
 
 import asyncio
+import difflib
 import json
+import re
 from pathlib import Path
+from urllib.parse import urlparse
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+import httpx
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, Playwright
 
 from .config import Config
 from .models import MediumArticle
@@ -18,6 +22,48 @@ ARTICLE_CONTAINER_SELECTORS = [
     "main",
     "[role='main']",
 ]
+# wait_for_selector 用に OR で束ねたセレクタ（いずれか 1 つの出現で解決する）
+ARTICLE_CONTAINER_SELECTOR_GROUP = ", ".join(ARTICLE_CONTAINER_SELECTORS)
+
+# 描画済みの本文ブロック数がこれ以上ならスクロールによる遅延ロードを省略する
+LAZY_LOAD_BLOCK_THRESHOLD = 20
+
+# Chromium 起動引数。ボット検出回避に加え、メモリ・CPU・バックグラウンド通信を抑える
+# （--no-sandbox は Playwright が既定で付与するため指定しない）
+CHROMIUM_LAUNCH_ARGS = [
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-extensions",
+    "--disable-sync",
+    "--metrics-recording-only",
+    "--mute-audio",
+    "--memory-pressure-off",
+]
+
+# ブラウザコンテキスト・HTTP 取得で共通に名乗る User-Agent
+USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0.0.0 Safari/537.36"
+)
+
+# HTTP 取得の本文がこの長さ未満ならブラウザ取得にフォールバックする
+HTTP_FETCH_MIN_CONTENT_LEN = 1500
+
+# フォールバック抽出（body 全体のテキスト）で返す最大文字数
+FALLBACK_TEXT_LIMIT = 15000
+
+# trafilatura の抽出結果を採用する最小長。これ未満は JS 抽出にフォールバックする
+MIN_EXTRACTED_CONTENT_LEN = 500
+
+# リスト・ライブラリページの描画完了を判定するセレクタ（記事カード or リストへのリンク）
+LIST_CONTENT_SELECTOR = 'article, a[href*="/list/"]'
 
 # ログイン状態を判定するセレクタ
 LOGIN_SELECTORS = [
@@ -27,6 +73,21 @@ LOGIN_SELECTORS = [
     "button[aria-label*='user']",
 ]
 
+# 記事タイトルを抽出するセレクタ（優先度順）
+TITLE_SELECTORS = [
+    "article h1",
+    "h1[data-testid='storyTitle']",
+    ".graf--title",
+    "h1",
+]
+
+# 著者名を抽出するセレクタ（優先度順）
+AUTHOR_SELECTORS = [
+    "[data-testid='authorName']",
+    "a[rel='author']",
+    ".pw-author-name",
+]
+
 # ペイウォール検出キーワード
 PAYWALL_INDICATORS = [
     "member-only story",
@@ -36,6 +97,534 @@ PAYWALL_INDICATORS = [
     "subscribe to read",
 ]
 
+# HTTP 取得した HTML 向けに、ペイウォール文言を 1 本の正規表現にまとめたもの
+_PAYWALL_RE = re.compile("|".join(re.escape(t) for t in PAYWALL_INDICATORS))
+
+# fast_fetch 時にブロックするリソース種別（本文抽出に寄与しないもの）
+# stylesheet はブロックしない: リスト削除フローが offsetHeight / 座標に依存するため
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "websocket"})
+
+# fast_fetch 時にブロックする広告・計測系ドメインのキーワード
+_BLOCKED_URL_KEYWORDS = (
+    "google-analytics",
+    "googletagmanager",
+    "doubleclick",
+    "segment.io",
+    "amplitude",
+)
+
+# 最下部までスクロールし、新しいリンクが DOM に追加されるかページが伸びたら true、
+# 上限時間内に何も増えなければ false を返す（リストページの無限スクロール用）
+_SCROLL_AND_WAIT_FOR_LINKS_JS = """
+(timeoutMs) => new Promise((resolve) => {
+    const startHeight = document.body.scrollHeight;
+    let done = false;
+    const finish = (grew) => {
+        if (done) return;
+        done = true;
+        observer.disconnect();
+        clearTimeout(timer);
+        resolve(grew || document.body.scrollHeight > startHeight);
+    };
+    const observer = new MutationObserver((mutations) => {
+        for (const m of mutations) {
+            for (const n of m.addedNodes) {
+                if (n.nodeType === 1 && (n.matches('a[href]') || n.querySelector('a[href]'))) {
+                    finish(true);
+                    return;
+                }
+            }
+        }
+    });
+    observer.observe(document.body, { childList: true, subtree: true });
+    const timer = setTimeout(() => finish(false), timeoutMs);
+    window.scrollTo(0, document.body.scrollHeight);
+})
+"""
+
+# 記事コンテナ内の DOM を走査してマークダウンに変換する抽出関数
+_EXTRACT_MARKDOWN_JS = """
+(containerSelectors) => {
+    // コンテナを探す（優先度順。見つけたセレクタも同じループで記録する）
+    let container = null;
+    let usedSelector = null;
+    for (const sel of containerSelectors) {
+        container = document.querySelector(sel);
+        if (container) {
+            usedSelector = sel;
+            break;
+        }
+    }
+    if (!container) return { markdown: '', selector: '', debug: 'No container found' };
+
+    // 本文ブロックを 1 回の querySelectorAll で文書順に取得して変換する。
+    // Medium の本文はほぼフラットなブロック列なので、ツリー全体を辿る必要はない
+    // マークダウンは 1 本の文字列に直接追記する（ブロックごとのオブジェクトを作らない）
+    let out = '';
+    let blockCount = 0;
+
+    function emit(content) {
+        if (!content.trim()) return;
+        out += content + '\\n\\n';
+        blockCount++;
+    }
+
+    // ナビゲーション・ボタン・フッターなどの非コンテンツ領域
+    const SKIP_SELECTOR = 'nav, footer, header, button, aside, '
+        + '[data-testid="headerNav"], [data-testid="postMetaLockup"], '
+        + '[data-testid="storyFooter"], [data-testid="publicationHeader"]';
+    // 段落内インライン要素のマークダウン記号
+    const INLINE_MARKS = { code: '`', strong: '**', b: '**', em: '*', i: '*' };
+    // 子孫ブロックを自分でまとめて出力するコンテナ（中の p などは個別に出さない）
+    const OWNER_SELECTOR = 'pre, blockquote, ul, ol, figure';
+
+    // closest() で見つかった祖先がコンテナ内の要素か（コンテナ外の祖先は無視する）
+    const insideContainer = (el) => el !== null && container.contains(el);
+
+    // ブロック要素を 1 つ変換する
+    function convert(el) {
+        const tag = el.tagName.toLowerCase();
+        // 本文テキストは使う分岐でだけ取り出す（ul / ol / figure で textContent を作らない）
+        const blockText = () => el.textContent?.trim() || '';
+
+        // 見出し
+        if (['h1', 'h2', 'h3', 'h4'].includes(tag)) {
+            const text = blockText();
+            if (text.length > 0) {
+                const level = '#'.repeat(parseInt(tag[1]));
+                emit(level + ' ' + text);
+                return;
+            }
+        }
+
+        // コードブロック (pre > code)
+        if (tag === 'pre') {
+            const code = el.querySelector('code');
+            const codeText = code ? code.textContent : el.textContent;
+            if (codeText?.trim()) {
+                emit('```\\n' + codeText.trim() + '\\n```');
+            }
+            return;
+        }
+
+        // ブロック引用
+        if (tag === 'blockquote') {
+            const text = blockText();
+            if (text) {
+                const quoted = text.split('\\n').map(l => '> ' + l.trim()).join('\\n');
+                emit(quoted);
+            }
+            return;
+        }
+
+        // リスト
+        if (tag === 'ul' || tag === 'ol') {
+            const items = el.querySelectorAll(':scope > li');
+            items.forEach((li, i) => {
+                const prefix = tag === 'ol' ? (i + 1) + '. ' : '- ';
+                const liText = li.textContent?.trim();
+                if (liText) {
+                    emit(prefix + liText);
+                }
+            });
+            return;
+        }
+
+        // 画像（alt テキスト / figcaption）
+        if (tag === 'figure') {
+            const img = el.querySelector('img');
+            const caption = el.querySelector('figcaption');
+            const alt = img?.getAttribute('alt') || '';
+            const capText = caption?.textContent?.trim() || '';
+            if (alt || capText) {
+                emit('[画像: ' + (capText || alt) + ']');
+            }
+            return;
+        }
+
+        // 段落
+        if (tag === 'p') {
+            if (blockText().length > 5) {
+                // インライン要素をマークダウン記法で囲む（タグ名は 1 回だけ引く）
+                let md = '';
+                for (const child of el.childNodes) {
+                    if (child.nodeType === 3) {
+                        md += child.textContent;
+                        continue;
+                    }
+                    const childTag = child.tagName?.toLowerCase();
+                    if (childTag === 'a') {
+                        const href = child.getAttribute('href') || '';
+                        md += '[' + child.textContent + '](' + href + ')';
+                    } else if (INLINE_MARKS[childTag]) {
+                        const mark = INLINE_MARKS[childTag];
+                        md += mark + child.textContent + mark;
+                    } else {
+                        md += child.textContent || '';
+                    }
+                }
+                emit(md.trim());
+            }
+            return;
+        }
+
+    }
+
+    const blocks = container.querySelectorAll(
+        'p, h1, h2, h3, h4, figure, pre, blockquote, ul, ol'
+    );
+    for (const el of blocks) {
+        if (insideContainer(el.closest(SKIP_SELECTOR))) continue;
+        if (insideContainer(el.parentElement?.closest(OWNER_SELECTOR) ?? null)) continue;
+        convert(el);
+    }
+
+    return {
+        markdown: out.trimEnd(),
+        selector: usedSelector || 'none',
+        lineCount: blockCount,
+        debug: 'OK'
+    };
+}
+"""
+
+# タイトル・著者・ペイウォール・404 判定をまとめて返す関数
+_PAGE_META_JS = """
+([titleSelectors, authorSelectors, paywallIndicators]) => {
+    const firstText = (selectors) => {
+        for (const sel of selectors) {
+            const el = document.querySelector(sel);
+            const text = el?.textContent?.trim();
+            if (text) return text;
+        }
+        return '';
+    };
+
+    const docTitle = document.title || '';
+    const bodyText = (document.body.textContent || '').toLowerCase();
+    const url = window.location.href;
+
+    // 404 検出パターン（本文の文言は 1 本の正規表現で 1 パス走査）
+    const is404 = (
+        docTitle === 'Medium' ||
+        url.includes('/404') ||
+        /page not found|this page doesn|out of nothing, something/.test(bodyText) ||
+        bodyText.includes('404') && bodyText.includes('not found')
+    );
+
+    // 記事ページかどうかの基本チェック
+    const hasArticleStructure = !!(
+        document.querySelector('article') ||
+        document.querySelector('[data-testid="storyTitle"]') ||
+        document.querySelector('h1')
+    );
+
+    // ペイウォール文言は 1 本の正規表現にまとめて本文を 1 パスで走査する
+    const escapeRe = (t) => t.replace(/[.*+?^${}()|[\\]\\\\]/g, '\\\\$&');
+    const paywallRe = new RegExp(paywallIndicators.map(escapeRe).join('|'));
+    const paywallMatch = bodyText.match(paywallRe);
+
+    return {
+        title: firstText(titleSelectors),
+        author: firstText(authorSelectors),
+        paywallHit: paywallMatch ? paywallMatch[0] : '',
+        is404: is404,
+        hasArticleStructure: hasArticleStructure,
+        finalUrl: url,
+    };
+}
+"""
+
+# リスト・ライブラリページから記事 URL を集める関数（厳密パターンと緩い条件の両方）
+_ARTICLE_LINKS_JS = """
+() => {
+    // /@user/article-slug-hash 形式
+    const reUser = /^\\/@[^/]+\\/[^/]+-[a-f0-9]{8,}/;
+    // /publication/article-slug-hash 形式
+    const rePub = /^\\/[^@][^/]*\\/[^/]+-[a-f0-9]{8,}/;
+    // /p/hash 形式（短縮URL）
+    const reShort = /^\\/p\\/[a-f0-9]+/;
+    // 記事でないことが明らかなパス（両条件で共通）
+    const isNavPath = (path) =>
+        path === '/' || path === '/new-story'
+        || path.startsWith('/me/') || path.startsWith('/m/')
+        || path.startsWith('/tag/') || path.startsWith('/search')
+        || path.startsWith('/plans') || path.startsWith('/membership')
+        || path.includes('/list/') || path.includes('/sitemap')
+        || path.includes('/about');
+
+    const strict = new Set();
+    const loose = new Set();
+    // document.links は href を持つリンクのライブコレクション（セレクタ照合・配列化が不要）
+    for (const a of document.links) {
+        let url;
+        try {
+            url = new URL(a.href);
+        } catch {
+            continue;
+        }
+        // Medium ドメインのみ
+        if (url.hostname !== 'medium.com'
+            && !url.hostname.endsWith('.medium.com')) continue;
+        const path = url.pathname;
+        if (isNavPath(path)) continue;
+        // クエリパラメータとフラグメントを除去（Set で重複除去）
+        const href = url.origin + path;
+        // 緩い条件: 2 階層以上のパス
+        if (path.split('/').length >= 3) loose.add(href);
+        if (path === '/me' || path.startsWith('/creators')) continue;
+        if (reUser.test(path) || rePub.test(path) || reShort.test(path)) {
+            strict.add(href);
+        }
+    }
+    return { strict: [...strict], loose: [...loose] };
+}
+"""
+
+# ライブラリページの /list/ リンクと見出しを集める関数
+_LIST_LINKS_JS = """
+() => {
+    const links = [];
+    const headings = [];
+    // リンクは document.links（ライブコレクション）から絞り込み、見出しだけセレクタで取る
+    for (const a of document.links) {
+        if (a.href.includes('/list/')) {
+            links.push({ href: a.href, text: a.textContent?.trim() || '' });
+        }
+    }
+    for (const el of document.querySelectorAll('h2, h3, h4')) {
+        const text = el.textContent?.trim() || '';
+        if (text.length > 0 && text.length < 100) {
+            headings.push(text);
+        }
+    }
+    return { links: links, headings: headings };
+}
+"""
+
+# リストページで urlPath の記事リンクを含むカード要素（ボタンと複数リンクを持つ祖先）を返す
+_FIND_ARTICLE_CARD_JS = """
+(urlPath) => {
+    for (const link of document.links) {
+        let linkUrl;
+        try {
+            linkUrl = new URL(link.href);
+        } catch {
+            continue;
+        }
+        if (linkUrl.pathname !== urlPath) continue;
+
+        let card = link;
+        for (let i = 0; i < 15; i++) {
+            if (!card.parentElement) break;
+            card = card.parentElement;
+            const hasMultipleLinks = card.querySelectorAll('a[href]').length >= 2;
+            const hasButton = card.querySelector('button');
+            if (hasMultipleLinks && hasButton
+                && card.offsetHeight > 80
+                && card.offsetHeight < 600) {
+                break;
+            }
+        }
+        return card;
+    }
+    return null;
+}
+"""
+
+# 記事カード内のブックマーク（リスト保存）ボタンを返す。
+# aria-label で見つからなければ SVG を含む小さいボタンを候補にする
+_FIND_BOOKMARK_BUTTON_JS = """
+(card) => {
+    const buttons = [...card.querySelectorAll('button')];
+    const labelMatch = buttons.find(b => {
+        const lbl = (b.getAttribute('aria-label') || '').toLowerCase();
+        return lbl.includes('bookmark') || lbl.includes('save') || lbl.includes('list');
+    });
+    if (labelMatch) return labelMatch;
+    return buttons.find(b => {
+        const r = b.getBoundingClientRect();
+        return b.querySelector('svg')
+            && r.width > 0 && r.width < 60
+            && r.height > 0 && r.height < 60;
+    }) || null;
+}
+"""
+
+# 開いているリストピッカーで listName の行をクリックしてチェックを外す
+_TOGGLE_LIST_PICKER_JS = """
+(listName) => {
+    // 大文字小文字を無視した照合は正規表現にまとめて一度だけコンパイルし、
+    // 候補要素ごとに toLowerCase() した文字列を作らない
+    const escaped = listName.replace(/[.*+?^${}()|[\\]\\\\]/g, '\\\\$&');
+    const reExact = new RegExp('^' + escaped + '$', 'i');
+    const rePrefix = new RegExp('^' + escaped, 'i');
+    const reContains = new RegExp(escaped, 'i');
+
+    // 「リスト名と完全一致するテキストの可視要素」を popover 内で探す。
+    // 注意: 「リストページにいるとき」はページの H1 等にも同じテキストが
+    // 存在するため、単純な textContent 一致だと H1 をクリックしてしまい
+    // 削除されない。popover らしさ (positioned ancestor + 小サイズ + 非見出し)
+    // をフィルタとして付ける。
+    const isHeadingTag = (el) => {
+        const t = (el.tagName || '').toLowerCase();
+        return t === 'h1' || t === 'h2' || t === 'h3' || t === 'h4';
+    };
+    const hasPositionedAncestor = (el) => {
+        let cur = el.parentElement;
+        let depth = 0;
+        while (cur && depth < 20) {
+            const s = window.getComputedStyle(cur);
+            if (s.position === 'fixed' || s.position === 'absolute') {
+                const z = parseInt(s.zIndex) || 0;
+                // popover は通常それなり以上の stacking context を持つ
+                if (z >= 1 || s.position === 'fixed') return true;
+            }
+            cur = cur.parentElement;
+            depth += 1;
+        }
+        return false;
+    };
+
+    // 候補を集めてスコアを付ける（popover エントリらしさ）
+    const candidates = [];
+    const allEls = [...document.querySelectorAll('div, li, label, span, button')];
+    for (const el of allEls) {
+        const t = (el.textContent || '').trim();
+        if (!reExact.test(t)) continue;
+        if (!(el.offsetWidth > 0 && el.offsetHeight > 0)) continue;
+        if (isHeadingTag(el)) continue;
+        // 親に H1/H2/H3 があるなら除外（見出しの内側の span 等）
+        if (el.closest && el.closest('h1,h2,h3,h4')) continue;
+        const r = el.getBoundingClientRect();
+        // popover エントリは小さい矩形 (高さ ~ 24-80 px、幅 ~ 100-500 px)
+        if (r.height > 100 || r.width > 600) continue;
+        if (!hasPositionedAncestor(el)) continue;
+        candidates.push({ el, area: r.width * r.height });
+    }
+
+    // 最も小さい矩形 = popover の row 候補
+    candidates.sort((a, b) => a.area - b.area);
+    if (candidates.length > 0) {
+        let row = candidates[0].el;
+        // 4 階層上までクリック可能な行を探す
+        for (let i = 0; i < 5; i++) {
+            if (!row.parentElement) break;
+            const r = row.getBoundingClientRect();
+            if (r.height >= 24 && r.height <= 80
+                && r.width >= 80 && r.width <= 500) break;
+            row = row.parentElement;
+        }
+        row.click();
+        return { clicked: true, via: 'popover-scoped', text: candidates[0].el.textContent?.trim() };
+    }
+
+    // 従来ロジック: オーバーレイから探す（後方互換）
+    const overlays = [...document.querySelectorAll('*')].filter(el => {
+        const style = window.getComputedStyle(el);
+        const zIndex = parseInt(style.zIndex) || 0;
+        const pos = style.position;
+        const rect = el.getBoundingClientRect();
+        return (zIndex > 10 || pos === 'fixed' || pos === 'absolute')
+            && rect.width > 100 && rect.width < 500
+            && rect.height > 50 && rect.height < 600
+            && rect.top >= 0 && rect.top < window.innerHeight;
+    });
+
+    for (const overlay of overlays) {
+        if (!reContains.test(overlay.textContent || '')) continue;
+
+        // オーバーレイ内のすべての要素をフラットに取得
+        const allChildren = [...overlay.querySelectorAll('*')];
+
+        // 方法1: チェックボックスを探す
+        for (const el of allChildren) {
+            if (el.tagName.toLowerCase() === 'input'
+                && el.type === 'checkbox') {
+                const parent = el.closest('div, label, li');
+                if (parent) {
+                    const pText = parent.textContent || '';
+                    if (reContains.test(pText)) {
+                        el.click();
+                        return { clicked: true, via: 'checkbox', text: pText.trim() };
+                    }
+                }
+            }
+        }
+
+        // 方法2: リスト名テキストに完全一致する要素の行をクリック
+        for (const el of allChildren) {
+            const text = (el.textContent || '').trim();
+            if (reExact.test(text)) {
+                const row = el.closest('div, li, label')
+                    || el.parentElement;
+                if (row) {
+                    row.click();
+                    return { clicked: true, via: 'text-row', text: text };
+                }
+                el.click();
+                return { clicked: true, via: 'text-direct', text: text };
+            }
+        }
+
+        // 方法3: リスト名で始まるリーフ要素をクリック
+        for (const el of allChildren) {
+            const text = (el.textContent || '').trim();
+            if (text.length < 30 && rePrefix.test(text)
+                && el.children.length === 0) {
+                const row = el.closest('div[role], li, label')
+                    || el.parentElement;
+                if (row) {
+                    row.click();
+                    return { clicked: true, via: 'leaf-row', text: text };
+                }
+            }
+        }
+
+        // 方法4: "Locked" 等が付いたリスト名を含む要素を探す
+        for (const el of allChildren) {
+            const text = (el.textContent || '').trim();
+            if (text.length < 50 && reContains.test(text)) {
+                // リスト行を見つける: クリック可能な親を探す
+                const clickable = el.closest(
+                    'div[role="option"], div[role="button"], li, label'
+                ) || el.closest('div');
+                if (clickable && clickable.offsetHeight > 20
+                    && clickable.offsetHeight < 100) {
+                    clickable.click();
+                    return { clicked: true, via: 'contains-match', text: text };
+                }
+            }
+        }
+
+        // デバッグ: オーバーレイの中身を出力
+        const debugTexts = allChildren
+            .map(el => {
+                const t = el.textContent?.trim();
+                const tag = el.tagName?.toLowerCase();
+                return t && t.length < 50 && t.length > 0
+                    ? tag + ':' + t : null;
+            })
+            .filter(Boolean);
+        const unique = [...new Set(debugTexts)];
+        return { clicked: false, debug: unique.slice(0, 20) };
+    }
+    return { clicked: false, debug: ['no overlay with list name found'] };
+}
+"""
+
+# コンテキスト生成時に登録する初期化スクリプト。抽出関数をページのグローバルに
+# 定義しておき、evaluate 毎に数 KB のソースを送って再パースさせないようにする
+_PAGE_INIT_SCRIPT = (
+    "window.__mnExtractMarkdown = " + _EXTRACT_MARKDOWN_JS.strip() + ";\n"
+    "window.__mnCollectPageMeta = " + _PAGE_META_JS.strip() + ";\n"
+    "window.__mnCollectArticleLinks = " + _ARTICLE_LINKS_JS.strip() + ";\n"
+    "window.__mnCollectListLinks = " + _LIST_LINKS_JS.strip() + ";\n"
+    "window.__mnFindArticleCard = " + _FIND_ARTICLE_CARD_JS.strip() + ";\n"
+    "window.__mnFindBookmarkButton = " + _FIND_BOOKMARK_BUTTON_JS.strip() + ";\n"
+    "window.__mnToggleListInPicker = " + _TOGGLE_LIST_PICKER_JS.strip() + ";\n"
+)
+
 # Cloudflare チャレンジページの title パターン
 # Cloudflare は Accept-Language に応じて文言を翻訳して返すので、日本語版も含める
 _CLOUDFLARE_TITLE_PATTERNS = (
@@ -56,6 +645,156 @@ def _is_cloudflare_challenge(title: str | None) -> bool:
     return any(pattern in lowered for pattern in _CLOUDFLARE_TITLE_PATTERNS)
 
 
+def _should_block_request(resource_type: str, url: str) -> bool:
+    """本文抽出に不要なリクエスト（画像・フォント・計測ビーコン等）かどうかを判定する"""
+    if resource_type in _BLOCKED_RESOURCE_TYPES:
+        return True
+    return any(keyword in url for keyword in _BLOCKED_URL_KEYWORDS)
+
+
+def _extract_markdown_from_html(html: str) -> str:
+    """ページ HTML から本文をマークダウンで抽出する（trafilatura）。
+
+    抽出できない・短すぎる場合は空文字を返し、呼び出し側は JS 抽出にフォールバックする。
+    """
+    try:
+        import trafilatura
+
+        markdown = trafilatura.extract(
+            html,
+            output_format="markdown",
+            include_formatting=True,
+            include_links=True,
+            include_comments=False,
+        )
+    except Exception as e:
+        log.warn(f"trafilatura による本文抽出に失敗: {e}")
+        return ""
+    if not markdown or len(markdown) < MIN_EXTRACTED_CONTENT_LEN:
+        return ""
+    return markdown
+
+
+def _extract_fallback_text(html: str, limit: int = FALLBACK_TEXT_LIMIT) -> str:
+    """ページ HTML の body から 10 文字超のテキストノードを段落として連結する（lxml）
+
+    limit 文字に達した時点で走査を打ち切り、それ以降のテキストは連結しない。
+    """
+    from lxml import etree
+    from lxml import html as lxml_html
+
+    try:
+        doc = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return ""
+    for bad in doc.xpath(
+        "//script|//style|//nav|//footer|//button|//noscript"
+    ):
+        bad.drop_tree()
+    parts: list[str] = []
+    length = 0
+    for text in doc.xpath("//body//text()"):
+        text = text.strip()
+        if len(text) <= 10:
+            continue
+        parts.append(text)
+        length += len(text) + 2
+        if length >= limit:
+            break
+    return "\n\n".join(parts)[:limit]
+
+
+def _read_storage_state(session_path: Path) -> dict | None:
+    """storage_state 形式のセッションファイルを読み込む（無い・壊れていれば None）"""
+    try:
+        return json.loads(session_path.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _session_cookies(storage_state: dict | None) -> dict[str, str]:
+    """storage_state から medium.com の cookie を取り出す"""
+    if not storage_state:
+        return {}
+    return {
+        c["name"]: c["value"]
+        for c in storage_state.get("cookies", [])
+        if "medium.com" in c.get("domain", "")
+    }
+
+
+def _body_text(html: str) -> str:
+    """script / style を除いた body のテキストを返す（lxml）"""
+    from lxml import etree
+    from lxml import html as lxml_html
+
+    try:
+        doc = lxml_html.fromstring(html)
+    except (etree.ParserError, ValueError):
+        return ""
+    for bad in doc.xpath("//script|//style|//noscript"):
+        bad.drop_tree()
+    body = doc.find("body")
+    return (body if body is not None else doc).text_content()
+
+
+def _parse_article_html(html: str, url: str) -> MediumArticle | None:
+    """HTTP で取得した記事 HTML を MediumArticle に変換する。
+
+    Cloudflare チャレンジ・404・ペイウォール・本文不足のいずれかなら None を返し、
+    呼び出し側はブラウザ取得にフォールバックする。
+    """
+    import trafilatura
+
+    metadata = trafilatura.extract_metadata(html)
+    title = (metadata.title if metadata else "") or ""
+    if _is_cloudflare_challenge(title):
+        return None
+
+    # ブラウザ側の判定と同じく、スクリプトを除いた body のテキストで判定する
+    body_text = _body_text(html).lower()
+    if _PAYWALL_RE.search(body_text) or "page not found" in body_text:
+        return None
+
+    content = _extract_markdown_from_html(html)
+    if len(content) < HTTP_FETCH_MIN_CONTENT_LEN:
+        return None
+
+    return MediumArticle(
+        url=url,
+        title=title or "Untitled",
+        author=(metadata.author if metadata else "") or "",
+        content=content,
+        is_preview_only=False,
+    )
+
+
+def _match_list_link(list_name: str, links: list[dict]) -> str | None:
+    """ライブラリページのリンク一覧から list_name に対応するリスト URL を選ぶ。
+
+    完全一致 → リンクテキストに含まれる → href に含まれる → 表記ゆれ（difflib）の順に探す。
+    Reading list 自体（/list/reading-list）は対象外。
+    """
+    candidates = [l for l in links if "/list/reading-list" not in l["href"]]
+    target_lower = list_name.lower()
+
+    for link in candidates:
+        if link["text"] == list_name:
+            return link["href"]
+    for link in candidates:
+        if list_name in link["text"]:
+            return link["href"]
+    for link in candidates:
+        if target_lower in link["href"].lower():
+            return link["href"]
+
+    texts = [l["text"].lower() for l in candidates]
+    matches = difflib.get_close_matches(target_lower, texts, n=1, cutoff=0.6)
+    if matches:
+        return candidates[texts.index(matches[0])]["href"]
+    return None
+
+
 def _strip_tracking_query(url: str) -> str:
     """URL からトラッキング目的のクエリ (`?source=...` 等) を除去する。
 
@@ -92,6 +831,10 @@ def _save_list_url(cache_path: Path, list_name: str, url: str) -> None:
     cache_path.write_text(json.dumps(cache, indent=2, ensure_ascii=False))
 
 
+# BrowserClient.shared() が返すプロセス内共有インスタンス
+_shared_client: "BrowserClient | None" = None
+
+
 class BrowserClient:
     """Playwright を使って Medium 記事を取得するクライアント"""
 
@@ -99,50 +842,108 @@ class BrowserClient:
         self.config = config
         self.session_path = config.session_path
         self.list_url_cache_path = config.session_path.parent / ".medium-list-cache.json"
+        # async_playwright().start() の戻り値（close() で stop してドライバを終了させる）
+        self._playwright: Playwright | None = None
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
         self._page: Page | None = None
+        self._launch_task: asyncio.Task | None = None
+        # 保存済みセッション（storage_state）のメモリ上のコピー。
+        # コンテキスト生成・HTTP 取得のたびにファイルを読み直さないよう、初回に 1 回だけ読む
+        self._storage_state: dict | None = None
+        self._storage_state_loaded = False
+        # ログイン状態をこのクライアントで確認済みか（確認用の遷移を繰り返さない）
+        self._login_verified = False
+
+    @classmethod
+    def shared(cls, config: Config) -> "BrowserClient":
+        """プロセス内で共有する BrowserClient を返す（初回呼び出し時に生成）。
+
+        複数記事を扱う呼び出し元がブラウザ起動コストを毎回払わないようにする。
+        close() すると共有インスタンスは破棄され、次回は新たに生成される。
+        """
+        global _shared_client
+        if _shared_client is None:
+            _shared_client = cls(config)
+        return _shared_client
 
     async def initialize(self) -> None:
-        """ブラウザを起動して初期化"""
-        pw = await async_playwright().start()
-        self._browser = await pw.chromium.launch(
+        """クライアントを初期化する。
+
+        ブラウザの起動（1〜3 秒・数百 MB）は実際に必要になるまで遅延する。
+        HTTP 取得だけで済んだ実行ではブラウザを一度も起動しない。
+        """
+        log.step("ブラウザは必要になった時点で起動します")
+
+    async def _ensure_browser(self) -> None:
+        """ブラウザを起動する（起動済み・起動中なら同じ起動処理を待つだけ）"""
+        if self._launch_task is None:
+            self._launch_task = asyncio.create_task(self._launch())
+        await self._launch_task
+
+    async def _launch(self) -> None:
+        """ブラウザ・コンテキスト・ページを生成する"""
+        self._playwright = await async_playwright().start()
+        args = list(CHROMIUM_LAUNCH_ARGS)
+        if self.config.headless:
+            args.append("--disable-gpu")
+        self._browser = await self._playwright.chromium.launch(
             headless=self.config.headless,
-            slow_mo=100 if not self.config.headless else 0,
-            args=[
-                "--no-first-run",
-                "--no-default-browser-check",
-                "--disable-blink-features=AutomationControlled",
-            ],
+            slow_mo=0,
+            args=args,
         )
 
-        # 保存済みセッションを読み込み
-        storage_state = None
-        if self.session_path.exists():
+        # 保存済みセッションを読み込み（メモリ上のコピーを使う）
+        self._context = None
+        storage_state = await self._load_storage_state()
+        if storage_state is not None:
             try:
-                storage_state = json.loads(self.session_path.read_text())
+                self._context = await self._new_context(storage_state)
                 log.step("保存済みセッションを読み込みました")
             except Exception:
                 log.warn("セッションファイルの読み込みに失敗。新規セッションを使用します")
+        if self._context is None:
+            self._context = await self._new_context()
+        self._page = await self._context.new_page()
 
-        self._context = await self._browser.new_context(
+    async def _load_storage_state(self) -> dict | None:
+        """保存済みセッションを返す（ディスクからの読み込み・パースはクライアントごとに 1 回）"""
+        if not self._storage_state_loaded:
+            self._storage_state = await asyncio.to_thread(_read_storage_state, self.session_path)
+            self._storage_state_loaded = True
+        return self._storage_state
+
+    async def _new_context(self, storage_state: dict | None = None) -> BrowserContext:
+        """共通オプションでコンテキストを作成し、fast_fetch なら不要リソースを遮断する"""
+        context = await self._browser.new_context(
             **self._build_context_options(storage_state)
         )
-        self._page = await self._context.new_page()
+        await context.add_init_script(script=_PAGE_INIT_SCRIPT)
+        if self.config.fast_fetch:
+            await context.route("**/*", self._route_request)
+        return context
+
+    @staticmethod
+    async def _route_request(route) -> None:
+        """画像・フォント・メディア・計測ビーコンを abort し、それ以外は通す"""
+        request = route.request
+        if _should_block_request(request.resource_type, request.url):
+            await route.abort()
+        else:
+            await route.continue_()
 
     def _build_context_options(self, storage_state: dict | None = None) -> dict:
         """new_context() に渡すオプションを構築する（共通化のため抽出）"""
         opts = {
             "viewport": {"width": 1280, "height": 720},
-            "user_agent": (
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
+            "user_agent": USER_AGENT,
             # Cloudflare は IP の地域とブラウザの locale/timezone の整合性も見ている
             "locale": "ja-JP",
             "timezone_id": "Asia/Tokyo",
         }
+        if self.config.fast_fetch:
+            # Service Worker 経由のリクエストは context.route() で捕捉できないため無効化する
+            opts["service_workers"] = "block"
         if storage_state is not None:
             opts["storage_state"] = storage_state
         return opts
@@ -160,24 +961,28 @@ class BrowserClient:
         """
         if not self._browser or not self._context:
             return
-        # 元の session.json を再ロード（ランタイム蓄積 cookie は破棄）
-        storage_state = None
-        if self.session_path.exists():
+        # 元の session.json の内容で作り直す（ランタイム蓄積 cookie は破棄）。
+        # メモリ上のコピーは session.json と同じ内容（_save_session で両方更新する）
+        await self._context.close()
+        self._context = None
+        storage_state = await self._load_storage_state()
+        if storage_state is not None:
             try:
-                storage_state = json.loads(self.session_path.read_text())
+                self._context = await self._new_context(storage_state)
             except Exception:
                 pass
-        await self._context.close()
-        self._context = await self._browser.new_context(
-            **self._build_context_options(storage_state)
-        )
+        if self._context is None:
+            self._context = await self._new_context()
         self._page = await self._context.new_page()
         log.step("ブラウザコンテキストを再生成しました（Cloudflare 回避）")
 
-    async def ensure_login(self) -> bool:
+    async def ensure_login(self, force: bool = False) -> bool:
         """Medium にログインしているか確認。未ログインなら手動ログインを促す（GUIモード専用）"""
-        if not self._page:
-            raise RuntimeError("ブラウザが初期化されていません")
+        await self._ensure_browser()
+
+        # このクライアントで確認済みなら、トップページを開き直さない
+        if not force and self._login_verified:
+            return True
 
         # headless モードでは手動ログイン不可
         if self.config.headless:
@@ -190,21 +995,25 @@ class BrowserClient:
 
         log.step("Medium のログイン状態を確認中...")
         try:
-            await self._page.goto("https://medium.com", timeout=15000)
-            await self._page.wait_for_load_state("networkidle", timeout=15000)
+            # networkidle は広告・計測ビーコンで収束しないため domcontentloaded で十分
+            await self._page.goto(
+                "https://medium.com", wait_until="domcontentloaded", timeout=15000
+            )
         except Exception:
             log.warn("Medium トップページの読み込みがタイムアウトしました。続行します")
             return False
 
-        # ログイン判定
-        for selector in LOGIN_SELECTORS:
-            try:
-                await self._page.wait_for_selector(selector, timeout=3000)
-                log.success("Medium にログイン済みです")
-                await self._save_session()
-                return True
-            except Exception:
-                continue
+        # ログイン判定（CSS セレクタリストは OR なので、いずれか 1 つで即解決する）
+        try:
+            await self._page.wait_for_selector(
+                ", ".join(LOGIN_SELECTORS), timeout=10000
+            )
+            log.success("Medium にログイン済みです")
+            self._login_verified = True
+            await self._save_session()
+            return True
+        except Exception:
+            pass
 
         # 未ログイン → 手動ログインを促す
         log.warn("Medium にログインしていません。ブラウザでログインしてください")
@@ -225,6 +1034,7 @@ class BrowserClient:
                 ", ".join(LOGIN_SELECTORS), timeout=300_000
             )
             log.success("ログイン成功！セッションを保存します")
+            self._login_verified = True
             await self._save_session()
             return True
         except Exception:
@@ -233,18 +1043,17 @@ class BrowserClient:
 
     async def fetch_article(self, url: str) -> MediumArticle:
         """Medium 記事の全文を取得"""
-        if not self._page:
-            raise RuntimeError("ブラウザが初期化されていません")
-
         log.step(f"記事を取得中: {url}")
+        self._require_session()
 
-        # セッション必須チェック
-        if not self.session_path.exists():
-            raise RuntimeError(
-                "Medium のログインセッションがありません。\n"
-                "  → 先に `medium-notion login` を実行してログインしてください。"
-            )
-        log.step("保存済みセッションを使用")
+        # ブラウザを使わない HTTP 取得を先に試す（JS 実行・描画を丸ごと省ける）
+        if self.config.http_fetch:
+            article = await self._try_http_fetch(url)
+            if article:
+                log.success(f"HTTP 取得で記事を取得: {article.title}")
+                return article
+
+        await self._ensure_browser()
 
         # ヘッドレスでは記事ごとに context をリフレッシュする。
         # 同一 context で複数 Medium ページを叩くと Cloudflare に bot 判定されるため、
@@ -252,8 +1061,59 @@ class BrowserClient:
         if self.config.headless:
             await self._refresh_context()
 
+        article = await self._fetch_article_on_page(self._page, url)
+
+        # 記事取得の前にはログイン確認の遷移をしないので、プレビューのみだった場合に
+        # （このクライアントでまだ確認していなければ）ログインを確認して再取得する
+        if article.is_preview_only and not self._login_verified and not self.config.headless:
+            log.warn("プレビューのみ取得されました。ログイン状態を再確認します")
+            if await self.ensure_login(force=True):
+                article = await self._fetch_article_on_page(self._page, url)
+        return article
+
+    async def _try_http_fetch(self, url: str) -> MediumArticle | None:
+        """保存済みセッションの cookie で記事 HTML を直接取得して解析する。
+
+        取得・解析できなければ None を返し、呼び出し側はブラウザ取得に進む。
+        """
+        cookies = _session_cookies(await self._load_storage_state())
+        headers = {
+            "User-Agent": USER_AGENT,
+            "Accept-Language": "ja-JP,ja;q=0.9,en;q=0.8",
+        }
+        try:
+            async with httpx.AsyncClient(
+                cookies=cookies, headers=headers, follow_redirects=True, timeout=15.0
+            ) as client:
+                response = await client.get(url)
+        except httpx.HTTPError as e:
+            log.step(f"HTTP 取得に失敗、ブラウザで取得します: {e}")
+            return None
+        if response.status_code != 200:
+            log.step(f"HTTP 取得が {response.status_code} を返したため、ブラウザで取得します")
+            return None
+
+        article = await asyncio.to_thread(_parse_article_html, response.text, url)
+        if article is None:
+            log.step("HTTP 取得では本文を取得できないため、ブラウザで取得します")
+        return article
+
+    def _require_session(self) -> None:
+        """セッション必須チェック（なければ RuntimeError）"""
+        if not self.session_path.exists():
+            raise RuntimeError(
+                "Medium のログインセッションがありません。\n"
+                "  → 先に `medium-notion login` を実行してログインしてください。"
+            )
+        log.step("保存済みセッションを使用")
+
+    async def _fetch_article_on_page(self, page: Page, url: str) -> MediumArticle:
+        """指定ページで記事 URL を開き、本文・メタ情報を抽出する"""
         # 記事ページにアクセス
-        response = await self._page.goto(url, wait_until="domcontentloaded")
+        response = await page.goto(url, wait_until="domcontentloaded")
+        # ログインページへ飛ばされたらセッション切れ。確認済みフラグを取り消す
+        if "/m/signin" in page.url:
+            self._login_verified = False
 
         # --- 早期バリデーション: HTTP ステータスコード ---
         if response and response.status >= 400:
@@ -261,88 +1121,83 @@ class BrowserClient:
                 f"ページの取得に失敗しました (HTTP {response.status})。URLが正しいか確認してください。"
             )
 
-        try:
-            await self._page.wait_for_load_state("networkidle", timeout=30000)
-        except Exception:
-            log.warn("networkidle タイムアウト — 読み込み完了前に続行します")
-
         # --- 早期バリデーション: 404 / 無効ページ検出 ---
-        page_validation = await self._page.evaluate("""
-            () => {
-                const title = document.title || '';
-                const bodyText = (document.body.textContent || '').toLowerCase();
-                const url = window.location.href;
-
-                // 404 検出パターン
-                const is404 = (
-                    title === 'Medium' ||
-                    bodyText.includes('page not found') ||
-                    bodyText.includes('404') && bodyText.includes('not found') ||
-                    bodyText.includes('this page doesn') ||
-                    bodyText.includes('out of nothing, something') ||
-                    url.includes('/404')
-                );
-
-                // 記事ページかどうかの基本チェック
-                const hasArticleStructure = !!(
-                    document.querySelector('article') ||
-                    document.querySelector('[data-testid="storyTitle"]') ||
-                    document.querySelector('h1')
-                );
-
-                return {
-                    title: title,
-                    is404: is404,
-                    hasArticleStructure: hasArticleStructure,
-                    finalUrl: url,
-                };
-            }
-        """)
-
-        if page_validation.get("is404") and not page_validation.get("hasArticleStructure"):
+        # 記事コンテナの待機（最大 10 秒）より前に判定し、無効な URL で待たされないようにする
+        validation = await self._collect_page_meta(page)
+        if validation.get("is404") and not validation.get("hasArticleStructure"):
             raise RuntimeError(
                 f"記事が見つかりません (404)。URLが正しいか確認してください。\n"
                 f"  入力URL: {url}\n"
-                f"  最終URL: {page_validation.get('finalUrl')}"
+                f"  最終URL: {validation.get('finalUrl')}"
             )
 
-        # 記事コンテナが描画されるまで待機（最大10秒）
-        container_found = False
-        for selector in ARTICLE_CONTAINER_SELECTORS:
-            try:
-                await self._page.wait_for_selector(selector, timeout=5000)
-                log.step(f"記事コンテナ検出: {selector}")
-                container_found = True
-                break
-            except Exception:
-                continue
+        # NOTE: networkidle は待たない。Medium は広告・計測ビーコンの long-poll が
+        # 常に走っていて idle にならず、ほぼ毎回タイムアウトまで待たされるため。
+        # 以降の記事コンテナ待機（セレクタ検出）で描画完了を判定する。
 
-        if not container_found:
+        # 記事コンテナが描画されるまで待機（最大10秒）
+        # セレクタを OR で束ねて 1 回だけ待つ（個別に待つと最悪 5 秒 × 候補数かかる）
+        try:
+            await page.wait_for_selector(
+                ARTICLE_CONTAINER_SELECTOR_GROUP, timeout=10000
+            )
+            log.step("記事コンテナ検出")
+        except Exception:
             log.warn("記事コンテナが見つかりません — ページ構造が想定と異なる可能性があります")
 
-        # 遅延ロードされるコンテンツのため追加待機
-        await self._page.wait_for_timeout(3000)
-
-        # スクロールして遅延読み込みコンテンツをトリガー
-        await self._page.evaluate("""
-            async () => {
-                const delay = ms => new Promise(r => setTimeout(r, ms));
-                for (let i = 0; i < 5; i++) {
-                    window.scrollBy(0, window.innerHeight);
-                    await delay(500);
+        # 遅延ロードされるコンテンツの描画が落ち着くまで待機。
+        # 固定 sleep ではなく、本文ブロック数が 2 回連続のポーリングで変化しなく
+        # なった時点で抜ける（描画済みのページなら ~400ms で返る）
+        try:
+            await page.wait_for_function(
+                """
+                () => {
+                    const n = document.querySelectorAll(
+                        'article p, article h2, article pre'
+                    ).length;
+                    if (window.__lastBlockCount === n && n > 0) return true;
+                    window.__lastBlockCount = n;
+                    return false;
                 }
+                """,
+                polling=400,
+                timeout=4000,
+            )
+        except Exception:
+            log.warn("本文ブロック数が安定しませんでした — 続行します")
+
+        # スクロールして遅延読み込みコンテンツをトリガー。
+        # Medium の本文はほぼ SSR 済みなので、十分な本文ブロックが既にあれば省略する。
+        # ブロック数の確認とスクロールは 1 回の evaluate で済ませる
+        scroll_result = await page.evaluate("""
+            async (threshold) => {
+                const count = () =>
+                    document.querySelectorAll('article p, article h2').length;
+                const before = count();
+                if (before >= threshold) return { blocks: before, scrolled: false };
+                // 遅延読み込みは IntersectionObserver 駆動なので、本文末尾を 1 度
+                // ビューポートに入れれば発火する（画面ごとに刻んでスクロールしない）
+                const last = document.querySelector('article')?.lastElementChild;
+                if (last) last.scrollIntoView({ block: 'end' });
+                else window.scrollTo(0, document.body.scrollHeight);
+                await new Promise(r => setTimeout(r, 400));
                 window.scrollTo(0, 0);
+                return { blocks: count(), scrolled: true };
             }
-        """)
-
-        # タイトル取得
-        title = await self._extract_title()
-
-        # 著者取得
-        author = await self._extract_author()
-
-        # 本文取得
-        content, is_preview = await self._extract_content()
+        """, LAZY_LOAD_BLOCK_THRESHOLD)
+        if not scroll_result.get("scrolled"):
+            log.step(f"本文は描画済み（{scroll_result.get('blocks')} ブロック）— スクロールを省略")
+
+        # タイトル・著者・ペイウォール判定は、遅延描画が落ち着いた後の DOM から
+        # 1 回の evaluate でまとめて取り直す（後から描画されるペイウォール表示も拾う）。
+        # 本文抽出とは独立した読み取りなので並行に投げる
+        page_meta, (content, is_preview_body) = await asyncio.gather(
+            self._collect_page_meta(page),
+            self._extract_content(page),
+        )
+        title = page_meta.get("title") or "Untitled"
+        author = page_meta.get("author") or ""
+        is_preview = is_preview_body or self._check_paywall(page_meta)
 
         if not content:
             raise RuntimeError(
@@ -369,218 +1224,53 @@ class BrowserClient:
         """素早くログイン状態を確認（タイムアウト付き）"""
         if not self.session_path.exists():
             return False
+        if self._login_verified:
+            return True
         try:
-            await self._page.goto("https://medium.com", timeout=15000)
-            await self._page.wait_for_load_state("networkidle", timeout=10000)
-            for selector in LOGIN_SELECTORS[:2]:
-                try:
-                    await self._page.wait_for_selector(selector, timeout=2000)
-                    return True
-                except Exception:
-                    continue
+            await self._page.goto(
+                "https://medium.com", wait_until="domcontentloaded", timeout=15000
+            )
         except Exception:
             log.warn("ログイン状態の確認がタイムアウトしました")
-        return False
+            return False
+        try:
+            await self._page.wait_for_selector(
+                ", ".join(LOGIN_SELECTORS[:2]), timeout=4000
+            )
+            self._login_verified = True
+            return True
+        except Exception:
+            return False
 
-    async def _extract_title(self) -> str:
-        """記事タイトルを抽出"""
-        selectors = [
-            "article h1",
-            "h1[data-testid='storyTitle']",
-            ".graf--title",
-            "h1",
-        ]
-        for selector in selectors:
-            try:
-                el = await self._page.wait_for_selector(selector, timeout=2000)
-                if el:
-                    text = await el.text_content()
-                    if text and text.strip():
-                        return text.strip()
-            except Exception:
-                continue
-        return "Untitled"
-
-    async def _extract_author(self) -> str:
-        """記事の著者を抽出"""
-        selectors = [
-            "[data-testid='authorName']",
-            "a[rel='author']",
-            ".pw-author-name",
-        ]
-        for selector in selectors:
-            try:
-                el = await self._page.wait_for_selector(selector, timeout=2000)
-                if el:
-                    text = await el.text_content()
-                    if text and text.strip():
-                        return text.strip()
-            except Exception:
-                continue
-        return ""
+    async def _collect_page_meta(self, page: Page) -> dict:
+        """タイトル・著者・ペイウォール・404 判定を 1 回の evaluate でまとめて取得する。
 
-    async def _extract_content(self) -> tuple[str, bool]:
-        """
-        記事本文を抽出。DOM を走査してマークダウン形式に変換する。
-        戻り値: (マークダウンテキスト, プレビューのみかどうか)
+        個別に問い合わせると CDP の往復がその分だけ発生するため、DOM を 1 度だけ
+        読み、タイトル・著者の取得と _check_paywall はこの結果を参照する。
         """
-        # JavaScript で DOM を走査し、マークダウン形式で抽出
-        extract_js = """
-        (containerSelectors) => {
-            // コンテナを探す
-            let container = null;
-            for (const sel of containerSelectors) {
-                container = document.querySelector(sel);
-                if (container) break;
-            }
-            if (!container) return { markdown: '', selector: '', debug: 'No container found' };
-
-            const usedSelector = containerSelectors.find(s => document.querySelector(s));
-
-            // 抽出対象の要素を再帰的に走査
-            const lines = [];
-            const seen = new Set();
-
-            function processNode(node) {
-                if (!node) return;
-
-                // テキストノード
-                if (node.nodeType === 3) {
-                    const text = node.textContent?.trim();
-                    if (text) lines.push({ type: 'text', content: text });
-                    return;
-                }
-
-                if (node.nodeType !== 1) return;  // Element ノード以外スキップ
-
-                const tag = node.tagName?.toLowerCase();
-                const text = node.textContent?.trim() || '';
-
-                // ナビゲーション、ボタン、フッターなどスキップ
-                if (['nav', 'footer', 'header', 'button', 'aside', 'script',
-                     'style', 'noscript', 'iframe', 'svg'].includes(tag)) return;
-
-                // data-testid で非コンテンツ要素をスキップ
-                const testId = node.getAttribute('data-testid') || '';
-                if (['headerNav', 'postMetaLockup', 'storyFooter',
-                     'publicationHeader'].includes(testId)) return;
-
-                // 重複防止
-                const key = tag + ':' + text.substring(0, 80);
-                if (seen.has(key) && text.length < 200) return;
-                seen.add(key);
-
-                // 見出し
-                if (['h1', 'h2', 'h3', 'h4'].includes(tag) && text.length > 0) {
-                    const level = '#'.repeat(parseInt(tag[1]));
-                    lines.push({ type: 'heading', content: level + ' ' + text });
-                    return;
-                }
-
-                // コードブロック (pre > code)
-                if (tag === 'pre') {
-                    const code = node.querySelector('code');
-                    const codeText = code ? code.textContent : text;
-                    if (codeText?.trim()) {
-                        lines.push({ type: 'code', content: '```\\n' + codeText.trim() + '\\n```' });
-                    }
-                    return;
-                }
-
-                // インラインコード
-                if (tag === 'code' && node.parentElement?.tagName?.toLowerCase() !== 'pre') {
-                    // インラインコードは親要素の処理に含まれる
-                    return;
-                }
-
-                // ブロック引用
-                if (tag === 'blockquote') {
-                    if (text) {
-                        const quoted = text.split('\\n').map(l => '> ' + l.trim()).join('\\n');
-                        lines.push({ type: 'blockquote', content: quoted });
-                    }
-                    return;
-                }
-
-                // リスト
-                if (tag === 'ul' || tag === 'ol') {
-                    const items = node.querySelectorAll(':scope > li');
-                    items.forEach((li, i) => {
-                        const prefix = tag === 'ol' ? (i + 1) + '. ' : '- ';
-                        const liText = li.textContent?.trim();
-                        if (liText) {
-                            lines.push({ type: 'list', content: prefix + liText });
-                        }
-                    });
-                    return;
-                }
-
-                // 画像（alt テキスト / figcaption）
-                if (tag === 'figure') {
-                    const img = node.querySelector('img');
-                    const caption = node.querySelector('figcaption');
-                    const alt = img?.getAttribute('alt') || '';
-                    const capText = caption?.textContent?.trim() || '';
-                    if (alt || capText) {
-                        lines.push({ type: 'image', content: '[画像: ' + (capText || alt) + ']' });
-                    }
-                    return;
-                }
-
-                // 段落
-                if (tag === 'p') {
-                    if (text && text.length > 5) {
-                        // インラインコードを `` で囲む
-                        let md = '';
-                        node.childNodes.forEach(child => {
-                            if (child.nodeType === 3) {
-                                md += child.textContent;
-                            } else if (child.tagName?.toLowerCase() === 'code') {
-                                md += '`' + child.textContent + '`';
-                            } else if (child.tagName?.toLowerCase() === 'strong' ||
-                                       child.tagName?.toLowerCase() === 'b') {
-                                md += '**' + child.textContent + '**';
-                            } else if (child.tagName?.toLowerCase() === 'em' ||
-                                       child.tagName?.toLowerCase() === 'i') {
-                                md += '*' + child.textContent + '*';
-                            } else if (child.tagName?.toLowerCase() === 'a') {
-                                const href = child.getAttribute('href') || '';
-                                md += '[' + child.textContent + '](' + href + ')';
-                            } else {
-                                md += child.textContent || '';
-                            }
-                        });
-                        lines.push({ type: 'paragraph', content: md.trim() });
-                    }
-                    return;
-                }
-
-                // div / section: 再帰的に子要素を処理
-                if (['div', 'section', 'main', 'article', 'span'].includes(tag)) {
-                    node.childNodes.forEach(child => processNode(child));
-                    return;
-                }
-            }
-
-            processNode(container);
-
-            // マークダウンに変換
-            const markdown = lines
-                .filter(l => l.content.trim().length > 0)
-                .map(l => l.content)
-                .join('\\n\\n');
+        return await page.evaluate(
+            "(args) => window.__mnCollectPageMeta(args)",
+            [TITLE_SELECTORS, AUTHOR_SELECTORS, PAYWALL_INDICATORS],
+        )
 
-            return {
-                markdown: markdown,
-                selector: usedSelector || 'none',
-                lineCount: lines.length,
-                debug: 'OK'
-            };
-        }
+    async def _extract_content(self, page: Page) -> tuple[str, bool]:
+        """
+        記事本文を抽出。ページ HTML を trafilatura でマークダウン化し、
+        取れなければ DOM を JS で走査してマークダウン形式に変換する。
+        戻り値: (マークダウンテキスト, フォールバック抽出でプレビュー扱いにしたかどうか)
+        ペイウォール判定は呼び出し側で _check_paywall() により行う。
         """
+        # trafilatura（lxml ベース）で本文抽出。CPU 処理なのでスレッドに逃がす
+        html = await page.content()
+        markdown = await asyncio.to_thread(_extract_markdown_from_html, html)
+        if markdown:
+            log.step(f"trafilatura で本文を抽出（{len(markdown)}文字）")
+            return markdown, False
 
-        result = await self._page.evaluate(
-            extract_js,
+        # JavaScript で DOM を走査し、マークダウン形式で抽出
+        # （抽出関数は _PAGE_INIT_SCRIPT でページに登録済みなので名前だけ送る）
+        result = await page.evaluate(
+            "(sels) => window.__mnExtractMarkdown(sels)",
             ARTICLE_CONTAINER_SELECTORS,
         )
 
@@ -588,62 +1278,48 @@ class BrowserClient:
             # デバッグ情報を出力
             log.warn(f"コンテンツ抽出失敗 — debug: {result.get('debug', 'N/A')}")
             # ページのHTMLの一部をログに出力してデバッグ
-            debug_info = await self._page.evaluate("""
-                () => {
-                    const body = document.body;
-                    const tags = {};
-                    body.querySelectorAll('*').forEach(el => {
-                        const tag = el.tagName.toLowerCase();
-                        tags[tag] = (tags[tag] || 0) + 1;
-                    });
-                    // 上位10タグを返す
-                    const sorted = Object.entries(tags)
-                        .sort((a, b) => b[1] - a[1])
-                        .slice(0, 15);
-                    return {
-                        url: window.location.href,
-                        title: document.title,
-                        topTags: sorted,
-                        articleExists: !!document.querySelector('article'),
-                        mainExists: !!document.querySelector('main'),
-                        bodyTextLen: body.textContent?.length || 0,
-                    };
-                }
-            """)
-            log.warn(f"ページ情報: URL={debug_info.get('url')}, title={debug_info.get('title')}")
-            log.warn(f"  article要素: {debug_info.get('articleExists')}, main要素: {debug_info.get('mainExists')}")
-            log.warn(f"  bodyテキスト長: {debug_info.get('bodyTextLen')}")
-            log.warn(f"  上位タグ: {debug_info.get('topTags')}")
-
-            # フォールバック: body 全体からテキスト抽出を試みる
-            fallback_text = await self._page.evaluate("""
-                () => {
-                    const walker = document.createTreeWalker(
-                        document.body,
-                        NodeFilter.SHOW_TEXT,
-                        { acceptNode: (node) => {
-                            const parent = node.parentElement;
-                            if (!parent) return NodeFilter.FILTER_REJECT;
-                            const tag = parent.tagName.toLowerCase();
-                            if (['script','style','nav','footer','button','noscript'].includes(tag))
-                                return NodeFilter.FILTER_REJECT;
-                            return NodeFilter.FILTER_ACCEPT;
-                        }}
-                    );
-                    const texts = [];
-                    let node;
-                    while (node = walker.nextNode()) {
-                        const t = node.textContent?.trim();
-                        if (t && t.length > 10) texts.push(t);
+            # 全要素を走査するため、DEBUG レベルのときだけ実行する
+            if not log.is_debug_enabled():
+                log.warn("  ページ構造の詳細は LOG_LEVEL=DEBUG で確認できます")
+            else:
+                debug_info = await page.evaluate("""
+                    () => {
+                        const body = document.body;
+                        const tags = {};
+                        body.querySelectorAll('*').forEach(el => {
+                            const tag = el.tagName.toLowerCase();
+                            tags[tag] = (tags[tag] || 0) + 1;
+                        });
+                        // 上位15タグを返す（全件ソートせず、15 件の降順配列に挿入していく）
+                        const top = [];
+                        for (const entry of Object.entries(tags)) {
+                            if (top.length === 15 && entry[1] <= top[14][1]) continue;
+                            let i = top.length;
+                            while (i > 0 && top[i - 1][1] < entry[1]) i--;
+                            top.splice(i, 0, entry);
+                            if (top.length > 15) top.pop();
+                        }
+                        return {
+                            url: window.location.href,
+                            title: document.title,
+                            topTags: top,
+                            articleExists: !!document.querySelector('article'),
+                            mainExists: !!document.querySelector('main'),
+                            bodyTextLen: body.textContent?.length || 0,
+                        };
                     }
-                    return texts.join('\\n\\n');
-                }
-            """)
+                """)
+                log.warn(f"ページ情報: URL={debug_info.get('url')}, title={debug_info.get('title')}")
+                log.warn(f"  article要素: {debug_info.get('articleExists')}, main要素: {debug_info.get('mainExists')}")
+                log.warn(f"  bodyテキスト長: {debug_info.get('bodyTextLen')}")
+                log.warn(f"  上位タグ: {debug_info.get('topTags')}")
+
+            # フォールバック: body 全体からテキスト抽出を試みる（取得済み HTML を lxml で解析）
+            fallback_text = await asyncio.to_thread(_extract_fallback_text, html)
 
             if fallback_text and len(fallback_text) > 200:
                 log.warn(f"フォールバック抽出を使用（{len(fallback_text)}文字）")
-                is_preview = await self._check_paywall()
-                return fallback_text[:15000], True
+                return fallback_text, True
 
             return "", False
 
@@ -652,18 +1328,15 @@ class BrowserClient:
             f"セレクタ「{result.get('selector')}」で {result.get('lineCount', 0)} ブロックを抽出"
             f"（{len(content)}文字）"
         )
-        is_preview = await self._check_paywall()
-        return content, is_preview
+        return content, False
 
-    async def _check_paywall(self) -> bool:
+    @staticmethod
+    def _check_paywall(page_meta: dict) -> bool:
         """ペイウォールが表示されているか確認"""
-        page_text = await self._page.evaluate(
-            "document.body.textContent?.toLowerCase() || ''"
-        )
-        for indicator in PAYWALL_INDICATORS:
-            if indicator in page_text:
-                log.warn(f"ペイウォール検出: {indicator}")
-                return True
+        indicator = page_meta.get("paywallHit")
+        if indicator:
+            log.warn(f"ペイウォール検出: {indicator}")
+            return True
         return False
 
     async def _save_session(self) -> None:
@@ -671,8 +1344,9 @@ class BrowserClient:
         if not self._context:
             return
         try:
-            state = await self._context.storage_state()
-            self.session_path.write_text(json.dumps(state, indent=2))
+            # Playwright に直接書き出させ、戻り値をメモリ上のコピーとして持っておく
+            self._storage_state = await self._context.storage_state(path=str(self.session_path))
+            self._storage_state_loaded = True
             log.step("セッションを保存しました")
         except Exception as e:
             log.warn(f"セッション保存に失敗: {e}")
@@ -725,8 +1399,7 @@ class BrowserClient:
                        "Reading list" の場合は直接 URL でアクセス。
                        それ以外のカスタムリストの場合はライブラリページから探す。
         """
-        if not self._page:
-            raise RuntimeError("ブラウザが初期化されていません")
+        await self._ensure_browser()
 
         # セッション必須チェック
         if not self.session_path.exists():
@@ -773,27 +1446,15 @@ class BrowserClient:
                 "  → `medium-notion login` で再ログインしてください。"
             )
 
-        try:
-            await self._page.wait_for_load_state("networkidle", timeout=15000)
-        except Exception:
-            log.warn("networkidle タイムアウト — 読み込み完了前に続行します")
-
         # Cloudflare チャレンジを検出したら通過するまで待つ
         # JS チャレンジは通常 5〜10 秒で完了するので、最大 30 秒見る
         await self._wait_past_cloudflare(timeout_ms=30_000)
+        await self._wait_for_list_content()
 
-        # ページ検証: ログイン済みか
-        page_check = await self._page.evaluate("""
-            () => {
-                const url = window.location.href;
-                return {
-                    finalUrl: url,
-                    isLoginPage: url.includes('/signin') || url.includes('/login'),
-                };
-            }
-        """)
-
-        if page_check.get("isLoginPage"):
+        # ページ検証: ログイン済みか（現在の URL は page.url で取れるので evaluate しない）
+        final_url = self._page.url
+        if "/signin" in final_url or "/login" in final_url:
+            self._login_verified = False
             raise RuntimeError(
                 "ログインページにリダイレクトされました。セッションが期限切れです。\n"
                 "  → `medium-notion login` で再ログインしてください。"
@@ -804,7 +1465,7 @@ class BrowserClient:
             await self._navigate_to_custom_list(list_name)
             # ライブラリ経由で見つけた URL を次回以降のためキャッシュに保存
             try:
-                discovered_url = await self._page.evaluate("window.location.href")
+                discovered_url = self._page.url
                 if discovered_url and "/list/" in discovered_url:
                     _save_list_url(
                         self.list_url_cache_path, list_name, discovered_url
@@ -824,132 +1485,56 @@ class BrowserClient:
         if self.config.headless:
             log.step("ヘッドレスではスクロールを省略（Cloudflare 回避）")
         else:
-            # GUI モードのみ従来どおりスクロールで lazy-load を吸収
-            prev_height = 0
+            # GUI モードのみ従来どおりスクロールで lazy-load を吸収。
+            # 固定待機ではなく、新しいリンクが追加された時点（上限 1.5 秒）で次へ進む
             scroll_attempts = 0
             max_scroll_attempts = 50
             while scroll_attempts < max_scroll_attempts:
-                current_height = await self._page.evaluate(
-                    "document.body.scrollHeight"
-                )
-                if current_height == prev_height:
-                    break
-                prev_height = current_height
-                await self._page.evaluate(
-                    "window.scrollTo(0, document.body.scrollHeight)"
-                )
-                await self._page.wait_for_timeout(1500)
+                grew = await self._page.evaluate(_SCROLL_AND_WAIT_FOR_LINKS_JS, 1500)
                 scroll_attempts += 1
+                if not grew:
+                    break
             if scroll_attempts > 0:
                 log.step(f"スクロール完了（{scroll_attempts} 回）")
 
         # ページトップに戻る
         await self._page.evaluate("window.scrollTo(0, 0)")
 
-        # JavaScript で DOM から記事 URL を抽出
-        urls = await self._page.evaluate("""
-            () => {
-                const links = [...document.querySelectorAll('a[href]')]
-                    .map(a => {
-                        try {
-                            const url = new URL(a.href);
-                            // クエリパラメータとフラグメントを除去
-                            return url.origin + url.pathname;
-                        } catch {
-                            return null;
-                        }
-                    })
-                    .filter(href => {
-                        if (!href) return false;
-                        try {
-                            const url = new URL(href);
-                            // Medium ドメインのみ
-                            if (url.hostname !== 'medium.com'
-                                && !url.hostname.endsWith('.medium.com')) return false;
-                            const path = url.pathname;
-                            // 明らかに記事でないパスを除外
-                            if (path === '/' || path === '/me' || path.startsWith('/me/')
-                                || path.startsWith('/m/') || path === '/new-story'
-                                || path.startsWith('/plans') || path.startsWith('/membership')
-                                || path.startsWith('/tag/') || path.startsWith('/search')
-                                || path.startsWith('/creators')
-                                || path.includes('/list/')
-                                || path.includes('/sitemap')
-                                || path.includes('/about')) return false;
-                            // /@user/article-slug-hash 形式
-                            if (/^\\/@[^/]+\\/[^/]+-[a-f0-9]{8,}/.test(path)) return true;
-                            // /publication/article-slug-hash 形式
-                            if (/^\\/[^@][^/]*\\/[^/]+-[a-f0-9]{8,}/.test(path)) return true;
-                            // /p/hash 形式（短縮URL）
-                            if (/^\\/p\\/[a-f0-9]+/.test(path)) return true;
-                            return false;
-                        } catch {
-                            return false;
-                        }
-                    });
-                return [...new Set(links)]; // 重複除去
-            }
-        """)
+        # JavaScript で DOM から記事 URL を抽出（_ARTICLE_LINKS_JS を登録済み）。
+        # リンクごとに URL を 1 回だけ解析し、厳密パターンと緩い条件の両方を 1 パスで判定する
+        found = await self._page.evaluate("() => window.__mnCollectArticleLinks()")
+        urls = found["strict"]
 
         if not urls:
             # フォールバック: より緩いフィルタリングで再試行
             log.warn("厳密なパターンで記事が見つかりません。緩い条件で再試行します...")
-            urls = await self._page.evaluate("""
-                () => {
-                    const links = [...document.querySelectorAll('a[href]')]
-                        .map(a => {
-                            try {
-                                const url = new URL(a.href);
-                                return url.origin + url.pathname;
-                            } catch {
-                                return null;
-                            }
-                        })
-                        .filter(href => {
-                            if (!href) return false;
-                            try {
-                                const url = new URL(href);
-                                if (url.hostname !== 'medium.com'
-                                    && !url.hostname.endsWith('.medium.com')) return false;
-                                const path = url.pathname;
-                                // 短いパスや明らかなナビリンクを除外
-                                if (path === '/' || path.split('/').length < 3) return false;
-                                if (path.startsWith('/me/') || path.startsWith('/m/')
-                                    || path.startsWith('/tag/') || path.startsWith('/search')
-                                    || path.startsWith('/plans') || path.startsWith('/membership')
-                                    || path === '/new-story'
-                                    || path.includes('/list/')
-                                    || path.includes('/sitemap')
-                                    || path.includes('/about')) return false;
-                                return true;
-                            } catch {
-                                return false;
-                            }
-                        });
-                    return [...new Set(links)];
-                }
-            """)
+            urls = found["loose"]
 
             if not urls:
-                # デバッグ情報を出力
-                debug_info = await self._page.evaluate("""
-                    () => {
-                        const allLinks = [...document.querySelectorAll('a[href]')]
-                            .map(a => a.href)
-                            .slice(0, 30);
-                        return {
-                            url: window.location.href,
-                            title: document.title,
-                            totalLinks: document.querySelectorAll('a[href]').length,
-                            sampleLinks: allLinks,
-                            bodyTextLen: document.body.textContent?.length || 0,
-                        };
-                    }
-                """)
-                log.warn(f"ページ情報: URL={debug_info.get('url')}")
-                log.warn(f"  title: {debug_info.get('title')}")
-                log.warn(f"  リンク総数: {debug_info.get('totalLinks')}")
-                log.warn(f"  サンプルリンク: {debug_info.get('sampleLinks', [])[:10]}")
+                # デバッグ情報を出力（全リンクを走査するため DEBUG レベルのときだけ）
+                if not log.is_debug_enabled():
+                    log.warn(
+                        f"記事リンクが見つかりません（URL: {self._page.url}）"
+                        " — 詳細は LOG_LEVEL=DEBUG で確認できます"
+                    )
+                else:
+                    debug_info = await self._page.evaluate("""
+                        () => {
+                            const links = document.querySelectorAll('a[href]');
+                            const allLinks = [...links].slice(0, 30).map(a => a.href);
+                            return {
+                                url: window.location.href,
+                                title: document.title,
+                                totalLinks: links.length,
+                                sampleLinks: allLinks,
+                                bodyTextLen: document.body.textContent?.length || 0,
+                            };
+                        }
+                    """)
+                    log.warn(f"ページ情報: URL={debug_info.get('url')}")
+                    log.warn(f"  title: {debug_info.get('title')}")
+                    log.warn(f"  リンク総数: {debug_info.get('totalLinks')}")
+                    log.warn(f"  サンプルリンク: {debug_info.get('sampleLinks', [])[:10]}")
 
         log.success(f"リスト「{list_name}」から {len(urls)} 件の記事 URL を取得しました")
 
@@ -965,69 +1550,19 @@ class BrowserClient:
         """ライブラリページからカスタムリストを探してクリック遷移する"""
         log.step(f"ライブラリからリスト「{list_name}」を検索中...")
 
-        # 方法1: ページ内の全 <a> タグから /list/ を含む href を探し、
-        #        その周辺テキストにリスト名が含まれるものを見つける
-        result = await self._page.evaluate("""
-            (targetName) => {
-                const targetLower = targetName.toLowerCase();
-
-                // 全リンクからリスト URL を収集
-                const listLinks = [...document.querySelectorAll('a[href]')]
-                    .filter(a => {
-                        const href = a.href || '';
-                        return href.includes('/list/');
-                    })
-                    .map(a => ({
-                        href: a.href,
-                        text: a.textContent?.trim() || '',
-                        // リスト名がリンク自体か、その親要素に含まれるか
-                        parentText: a.closest('div, section, article')?.textContent?.trim() || '',
-                    }));
-
-                // リスト名に完全一致するリンクを探す
-                for (const link of listLinks) {
-                    if (link.text === targetName
-                        || link.parentText.includes(targetName)) {
-                        // /list/reading-list は除外
-                        if (link.href.includes('/list/reading-list')) continue;
-                        return { found: true, href: link.href };
-                    }
-                }
-
-                // href にリスト名（小文字）を含むリンクを探す
-                for (const link of listLinks) {
-                    if (link.href.toLowerCase().includes(targetLower)) {
-                        return { found: true, href: link.href };
-                    }
-                }
-
-                // 利用可能なリスト名を収集（エラーメッセージ用）
-                const listNames = [];
-                const headings = document.querySelectorAll('h2, h3, h4');
-                headings.forEach(el => {
-                    const t = el.textContent?.trim();
-                    if (t && t.length > 0 && t.length < 100) listNames.push(t);
-                });
-                // リンクテキストからも収集
-                listLinks.forEach(link => {
-                    if (link.text && !listNames.includes(link.text)) {
-                        listNames.push(link.text);
-                    }
-                });
-
-                return {
-                    found: false,
-                    availableLists: listNames,
-                    debugLinks: listLinks.map(l => l.href).slice(0, 10),
-                };
-            }
-        """, list_name)
-
-        if not result.get("found"):
-            available = result.get("availableLists", [])
+        # /list/ を含むリンクと見出しを 1 回の evaluate で取得し、照合は Python 側で行う
+        # （収集関数は _PAGE_INIT_SCRIPT でページに登録済み）
+        page_lists = await self._page.evaluate("() => window.__mnCollectListLinks()")
+        links = page_lists.get("links", [])
+        href = _match_list_link(list_name, links)
+
+        if not href:
+            # 利用可能なリスト名を収集（エラーメッセージ用）
+            available = list(dict.fromkeys(
+                page_lists.get("headings", []) + [l["text"] for l in links if l["text"]]
+            ))
             available_str = "、".join(f"「{n}」" for n in available) if available else "（不明）"
-            debug_links = result.get("debugLinks", [])
-            log.warn(f"検出された /list/ リンク: {debug_links}")
+            log.warn(f"検出された /list/ リンク: {[l['href'] for l in links[:10]]}")
             raise RuntimeError(
                 f"リスト「{list_name}」が見つかりません。\n"
                 f"  利用可能なリスト: {available_str}\n"
@@ -1035,17 +1570,12 @@ class BrowserClient:
             )
 
         # 見つかった URL に直接遷移
-        href = result["href"]
         log.step(f"リスト「{list_name}」に遷移中: {href}")
         await self._page.goto(href, wait_until="domcontentloaded")
-
-        try:
-            await self._page.wait_for_load_state("networkidle", timeout=15000)
-        except Exception:
-            log.warn("networkidle タイムアウト — 続行します")
+        await self._wait_for_list_content()
 
         # 遷移後の URL を確認
-        current_url = await self._page.evaluate("window.location.href")
+        current_url = self._page.url
         log.step(f"遷移先: {current_url}")
 
         # 遷移確認: /list/ を含む URL に遷移できたか
@@ -1066,8 +1596,7 @@ class BrowserClient:
         Returns:
             (成功した URL リスト, 失敗した URL リスト)
         """
-        if not self._page:
-            raise RuntimeError("ブラウザが初期化されていません")
+        await self._ensure_browser()
 
         if not urls_to_remove:
             return [], []
@@ -1139,16 +1668,27 @@ class BrowserClient:
                     "https://medium.com/me/lists",
                     wait_until="domcontentloaded",
                 )
-                try:
-                    await self._page.wait_for_load_state("networkidle", timeout=15000)
-                except Exception:
-                    pass
+                await self._wait_for_list_content()
                 await self._navigate_to_custom_list(list_name)
+                # _navigate_to_custom_list() が遷移先の描画まで待つ
+                return
 
+        await self._wait_for_list_content()
+
+    async def _wait_for_list_content(self) -> None:
+        """リスト・ライブラリページの項目が描画されるまで待つ。
+
+        networkidle は広告・計測ビーコンで収束せず毎回タイムアウトまで待たされるため、
+        load を短く待ったうえで記事カード / リストリンクの出現で判定する。
+        """
         try:
-            await self._page.wait_for_load_state("networkidle", timeout=15000)
+            await self._page.wait_for_load_state("load", timeout=3000)
         except Exception:
             pass
+        try:
+            await self._page.wait_for_selector(LIST_CONTENT_SELECTOR, timeout=10000)
+        except Exception:
+            log.warn("リスト項目が見つかりません — 読み込み完了前に続行します")
 
     async def _scroll_to_load_all(self) -> None:
         """無限スクロールで全コンテンツを読み込む
@@ -1158,59 +1698,32 @@ class BrowserClient:
         """
         if self.config.headless:
             return
-        prev_height = 0
+        # 新しいリンクが追加されるかページが伸びる間だけスクロールを続ける（1 回の上限 1.5 秒）
         for _ in range(50):
-            current_height = await self._page.evaluate("document.body.scrollHeight")
-            if current_height == prev_height:
+            if not await self._page.evaluate(_SCROLL_AND_WAIT_FOR_LINKS_JS, 1500):
                 break
-            prev_height = current_height
-            await self._page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-            await self._page.wait_for_timeout(1500)
 
     async def _remove_single_article(self, url: str) -> bool:
         """リストページから1件の記事を削除する
 
         方式: ブックマークボタンをクリック → リストピッカーで対象リストのチェックを解除
         """
-        from urllib.parse import urlparse
         parsed = urlparse(url)
         url_path = parsed.path
 
         # Step 1: 記事リンクを見つけてカードをスクロール表示
         card_info = await self._page.evaluate("""
             (urlPath) => {
-                const links = [...document.querySelectorAll('a[href]')];
-                for (const link of links) {
-                    try {
-                        const linkUrl = new URL(link.href);
-                        if (linkUrl.pathname !== urlPath) continue;
-
-                        // 記事カードのコンテナを見つける
-                        let card = link;
-                        for (let i = 0; i < 15; i++) {
-                            if (!card.parentElement) break;
-                            card = card.parentElement;
-                            const hasMultipleLinks = card.querySelectorAll('a[href]').length >= 2;
-                            const hasButton = card.querySelector('button');
-                            if (hasMultipleLinks && hasButton
-                                && card.offsetHeight > 80
-                                && card.offsetHeight < 600) {
-                                break;
-                            }
-                        }
-
-                        // カードをビューポート中央にスクロール
-                        card.scrollIntoView({ behavior: 'instant', block: 'center' });
-
-                        const rect = card.getBoundingClientRect();
-                        return {
-                            found: true,
-                            x: Math.round(rect.x + rect.width / 2),
-                            y: Math.round(rect.y + rect.height / 2),
-                        };
-                    } catch {}
-                }
-                return { found: false };
+                const card = window.__mnFindArticleCard(urlPath);
+                if (!card) return { found: false };
+                // カードをビューポート中央にスクロール
+                card.scrollIntoView({ behavior: 'instant', block: 'center' });
+                const rect = card.getBoundingClientRect();
+                return {
+                    found: true,
+                    x: Math.round(rect.x + rect.width / 2),
+                    y: Math.round(rect.y + rect.height / 2),
+                };
             }
         """, url_path)
 
@@ -1221,63 +1734,23 @@ class BrowserClient:
         # Step 2: ブックマークボタンを見つけてクリック
         bookmark_btn = await self._page.evaluate("""
             (urlPath) => {
-                const links = [...document.querySelectorAll('a[href]')];
-                for (const link of links) {
-                    try {
-                        const linkUrl = new URL(link.href);
-                        if (linkUrl.pathname !== urlPath) continue;
-
-                        let card = link;
-                        for (let i = 0; i < 15; i++) {
-                            if (!card.parentElement) break;
-                            card = card.parentElement;
-                            const hasMultipleLinks = card.querySelectorAll('a[href]').length >= 2;
-                            const hasButton = card.querySelector('button');
-                            if (hasMultipleLinks && hasButton
-                                && card.offsetHeight > 80
-                                && card.offsetHeight < 600) {
-                                break;
-                            }
-                        }
-
-                        const buttons = [...card.querySelectorAll('button')];
-                        for (const btn of buttons) {
-                            const label = (btn.getAttribute('aria-label') || '').toLowerCase();
-                            if (label.includes('bookmark') || label.includes('save')
-                                || label.includes('list')) {
-                                // 座標取得前にボタン自体もビューポート内に入れる
-                                btn.scrollIntoView({ behavior: 'instant', block: 'center' });
-                                const rect = btn.getBoundingClientRect();
-                                return {
-                                    found: true,
-                                    x: Math.round(rect.x + rect.width / 2),
-                                    y: Math.round(rect.y + rect.height / 2),
-                                    label: label,
-                                };
-                            }
-                        }
-                        // aria-label なしでも SVG を含む小さいボタンを試す
-                        for (const btn of buttons) {
-                            const hasSvg = btn.querySelector('svg');
-                            const rect = btn.getBoundingClientRect();
-                            if (hasSvg && rect.width > 0 && rect.width < 60
-                                && rect.height > 0 && rect.height < 60) {
-                                btn.scrollIntoView({ behavior: 'instant', block: 'center' });
-                                const r2 = btn.getBoundingClientRect();
-                                return {
-                                    found: true,
-                                    x: Math.round(r2.x + r2.width / 2),
-                                    y: Math.round(r2.y + r2.height / 2),
-                                    label: btn.getAttribute('aria-label') || '(svg-button)',
-                                };
-                            }
-                        }
-                        return { found: false, debug: buttons.map(b =>
-                            b.getAttribute('aria-label') || b.textContent?.trim()?.substring(0, 20) || '?'
-                        ) };
-                    } catch {}
+                const card = window.__mnFindArticleCard(urlPath);
+                if (!card) return { found: false };
+                const btn = window.__mnFindBookmarkButton(card);
+                if (!btn) {
+                    return { found: false, debug: [...card.querySelectorAll('button')].map(b =>
+                        b.getAttribute('aria-label') || b.textContent?.trim()?.substring(0, 20) || '?'
+                    ) };
                 }
-                return { found: false };
+                // 座標取得前にボタン自体もビューポート内に入れる
+                btn.scrollIntoView({ behavior: 'instant', block: 'center' });
+                const rect = btn.getBoundingClientRect();
+                return {
+                    found: true,
+                    x: Math.round(rect.x + rect.width / 2),
+                    y: Math.round(rect.y + rect.height / 2),
+                    label: btn.getAttribute('aria-label') || '(svg-button)',
+                };
             }
         """, url_path)
 
@@ -1295,38 +1768,8 @@ class BrowserClient:
             handle = await self._page.evaluate_handle(
                 """
                 (urlPath) => {
-                    const links = [...document.querySelectorAll('a[href]')];
-                    for (const link of links) {
-                        try {
-                            const linkUrl = new URL(link.href);
-                            if (linkUrl.pathname !== urlPath) continue;
-                            let card = link;
-                            for (let i = 0; i < 15; i++) {
-                                if (!card.parentElement) break;
-                                card = card.parentElement;
-                                const hasMultipleLinks =
-                                    card.querySelectorAll('a[href]').length >= 2;
-                                const hasButton = card.querySelector('button');
-                                if (hasMultipleLinks && hasButton
-                                    && card.offsetHeight > 80
-                                    && card.offsetHeight < 600) break;
-                            }
-                            const buttons = [...card.querySelectorAll('button')];
-                            const labelMatch = buttons.find(b => {
-                                const lbl = (b.getAttribute('aria-label') || '').toLowerCase();
-                                return lbl.includes('bookmark') || lbl.includes('save')
-                                    || lbl.includes('list');
-                            });
-                            const svgMatch = buttons.find(b => {
-                                const r = b.getBoundingClientRect();
-                                return b.querySelector('svg')
-                                    && r.width > 0 && r.width < 60
-                                    && r.height > 0 && r.height < 60;
-                            });
-                            return labelMatch || svgMatch || null;
-                        } catch {}
-                    }
-                    return null;
+                    const card = window.__mnFindArticleCard(urlPath);
+                    return card ? window.__mnFindBookmarkButton(card) : null;
                 }
                 """,
                 url_path,
@@ -1353,165 +1796,9 @@ class BrowserClient:
         await self._page.wait_for_timeout(wait_ms)
 
         # Step 3: リストピッカー内でチェック済みの対象リストをクリックしてトグル OFF
-        toggled = await self._page.evaluate("""
-            (listName) => {
-                const targetLower = listName.toLowerCase();
-
-                // 「リスト名と完全一致するテキストの可視要素」を popover 内で探す。
-                // 注意: 「リストページにいるとき」はページの H1 等にも同じテキストが
-                // 存在するため、単純な textContent 一致だと H1 をクリックしてしまい
-                // 削除されない。popover らしさ (positioned ancestor + 小サイズ + 非見出し)
-                // をフィルタとして付ける。
-                const isHeadingTag = (el) => {
-                    const t = (el.tagName || '').toLowerCase();
-                    return t === 'h1' || t === 'h2' || t === 'h3' || t === 'h4';
-                };
-                const hasPositionedAncestor = (el) => {
-                    let cur = el.parentElement;
-                    let depth = 0;
-                    while (cur && depth < 20) {
-                        const s = window.getComputedStyle(cur);
-                        if (s.position === 'fixed' || s.position === 'absolute') {
-                            const z = parseInt(s.zIndex) || 0;
-                            // popover は通常それなり以上の stacking context を持つ
-                            if (z >= 1 || s.position === 'fixed') return true;
-                        }
-                        cur = cur.parentElement;
-                        depth += 1;
-                    }
-                    return false;
-                };
-
-                // 候補を集めてスコアを付ける（popover エントリらしさ）
-                const candidates = [];
-                const allEls = [...document.querySelectorAll('div, li, label, span, button')];
-                for (const el of allEls) {
-                    const t = (el.textContent || '').trim();
-                    if (t !== listName && t.toLowerCase() !== targetLower) continue;
-                    if (!(el.offsetWidth > 0 && el.offsetHeight > 0)) continue;
-                    if (isHeadingTag(el)) continue;
-                    // 親に H1/H2/H3 があるなら除外（見出しの内側の span 等）
-                    if (el.closest && el.closest('h1,h2,h3,h4')) continue;
-                    const r = el.getBoundingClientRect();
-                    // popover エントリは小さい矩形 (高さ ~ 24-80 px、幅 ~ 100-500 px)
-                    if (r.height > 100 || r.width > 600) continue;
-                    if (!hasPositionedAncestor(el)) continue;
-                    candidates.push({ el, area: r.width * r.height });
-                }
-
-                // 最も小さい矩形 = popover の row 候補
-                candidates.sort((a, b) => a.area - b.area);
-                if (candidates.length > 0) {
-                    let row = candidates[0].el;
-                    // 4 階層上までクリック可能な行を探す
-                    for (let i = 0; i < 5; i++) {
-                        if (!row.parentElement) break;
-                        const r = row.getBoundingClientRect();
-                        if (r.height >= 24 && r.height <= 80
-                            && r.width >= 80 && r.width <= 500) break;
-                        row = row.parentElement;
-                    }
-                    row.click();
-                    return { clicked: true, via: 'popover-scoped', text: candidates[0].el.textContent?.trim() };
-                }
-
-                // 従来ロジック: オーバーレイから探す（後方互換）
-                const overlays = [...document.querySelectorAll('*')].filter(el => {
-                    const style = window.getComputedStyle(el);
-                    const zIndex = parseInt(style.zIndex) || 0;
-                    const pos = style.position;
-                    const rect = el.getBoundingClientRect();
-                    return (zIndex > 10 || pos === 'fixed' || pos === 'absolute')
-                        && rect.width > 100 && rect.width < 500
-                        && rect.height > 50 && rect.height < 600
-                        && rect.top >= 0 && rect.top < window.innerHeight;
-                });
-
-                for (const overlay of overlays) {
-                    const overlayText = (overlay.textContent || '').toLowerCase();
-                    if (!overlayText.includes(targetLower)) continue;
-
-                    // オーバーレイ内のすべての要素をフラットに取得
-                    const allChildren = [...overlay.querySelectorAll('*')];
-
-                    // 方法1: チェックボックスを探す
-                    for (const el of allChildren) {
-                        if (el.tagName.toLowerCase() === 'input'
-                            && el.type === 'checkbox') {
-                            const parent = el.closest('div, label, li');
-                            if (parent) {
-                                const pText = (parent.textContent || '').toLowerCase();
-                                if (pText.includes(targetLower)) {
-                                    el.click();
-                                    return { clicked: true, via: 'checkbox', text: pText.trim() };
-                                }
-                            }
-                        }
-                    }
-
-                    // 方法2: リスト名テキストに完全一致する要素の行をクリック
-                    for (const el of allChildren) {
-                        const text = (el.textContent || '').trim();
-                        const elLower = text.toLowerCase();
-                        if (elLower === targetLower || text === listName) {
-                            const row = el.closest('div, li, label')
-                                || el.parentElement;
-                            if (row) {
-                                row.click();
-                                return { clicked: true, via: 'text-row', text: text };
-                            }
-                            el.click();
-                            return { clicked: true, via: 'text-direct', text: text };
-                        }
-                    }
-
-                    // 方法3: リスト名で始まるリーフ要素をクリック
-                    for (const el of allChildren) {
-                        const text = (el.textContent || '').trim();
-                        const elLower = text.toLowerCase();
-                        if (elLower.startsWith(targetLower) && text.length < 30
-                            && el.children.length === 0) {
-                            const row = el.closest('div[role], li, label')
-                                || el.parentElement;
-                            if (row) {
-                                row.click();
-                                return { clicked: true, via: 'leaf-row', text: text };
-                            }
-                        }
-                    }
-
-                    // 方法4: "Locked" 等が付いたリスト名を含む要素を探す
-                    for (const el of allChildren) {
-                        const text = (el.textContent || '').trim();
-                        const elLower = text.toLowerCase();
-                        if (elLower.includes(targetLower) && text.length < 50) {
-                            // リスト行を見つける: クリック可能な親を探す
-                            const clickable = el.closest(
-                                'div[role="option"], div[role="button"], li, label'
-                            ) || el.closest('div');
-                            if (clickable && clickable.offsetHeight > 20
-                                && clickable.offsetHeight < 100) {
-                                clickable.click();
-                                return { clicked: true, via: 'contains-match', text: text };
-                            }
-                        }
-                    }
-
-                    // デバッグ: オーバーレイの中身を出力
-                    const debugTexts = allChildren
-                        .map(el => {
-                            const t = el.textContent?.trim();
-                            const tag = el.tagName?.toLowerCase();
-                            return t && t.length < 50 && t.length > 0
-                                ? tag + ':' + t : null;
-                        })
-                        .filter(Boolean);
-                    const unique = [...new Set(debugTexts)];
-                    return { clicked: false, debug: unique.slice(0, 20) };
-                }
-                return { clicked: false, debug: ['no overlay with list name found'] };
-            }
-        """, self._current_list_name)
+        toggled = await self._page.evaluate(
+            "(listName) => window.__mnToggleListInPicker(listName)", self._current_list_name
+        )
 
         if not toggled.get("clicked"):
             await self._page.keyboard.press("Escape")
@@ -1529,10 +1816,29 @@ class BrowserClient:
         await self._page.wait_for_timeout(1000)
         return True
 
+    async def reset_page(self) -> None:
+        """現在のページだけを閉じて開き直す（コンテキストとログイン状態は保持する）"""
+        if not self._context:
+            return
+        if self._page:
+            try:
+                await self._page.close()
+            except Exception:
+                pass
+        self._page = await self._context.new_page()
+
     async def close(self) -> None:
         """ブラウザを閉じる"""
+        global _shared_client
         if self._browser:
             await self._browser.close()
             self._browser = None
             self._context = None
             self._page = None
+        # 再起動（遅延起動・デーモン）のたびにドライバプロセスが残らないよう止める
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+        self._launch_task = None
+        if _shared_client is self:
+            _shared_client = None
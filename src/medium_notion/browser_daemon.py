@@ -0,0 +1,107 @@
+"""ブラウザ常駐デーモン — 起動済みの BrowserClient を Unix ソケット経由で共有する
+
+`medium-notion serve` でブラウザを 1 つ起動したまま待機し、`translate` は
+まずこのソケットに記事取得を依頼する。デーモンが居なければ従来どおり
+自前でブラウザを起動する（Chromium の起動コストを毎回払わないための経路）。
+
+プロトコルは 1 行 1 JSON:
+  リクエスト: {"url": "..."}
+  レスポンス: {"ok": true, "article": {...}} / {"ok": false, "error": "..."}
+"""
+
+import asyncio
+import json
+from dataclasses import asdict, fields
+from pathlib import Path
+
+from .browser import BrowserClient
+from .config import Config
+from .models import MediumArticle
+from . import logger as log
+
+# 既定のソケットパス
+DEFAULT_SOCKET_PATH = Path.home() / ".medium-notion.sock"
+
+# デーモンへの接続・応答待ちのタイムアウト（秒）。記事取得はブラウザ操作込みなので長め。
+# デーモンは 1 件ずつ処理するため、応答待ちには他クライアントの取得待ち（順番待ち）も含まれる
+_CONNECT_TIMEOUT = 1.0
+_RESPONSE_TIMEOUT = 120.0
+
+
+async def serve(config: Config, socket_path: Path = DEFAULT_SOCKET_PATH) -> None:
+    """ブラウザを保持したまま記事取得リクエストを待ち受ける（Ctrl+C まで）"""
+    browser = BrowserClient.shared(config)
+    # ページは 1 枚なので、リクエストは 1 件ずつ処理する
+    lock = asyncio.Lock()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = json.loads(await reader.readline())
+            url = request["url"]
+            async with lock:
+                try:
+                    article = await browser.fetch_article(url)
+                    response = {"ok": True, "article": asdict(article)}
+                except Exception as e:
+                    log.warn(f"記事取得に失敗: {url}: {e}")
+                    response = {"ok": False, "error": str(e)}
+                    # 失敗したページの状態を次のリクエストに持ち越さない
+                    await browser.reset_page()
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            response = {"ok": False, "error": f"不正なリクエスト: {e}"}
+        writer.write(json.dumps(response, ensure_ascii=False).encode() + b"\n")
+        await writer.drain()
+        writer.close()
+
+    socket_path.unlink(missing_ok=True)
+    server = await asyncio.start_unix_server(handle, path=str(socket_path))
+    log.success(f"ブラウザデーモンを起動しました: {socket_path}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        socket_path.unlink(missing_ok=True)
+        await browser.close()
+
+
+async def fetch_via_daemon(
+    url: str, socket_path: Path = DEFAULT_SOCKET_PATH
+) -> MediumArticle | None:
+    """デーモン経由で記事を取得する。
+
+    デーモンが起動していない・応答が途切れた・時間内に応答しない（順番待ちを含む）・
+    応答が壊れている場合は None を返し、呼び出し側は自前のブラウザで取得する。
+    デーモンが取得に失敗したと応答した場合は RuntimeError を送出する。
+    """
+    if not socket_path.exists():
+        return None
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_unix_connection(str(socket_path)), _CONNECT_TIMEOUT
+        )
+    except (OSError, asyncio.TimeoutError):
+        log.step("ブラウザデーモンに接続できません。ブラウザを起動して取得します")
+        return None
+
+    try:
+        writer.write(json.dumps({"url": url}).encode() + b"\n")
+        await writer.drain()
+        line = await asyncio.wait_for(reader.readline(), _RESPONSE_TIMEOUT)
+        response = json.loads(line) if line else None
+    except (OSError, asyncio.TimeoutError, json.JSONDecodeError) as e:
+        log.warn(f"ブラウザデーモンとの通信に失敗しました。ブラウザを起動して取得します: {e!r}")
+        return None
+    finally:
+        writer.close()
+
+    if not isinstance(response, dict):
+        log.warn("ブラウザデーモンから応答がありませんでした。ブラウザを起動して取得します")
+        return None
+    if not response.get("ok"):
+        raise RuntimeError(response.get("error") or "ブラウザデーモンでの記事取得に失敗しました")
+    log.step("ブラウザデーモン経由で記事を取得しました")
+    # キャッシュ用の内部フィールド（init=False）はコンストラクタに渡さない
+    data = response["article"]
+    return MediumArticle(**{
+        f.name: data[f.name] for f in fields(MediumArticle) if f.init and f.name in data
+    })
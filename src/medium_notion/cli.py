@@ -1,25 +1,17 @@
 """CLI エントリポイント — Click ベース"""
 
 import asyncio
-import json
 import sys
 from datetime import date
 from pathlib import Path
 
 import click
+import orjson
 from pydantic import ValidationError
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 
 from .config import Config, load_config
-from .browser import BrowserClient
-from .translator import TranslationService
-from .notion_client import NotionClient
-from .radar.config import load_radar_config
-from .radar.state import SeenStore
-from .radar.pipeline import run_radar
-from .radar.digest import render_slack_text
 from . import logger as log
 
 console = Console()
@@ -125,9 +117,10 @@ def cli():
 
 @cli.command(context_settings=CONTEXT_SETTINGS)
 @click.option(
-    "--url", "-u",
+    "--url", "-u", "urls",
     required=True,
-    help="翻訳する Medium 記事の URL（必須）",
+    multiple=True,
+    help="翻訳する Medium 記事の URL（必須・複数指定可）",
 )
 @click.option(
     "--score", "-s",
@@ -140,9 +133,19 @@ def cli():
     default=None,
     help="ブラウザの表示モード。--headless: バックグラウンド実行（デフォルト）、--gui: ブラウザを表示",
 )
-def translate(url: str, score: int | None, headless: bool | None):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Claude Code CLI の応答キャッシュを使わずに翻訳し直す",
+)
+def translate(
+    urls: tuple[str, ...], score: int | None, headless: bool | None, no_cache: bool
+):
     """Medium 記事を翻訳して Notion に追加する。
 
+    -u を複数指定すると、1 つのブラウザで順に取得・翻訳します。
+
     \b
     事前準備:
       - medium-notion setup  で .env を作成済みであること
@@ -153,15 +156,23 @@ def translate(url: str, score: int | None, headless: bool | None):
       medium-notion translate -u https://medium.com/@user/article-slug-abc123
       medium-notion translate -u https://medium.com/@user/article-slug-abc123 -s 9
       medium-notion translate -u https://medium.com/@user/article-slug-abc123 --gui
+      medium-notion translate -u https://medium.com/@user/a-111 -u https://medium.com/@user/b-222
     """
-    asyncio.run(_translate(url, score, headless))
+    asyncio.run(_translate(list(urls), score, headless, no_cache))
+
 
+async def _translate(
+    urls: list[str], score: int | None, headless: bool | None, no_cache: bool = False
+):
+    """翻訳パイプラインの実行（複数 URL はブラウザ・既存記事一覧を共有して順に処理）"""
+    from .browser import BrowserClient
+    from .browser_daemon import fetch_via_daemon
+    from .notion_client import NotionClient
+    from .translator import TranslationService
 
-async def _translate(url: str, score: int | None, headless: bool | None):
-    """翻訳パイプラインの実行"""
     console.print(
         Panel(
-            f"[bold]Medium → Notion 翻訳パイプライン[/bold]\n{url}",
+            "[bold]Medium → Notion 翻訳パイプライン[/bold]\n" + "\n".join(urls),
             style="blue",
         )
     )
@@ -176,70 +187,125 @@ async def _translate(url: str, score: int | None, headless: bool | None):
 
     if headless is not None:
         config.headless = headless
+    if no_cache:
+        config.claude_cache_dir = None
 
     log.setup_logger(config.log_level)
 
-    # 2. Claude Code の確認
-    if not Config.check_claude_code():
-        console.print(
-            "[red]Claude Code CLI が見つかりません[/red]\n"
-            "  → npm install -g @anthropic-ai/claude-code\n"
-            "  → Max プランでログイン: claude login"
-        )
-        sys.exit(1)
-
-    # 3. Notion 接続確認
+    # 2〜3. Claude Code の確認・Notion 接続確認・ブラウザ初期化は互いに独立しているので並行実行
     notion = NotionClient(config)
-    if not notion.check_access():
-        sys.exit(1)
-
-    # 3.5 Notion DB に同じ URL が既に登録されていないかチェック
-    notion_urls = notion.list_existing_urls()
-    if url in notion_urls:
-        console.print(
-            f"\n[yellow]⚠ この URL は既に Notion DB に登録されています[/yellow]"
-        )
-        console.print(f"  → スキップします。再翻訳する場合は Notion のページを削除してから実行してください。")
-        return
-
-    # 4. 記事取得
     browser = BrowserClient(config)
     try:
-        await browser.initialize()
-        article = await browser.fetch_article(url)
-    except RuntimeError as e:
-        console.print(f"\n[red]✗ 記事取得エラー:[/red] {e}")
-        sys.exit(1)
-    finally:
-        await browser.close()
-
-    if article.is_preview_only:
-        console.print(
-            "[yellow]⚠ ペイウォールにより記事のプレビューのみ取得しました[/yellow]"
+        backend_error, notion_ok, _ = await asyncio.gather(
+            asyncio.to_thread(config.translation_backend_error),
+            asyncio.to_thread(notion.check_access),
+            browser.initialize(),
         )
+        if backend_error:
+            console.print(f"[red]{backend_error}[/red]")
+            sys.exit(1)
+        if not notion_ok:
+            sys.exit(1)
 
-    # 5. 既存記事インデックスの読み込み
-    existing_articles = _load_article_index(config)
+        # 3.5 Notion DB に同じ URL が既に登録されていないかチェック
+        #     （翻訳時に渡す既存 Topics も同じ走査で取得しておく）
+        notion_urls, existing_topics = notion.list_existing_urls_and_topics()
+        pending = []
+        for url in dict.fromkeys(urls):
+            if url in notion_urls:
+                console.print(
+                    f"\n[yellow]⚠ この URL は既に Notion DB に登録されています[/yellow]: {url}"
+                )
+                console.print(f"  → スキップします。再翻訳する場合は Notion のページを削除してから実行してください。")
+            else:
+                pending.append(url)
+        if not pending:
+            return
 
-    # 5.5 既存 Topics の取得
-    existing_topics = notion.list_existing_topics()
+        # 5. 既存記事インデックスの読み込み（全 URL で共有）
+        existing_articles = _load_article_index(config)
+        translator = TranslationService(config)
 
-    # 6. 翻訳
-    translator = TranslationService(config)
-    result = translator.translate_article(
-        article,
-        existing_articles=existing_articles,
-        existing_topics=existing_topics,
-    )
+        # 4〜9. 取得 → 翻訳 → Notion 追加をキューでつないだパイプラインで実行する
+        # （記事 N を翻訳している間に記事 N+1 を取得し、記事 N-1 を Notion に書き込む）
+        fetched: asyncio.Queue = asyncio.Queue(maxsize=1)
+        translated: asyncio.Queue = asyncio.Queue(maxsize=1)
+        fetch_failed = False
 
-    # 7. Notion に追加
-    page = notion.create_page(result, score=score)
+        async def fetch_stage() -> None:
+            nonlocal fetch_failed
+            for url in pending:
+                # 4. 記事取得（`serve` で常駐中のブラウザがあればそれを使う）
+                try:
+                    article = await fetch_via_daemon(url)
+                    if article is None:
+                        article = await browser.fetch_article(url)
+                except RuntimeError as e:
+                    console.print(f"\n[red]✗ 記事取得エラー:[/red] {e}")
+                    fetch_failed = True
+                    break
+                if article.is_preview_only:
+                    console.print(
+                        "[yellow]⚠ ペイウォールにより記事のプレビューのみ取得しました[/yellow]"
+                    )
+                await fetched.put(article)
+            await fetched.put(None)
 
-    # 8. インデックスに新記事を追加して保存
-    _append_to_index(config, result)
+        # 同時に翻訳する記事数の上限（ARTICLE_CONCURRENCY。1 なら前の記事の翻訳結果を
+        # 次の記事の関連分析に使える）
+        slots = asyncio.Semaphore(max(1, config.article_concurrency))
 
-    # 9. 結果表示
-    _show_result(result, page)
+        async def translate_one(article) -> None:
+            try:
+                # 6. 翻訳（Claude Code のサブプロセス待ちはスレッドで）
+                result = await asyncio.to_thread(
+                    translator.translate_article,
+                    article,
+                    existing_articles=existing_articles,
+                    existing_topics=existing_topics,
+                )
+                # 次の記事の関連分析にも使う
+                existing_articles.append({
+                    "title": result.japanese_title,
+                    "categories": result.categories,
+                    "topics": result.topics,
+                    "url": article.url,
+                })
+            finally:
+                slots.release()
+            await translated.put(result)
+
+        async def translate_stage() -> None:
+            tasks = []
+            while (article := await fetched.get()) is not None:
+                await slots.acquire()
+                tasks.append(asyncio.create_task(translate_one(article)))
+            await asyncio.gather(*tasks)
+            await translated.put(None)
+
+        async def notion_stage() -> None:
+            while (result := await translated.get()) is not None:
+                # 7. Notion に追加
+                page = await asyncio.to_thread(notion.create_page, result, score=score)
+                # 8. インデックスに新記事を追記
+                _append_to_index(config, result)
+                # 9. 結果表示
+                _show_result(result, page)
+
+        stages = [
+            asyncio.create_task(fetch_stage()),
+            asyncio.create_task(translate_stage()),
+            asyncio.create_task(notion_stage()),
+        ]
+        try:
+            await asyncio.gather(*stages)
+        finally:
+            for stage in stages:
+                stage.cancel()
+        if fetch_failed:
+            sys.exit(1)
+    finally:
+        await browser.close()
 
 
 def _show_result(result, page):
@@ -259,35 +325,78 @@ def _show_result(result, page):
     console.print()
 
 
+# インデックス登録済み URL（JSONL のパスごと）。読み込み・書き出し時に作り、追記のたびに更新する
+_index_urls: dict[Path, set[str]] = {}
+
+
 def _load_article_index(config: Config) -> list[dict]:
-    """ローカルのインデックスファイルから既存記事一覧を読み込む"""
-    if not config.index_path.exists():
-        return []
-    try:
-        data = json.loads(config.index_path.read_text())
+    """ローカルのインデックスから既存記事一覧を読み込む
+
+    整形済みの index_path に、translate が追記した index_jsonl_path の行を足したものを返す。
+    """
+    data: list[dict] = []
+    if config.index_path.exists():
+        try:
+            data = orjson.loads(config.index_path.read_bytes())
+        except Exception:
+            data = []
+    if config.index_jsonl_path.exists():
+        try:
+            with config.index_jsonl_path.open("rb") as f:
+                # 追記途中で落ちた行などは 1 行ずつ読み飛ばし、後続の行は読み続ける
+                for lineno, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        data.append(orjson.loads(line))
+                    except orjson.JSONDecodeError:
+                        log.warn(f"記事インデックスの {lineno} 行目を読み飛ばしました（JSON 不正）")
+        except OSError as e:
+            log.warn(f"記事インデックス（JSONL）を読み込めません: {e}")
+    if data:
         log.step(f"記事インデックス読み込み: {len(data)} 件")
-        return data
-    except Exception:
-        return []
+    # 読み込んだついでに URL 集合を作っておき、_append_to_index で読み直さない
+    _index_urls[config.index_jsonl_path] = {a.get("url") for a in data}
+    return data
 
 
 def _append_to_index(config: Config, result) -> None:
-    """翻訳結果をインデックスに追加して保存"""
-    articles = _load_article_index(config)
+    """翻訳結果をインデックス（JSONL）に 1 行追記する"""
+    urls = _index_urls.get(config.index_jsonl_path)
+    if urls is None:
+        urls = {a.get("url") for a in _load_article_index(config)}
+        _index_urls[config.index_jsonl_path] = urls
 
     # 重複チェック（URL ベース）
-    existing_urls = {a.get("url") for a in articles}
-    if result.original.url not in existing_urls:
-        articles.append({
-            "title": result.japanese_title,
-            "categories": result.categories,
-            "topics": result.topics,
-            "url": result.original.url,
-        })
-        config.index_path.write_text(
-            json.dumps(articles, ensure_ascii=False, indent=2)
-        )
-        log.step(f"インデックス更新: {len(articles)} 件")
+    if result.original.url in urls:
+        return
+    entry = {
+        "title": result.japanese_title,
+        "categories": result.categories,
+        "topics": result.topics,
+        "url": result.original.url,
+    }
+    with config.index_jsonl_path.open("ab") as f:
+        f.write(orjson.dumps(entry) + b"\n")
+    urls.add(result.original.url)
+    log.step(f"インデックス更新: {len(urls)} 件")
+
+
+def _write_article_index(config: Config, articles: list[dict]) -> None:
+    """インデックス全体を index_path に書き出し、取り込み済みの JSONL を削除する"""
+    # 1 件ずつ書き出し、整形済み JSON 全体をメモリ上に作らない
+    # （出力は orjson.dumps(articles, option=OPT_INDENT_2) と同一）
+    with config.index_path.open("wb") as f:
+        if not articles:
+            f.write(b"[]")
+        else:
+            f.write(b"[")
+            for i, article in enumerate(articles):
+                f.write(b",\n  " if i else b"\n  ")
+                f.write(orjson.dumps(article, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+            f.write(b"\n]")
+    config.index_jsonl_path.unlink(missing_ok=True)
+    _index_urls[config.index_jsonl_path] = {a.get("url") for a in articles}
 
 
 @cli.command(context_settings=CONTEXT_SETTINGS)
@@ -315,7 +424,15 @@ def _append_to_index(config: Config, result) -> None:
     default=None,
     help="ブラウザの表示モード",
 )
-def batch(file: str, score: int | None, interval: int, headless: bool | None):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Claude Code CLI の応答キャッシュを使わずに翻訳し直す",
+)
+def batch(
+    file: str, score: int | None, interval: int, headless: bool | None, no_cache: bool
+):
     """URL リストファイルから複数記事を一括翻訳する。
 
     テキストファイルに1行1URLを記載し、まとめて翻訳・Notion 登録します。
@@ -333,7 +450,7 @@ def batch(file: str, score: int | None, interval: int, headless: bool | None):
       medium-notion batch -f urls.txt -s 8 -i 60
       medium-notion batch -f urls.txt --gui
     """
-    asyncio.run(_batch_translate(file, score, interval, headless))
+    asyncio.run(_batch_translate(file, score, interval, headless, no_cache))
 
 
 def _parse_url_file(file_path: str) -> list[str]:
@@ -353,8 +470,12 @@ async def _batch_translate(
     score: int | None,
     interval: int,
     headless: bool | None,
+    no_cache: bool = False,
 ):
     """バッチ翻訳パイプラインの実行"""
+    from .browser import BrowserClient
+    from .notion_client import NotionClient
+    from .translator import TranslationService
 
     # 1. URL ファイル読み込み
     urls = _parse_url_file(file)
@@ -380,16 +501,15 @@ async def _batch_translate(
 
     if headless is not None:
         config.headless = headless
+    if no_cache:
+        config.claude_cache_dir = None
 
     log.setup_logger(config.log_level)
 
-    # 3. Claude Code の確認
-    if not Config.check_claude_code():
-        console.print(
-            "[red]Claude Code CLI が見つかりません[/red]\n"
-            "  → npm install -g @anthropic-ai/claude-code\n"
-            "  → Max プランでログイン: claude login"
-        )
+    # 3. 翻訳バックエンド（Claude Code CLI / Anthropic API）の確認
+    backend_error = config.translation_backend_error()
+    if backend_error:
+        console.print(f"[red]{backend_error}[/red]")
         sys.exit(1)
 
     # 4. Notion 接続確認
@@ -404,8 +524,7 @@ async def _batch_translate(
     #    Why: Notion から記事が消えたのにローカル index に残っているケースで、
     #    再翻訳されずリスト削除だけ走ってしまう問題を防ぐため。
     existing_articles = _load_article_index(config)
-    existing_urls = notion.list_existing_urls()
-    existing_topics = notion.list_existing_topics()
+    existing_urls, existing_topics = notion.list_existing_urls_and_topics()
 
     # 結果記録
     successes: list[tuple[str, str]] = []   # (url, title)
@@ -486,9 +605,7 @@ async def _batch_translate(
 
     # 8. インデックスをファイルに一括保存
     if successes:
-        config.index_path.write_text(
-            json.dumps(existing_articles, ensure_ascii=False, indent=2)
-        )
+        _write_article_index(config, existing_articles)
 
     # 9. バッチ結果サマリー表示
     _show_batch_result(successes, skipped, failures)
@@ -538,6 +655,12 @@ async def _batch_translate(
     show_default=True,
     help="記事間の待機秒数。--run 時のみ有効",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Claude Code CLI の応答キャッシュを使わずに翻訳し直す。--run 時のみ有効",
+)
 def bookmark(
     list_name: str,
     output: str,
@@ -546,6 +669,7 @@ def bookmark(
     run: bool,
     score: int | None,
     interval: int,
+    no_cache: bool,
 ):
     """Medium のリスト（ブックマーク）から記事 URL を取得する。
 
@@ -572,13 +696,16 @@ def bookmark(
       medium-notion bookmark --gui                        ブラウザを表示
     """
     if run:
-        asyncio.run(_bookmark_run(list_name, output, headless, score, interval))
+        asyncio.run(_bookmark_run(list_name, output, headless, score, interval, no_cache))
     else:
         asyncio.run(_bookmark(list_name, output, headless, clean))
 
 
 async def _bookmark(list_name: str, output: str, headless: bool | None, clean: bool):
     """ブックマーク URL 取得パイプライン"""
+    from .browser import BrowserClient
+    from .notion_client import NotionClient
+
     console.print(
         Panel(
             f"[bold]Medium「{list_name}」→ URL エクスポート[/bold]"
@@ -600,12 +727,9 @@ async def _bookmark(list_name: str, output: str, headless: bool | None, clean: b
 
     log.setup_logger(config.log_level)
 
-    # 2. 既存記事と照合（ローカルインデックス + Notion DB）
-    existing_articles = _load_article_index(config)
-    existing_urls = {a.get("url") for a in existing_articles}
+    # 2. Notion 接続確認（照合はリストの URL が分かってから行う）
     notion = NotionClient(config)
-    if notion.check_access():
-        existing_urls |= notion.list_existing_urls()
+    notion_ok = notion.check_access()
 
     # 3. ブラウザ初期化・URL 取得（--clean の場合はブラウザを閉じずに保持）
     browser = BrowserClient(config)
@@ -619,6 +743,13 @@ async def _bookmark(list_name: str, output: str, headless: bool | None, clean: b
             console.print("[dim]  → --gui モードで再試行してみてください[/dim]")
             return
 
+        # 既存記事と照合（ローカルインデックス + Notion DB）。
+        # Notion にはインデックスに無い URL だけを問い合わせ、全部見つかれば走査を打ち切る
+        existing_articles = _load_article_index(config)
+        existing_urls = {a.get("url") for a in existing_articles}
+        if notion_ok:
+            existing_urls |= notion.find_existing_urls(set(urls) - existing_urls)
+
         # 4. URL を分類して出力ファイル生成
         new_count = 0
         processed_count = 0
@@ -698,8 +829,13 @@ async def _bookmark_run(
     headless: bool | None,
     score: int | None,
     interval: int,
+    no_cache: bool = False,
 ):
     """ブックマーク一括実行: エクスポート → 翻訳 → リスト削除"""
+    from .browser import BrowserClient
+    from .notion_client import NotionClient
+    from .translator import TranslationService
+
     console.print(
         Panel(
             f"[bold]Medium「{list_name}」→ 一括処理[/bold]\n"
@@ -718,20 +854,22 @@ async def _bookmark_run(
 
     if headless is not None:
         config.headless = headless
+    if no_cache:
+        config.claude_cache_dir = None
 
     log.setup_logger(config.log_level)
 
-    # Claude Code の確認（翻訳に必要）
-    if not Config.check_claude_code():
-        msg = (
-            "Claude Code CLI が見つかりません\n"
-            "  → npm install -g @anthropic-ai/claude-code\n"
-            "  → Max プランでログイン: claude login"
-        )
+    # 翻訳バックエンド（Claude Code CLI / Anthropic API）の確認
+    msg = config.translation_backend_error()
+    if msg:
         console.print(f"[red]{msg}[/red]")
         await _notify_fatal(
             config.slack_webhook_url,
-            error_type="ClaudeCodeCLIMissing",
+            error_type=(
+                "AnthropicAPIUnavailable"
+                if config.claude_backend == "api"
+                else "ClaudeCodeCLIMissing"
+            ),
             message=msg,
         )
         sys.exit(1)
@@ -752,8 +890,7 @@ async def _bookmark_run(
     # Why: Notion から削除された記事が再翻訳されず、リストからだけ消える
     # 不整合を避けるため。
     existing_articles = _load_article_index(config)
-    existing_urls = notion.list_existing_urls()
-    existing_topics = notion.list_existing_topics()
+    existing_urls, existing_topics = notion.list_existing_urls_and_topics()
 
     # ── ブラウザ初期化（全フェーズで共有） ──
     browser = BrowserClient(config)
@@ -886,9 +1023,7 @@ async def _bookmark_run(
 
         # インデックスをファイルに保存
         if successes:
-            config.index_path.write_text(
-                json.dumps(existing_articles, ensure_ascii=False, indent=2)
-            )
+            _write_article_index(config, existing_articles)
 
         # ═══════════════════════════════════
         # Phase 3: リスト削除
@@ -1011,6 +1146,9 @@ def backfill_topics():
     例:
       medium-notion backfill-topics
     """
+    from .notion_client import NotionClient
+    from .translator import TranslationService
+
     try:
         config = load_config()
     except ValidationError as e:
@@ -1022,13 +1160,10 @@ def backfill_topics():
 
     console.print(Panel("[bold]Topics バックフィル[/bold]", style="blue"))
 
-    # Claude Code の確認
-    if not Config.check_claude_code():
-        console.print(
-            "[red]Claude Code CLI が見つかりません[/red]\n"
-            "  → npm install -g @anthropic-ai/claude-code\n"
-            "  → Max プランでログイン: claude login"
-        )
+    # 翻訳バックエンド（Claude Code CLI / Anthropic API）の確認
+    backend_error = config.translation_backend_error()
+    if backend_error:
+        console.print(f"[red]{backend_error}[/red]")
         sys.exit(1)
 
     # Notion 接続確認
@@ -1103,6 +1238,8 @@ def index():
     使い方:
       medium-notion index          Notion DB から全記事を取得してインデックス作成
     """
+    from .notion_client import NotionClient
+
     try:
         config = load_config()
     except ValidationError as e:
@@ -1124,15 +1261,60 @@ def index():
         {"title": a["title"], "categories": a["categories"]}
         for a in articles
     ]
-    config.index_path.write_text(
-        json.dumps(index_data, ensure_ascii=False, indent=2)
-    )
+    _write_article_index(config, index_data)
 
     console.print(f"\n[bold green]✓ インデックス構築完了[/bold green]")
     console.print(f"  {len(index_data)} 件の記事を {config.index_path} に保存")
     console.print(f"  → translate 時に「他の記事との関連」分析に使われます\n")
 
 
+@cli.command(context_settings=CONTEXT_SETTINGS)
+@click.option(
+    "--headless/--gui",
+    default=None,
+    help="ブラウザの表示モード。--headless: バックグラウンド実行、--gui: ブラウザを表示",
+)
+def serve(headless: bool | None):
+    """ブラウザを常駐させ、translate からの記事取得を引き受ける。
+
+    起動中は translate が毎回 Chromium を起動せず、このプロセスのブラウザで
+    記事を取得します。Ctrl+C で終了します。
+
+    \b
+    例:
+      medium-notion serve --headless   # 別ターミナルで常駐
+      medium-notion translate -u https://medium.com/@user/article-slug-abc123
+    """
+    asyncio.run(_serve(headless))
+
+
+async def _serve(headless: bool | None):
+    """ブラウザデーモンの起動"""
+    from .browser_daemon import DEFAULT_SOCKET_PATH, serve as serve_browser
+
+    try:
+        config = load_config()
+    except ValidationError as e:
+        console.print(f"[red]設定エラー:[/red] {e}")
+        console.print("[dim]→ `medium-notion setup` で設定してください[/dim]")
+        sys.exit(1)
+
+    if headless is not None:
+        config.headless = headless
+    log.setup_logger(config.log_level)
+
+    console.print(
+        Panel(
+            f"[bold]ブラウザデーモン[/bold]\n{DEFAULT_SOCKET_PATH} で待機します（Ctrl+C で終了）",
+            style="blue",
+        )
+    )
+    try:
+        await serve_browser(config)
+    except asyncio.CancelledError:
+        pass
+
+
 @cli.command(context_settings=CONTEXT_SETTINGS)
 def login():
     """Medium にログインしてセッションを保存する。
@@ -1158,6 +1340,8 @@ def login():
 
 async def _login():
     """Medium ログインフロー"""
+    from .browser import BrowserClient
+
     console.print(
         Panel("[bold]Medium ログイン[/bold]\nブラウザが開きます。ログインしてください。", style="blue")
     )
@@ -1193,19 +1377,19 @@ def setup():
     """対話型セットアップウィザード。.env ファイルを作成する。
 
     Notion API キーと Database ID を入力して .env ファイルを生成します。
-    作成後、Notion と Claude Code CLI の接続テストも行います。
+    作成後、Notion と翻訳バックエンド（Claude Code CLI / Anthropic API）の接続テストも行います。
 
     \b
     必要なもの:
       - Notion API キー (https://www.notion.so/profile/integrations で取得)
       - Notion Database ID (DB の URL に含まれる 32 文字の ID)
     """
+    from .notion_client import NotionClient
+
     console.print(
         Panel("[bold]Medium → Notion セットアップ[/bold]", style="blue")
     )
 
-    from pathlib import Path
-
     env_path = Path(".env")
 
     # Notion API キー
@@ -1231,6 +1415,7 @@ def setup():
 
     # 接続テスト
     console.print("\n[bold]3. 接続テスト[/bold]")
+    config = None
     try:
         config = load_config(str(env_path))
         notion = NotionClient(config)
@@ -1241,15 +1426,14 @@ def setup():
     except Exception as e:
         console.print(f"[red]✗ 設定エラー: {e}[/red]")
 
-    # Claude Code 確認
-    if Config.check_claude_code():
-        console.print("[green]✓ Claude Code CLI が利用可能です[/green]")
-    else:
-        console.print(
-            "[yellow]⚠ Claude Code CLI が見つかりません[/yellow]\n"
-            "  → npm install -g @anthropic-ai/claude-code\n"
-            "  → claude login でログイン"
-        )
+    # 翻訳バックエンド（Claude Code CLI / Anthropic API）確認
+    if config is not None:
+        backend_error = config.translation_backend_error()
+        if backend_error is None:
+            console.print(f"[green]✓ {config.translation_backend_name} が利用可能です[/green]")
+        else:
+            headline, _, hints = backend_error.partition("\n")
+            console.print(f"[yellow]⚠ {headline}[/yellow]\n{hints}")
 
     console.print(
         "\n[bold green]セットアップ完了![/bold green]\n"
@@ -1266,10 +1450,12 @@ def test():
 
     \b
       - .env ファイルの読み込み
-      - Claude Code CLI の利用可否
+      - 翻訳バックエンド（Claude Code CLI / Anthropic API）の利用可否
       - Notion API への接続
       - Medium ログインセッションの有無
     """
+    from .notion_client import NotionClient
+
     console.print(Panel("[bold]接続テスト[/bold]", style="blue"))
 
     results = []
@@ -1283,12 +1469,12 @@ def test():
         _show_test_results(results)
         return
 
-    # 2. Claude Code CLI
-    has_claude = Config.check_claude_code()
+    # 2. 翻訳バックエンド（Claude Code CLI / Anthropic API）
+    backend_error = config.translation_backend_error()
     results.append((
-        "Claude Code CLI",
-        has_claude,
-        "利用可能" if has_claude else "npm install -g @anthropic-ai/claude-code",
+        config.translation_backend_name,
+        backend_error is None,
+        "利用可能" if backend_error is None else backend_error,
     ))
 
     # 3. Notion API
@@ -1316,6 +1502,8 @@ def test():
 
 def _show_test_results(results: list[tuple[str, bool, str]]):
     """テスト結果をテーブルで表示"""
+    from rich.table import Table
+
     table = Table(title="接続テスト結果", border_style="blue")
     table.add_column("項目", style="bold")
     table.add_column("状態")
@@ -1346,6 +1534,11 @@ def radar(dry_run, limit, no_deepdive):
       medium-notion radar            取得→採点→Slack+Notion
       medium-notion radar --dry-run  送信せず内容だけ表示
     """
+    from .radar.config import load_radar_config
+    from .radar.digest import render_slack_text
+    from .radar.pipeline import run_radar
+    from .radar.state import SeenStore
+
     try:
         config = load_config()
     except ValidationError as e:
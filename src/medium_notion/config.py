@@ -1,5 +1,6 @@
 """設定管理 — .env ファイルの読み込みとバリデーション"""
 
+import importlib.util
 import os
 import shutil
 from pathlib import Path
@@ -14,10 +15,26 @@ class Config(BaseModel):
     notion_api_key: str
     notion_database_id: str
     headless: bool = False
+    # 記事取得時に画像・フォント・メディア・計測ビーコンをブロックする
+    fast_fetch: bool = True
+    # 記事をまず HTTP GET + HTML 解析で取得し、取れなければブラウザで開く
+    http_fetch: bool = True
+    # 長文記事のチャンク翻訳で同時に走らせる Claude Code CLI の数
+    translate_concurrency: int = 4
+    # 複数記事を翻訳するとき、同時に翻訳を進める記事数（1 なら 1 件ずつ）
+    article_concurrency: int = 1
     log_level: str = "INFO"
     claude_model: str = "sonnet"
+    # "cli": Claude Code CLI を呼び出す / "api": anthropic SDK で Anthropic API を直接呼ぶ
+    claude_backend: str = "cli"
+    # Claude Code CLI を --output-format stream-json で呼び、応答をイベント単位で読み進める
+    claude_stream: bool = True
+    # Claude Code CLI の応答キャッシュ（プロンプトのハッシュ → 応答）。None なら使わない
+    claude_cache_dir: Path | None = None
     session_path: Path = Path("medium-session.json")
     index_path: Path = Path("article-index.json")
+    # translate が 1 件ずつ追記する JSONL（index_path への書き出し時に取り込んで削除）
+    index_jsonl_path: Path = Path("article-index.jsonl")
     slack_webhook_url: str | None = None
     radar_notion_database_id: str | None = None
     radar_slack_webhook_url: str | None = None
@@ -60,11 +77,52 @@ class Config(BaseModel):
             return f"{d[:8]}-{d[8:12]}-{d[12:16]}-{d[16:20]}-{d[20:]}"
         return d
 
+    @property
+    def translation_backend_name(self) -> str:
+        """翻訳に使うバックエンドの表示名"""
+        return "Anthropic API" if self.claude_backend == "api" else "Claude Code CLI"
+
     @classmethod
     def check_claude_code(cls) -> bool:
         """Claude Code CLI が利用可能か確認"""
         return shutil.which("claude") is not None
 
+    def translation_backend_error(self) -> str | None:
+        """翻訳に使うバックエンド（CLI / API）が使えない理由を返す（使えるなら None）"""
+        if self.claude_backend == "api":
+            if importlib.util.find_spec("anthropic") is None:
+                return (
+                    "anthropic パッケージが見つかりません（CLAUDE_BACKEND=api）\n"
+                    "  → pip install 'medium-notion-translator[api]'"
+                )
+            if not os.getenv("ANTHROPIC_API_KEY"):
+                return (
+                    "ANTHROPIC_API_KEY が設定されていません（CLAUDE_BACKEND=api）\n"
+                    "  → .env に ANTHROPIC_API_KEY を設定してください"
+                )
+            return None
+        if not self.check_claude_code():
+            return (
+                "Claude Code CLI が見つかりません\n"
+                "  → npm install -g @anthropic-ai/claude-code\n"
+                "  → Max プランでログイン: claude login"
+            )
+        return None
+
+
+# Claude Code CLI 応答キャッシュの既定の置き場所
+DEFAULT_CLAUDE_CACHE_DIR = Path("~/.cache/medium-notion")
+
+
+def _claude_cache_dir() -> Path | None:
+    """CLAUDE_CACHE_DIR（"off" / 空文字でキャッシュ無効）からキャッシュ置き場を決める"""
+    value = os.getenv("CLAUDE_CACHE_DIR")
+    if value is None:
+        return DEFAULT_CLAUDE_CACHE_DIR.expanduser()
+    if value.strip().lower() in ("", "off", "false", "none"):
+        return None
+    return Path(value).expanduser()
+
 
 def load_config(env_path: str | None = None) -> Config:
     """設定を .env から読み込んで返す"""
@@ -77,8 +135,15 @@ def load_config(env_path: str | None = None) -> Config:
         notion_api_key=os.getenv("NOTION_API_KEY", ""),
         notion_database_id=os.getenv("NOTION_DATABASE_ID", ""),
         headless=os.getenv("HEADLESS", "false").lower() == "true",
+        fast_fetch=os.getenv("FAST_FETCH", "true").lower() == "true",
+        http_fetch=os.getenv("HTTP_FETCH", "true").lower() == "true",
+        translate_concurrency=int(os.getenv("TRANSLATE_CONCURRENCY", "4")),
+        article_concurrency=int(os.getenv("ARTICLE_CONCURRENCY", "1")),
         log_level=os.getenv("LOG_LEVEL", "INFO"),
         claude_model=os.getenv("CLAUDE_MODEL", "sonnet"),
+        claude_backend=os.getenv("CLAUDE_BACKEND", "cli").lower(),
+        claude_stream=os.getenv("CLAUDE_STREAM", "true").lower() == "true",
+        claude_cache_dir=_claude_cache_dir(),
         slack_webhook_url=os.getenv("SLACK_WEBHOOK_URL") or None,
         radar_notion_database_id=os.getenv("RADAR_NOTION_DATABASE_ID") or None,
         radar_slack_webhook_url=os.getenv("RADAR_SLACK_WEBHOOK_URL") or None,
@@ -4,9 +4,18 @@ import sys
 
 from loguru import logger
 
+# setup_logger() で設定されたログレベル名
+_level = "INFO"
+
+# {name}:{function} に呼び出し元を出すため 1 フレーム遡るロガー
+# （ラッパー関数自身の名前が出るのを防ぐ。opt() の生成は 1 回だけにする）
+_caller = logger.opt(depth=1)
+
 
 def setup_logger(level: str = "INFO") -> None:
     """アプリケーションロガーを設定"""
+    global _level
+    _level = level.upper()
     logger.remove()
     logger.add(
         sys.stderr,
@@ -16,25 +25,34 @@ def setup_logger(level: str = "INFO") -> None:
             "{message}"
         ),
         level=level,
-        colorize=True,
+        # パイプ・リダイレクト時は ANSI エスケープの組み立てを省く
+        colorize=sys.stderr.isatty(),
     )
 
 
+def is_debug_enabled() -> bool:
+    """DEBUG レベルのログが出力される設定か（重いデバッグ情報の収集可否の判定用）"""
+    try:
+        return logger.level(_level).no <= logger.level("DEBUG").no
+    except ValueError:
+        return False
+
+
 def step(message: str) -> None:
     """処理ステップをログ出力"""
-    logger.info(f"▶ {message}")
+    _caller.info(f"▶ {message}")
 
 
 def success(message: str) -> None:
     """成功メッセージをログ出力"""
-    logger.success(f"✓ {message}")
+    _caller.success(f"✓ {message}")
 
 
 def warn(message: str) -> None:
     """警告メッセージをログ出力"""
-    logger.warning(f"⚠ {message}")
+    _caller.warning(f"⚠ {message}")
 
 
 def error(message: str) -> None:
     """エラーメッセージをログ出力"""
-    logger.error(f"✗ {message}")
+    _caller.error(f"✗ {message}")
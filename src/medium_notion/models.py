@@ -5,7 +5,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MediumArticle:
     """Medium から取得した記事"""
 
@@ -14,19 +14,24 @@ class MediumArticle:
     content: str
     author: str = ""
     publish_date: Optional[str] = None
-    tags: list[str] = field(default_factory=list)
+    # list はハッシュできないため __hash__ の対象から外す
+    tags: list[str] = field(default_factory=list, hash=False)
     is_preview_only: bool = False
+    # word_count のキャッシュ（content は frozen なので一度数えれば十分）
+    _word_count: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def word_count(self) -> int:
-        return len(self.content.split())
+        if self._word_count is None:
+            object.__setattr__(self, "_word_count", len(self.content.split()))
+        return self._word_count
 
     @property
     def char_count(self) -> int:
         return len(self.content)
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationResult:
     """Claude による翻訳結果"""
 
@@ -42,7 +47,7 @@ class TranslationResult:
         return self.japanese_title
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class NotionPage:
     """Notion に作成されたページ"""
 
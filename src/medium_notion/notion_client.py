@@ -2,8 +2,11 @@
 
 import re
 from datetime import date, datetime
+from functools import lru_cache
+from typing import Iterator
 
-from notion_client import Client as NotionSDKClient
+import orjson
+from notion_client import Client as _SDKClient
 from notion_client.errors import APIResponseError
 
 from .config import Config
@@ -13,8 +16,52 @@ from . import logger as log
 # Notion ブロックの最大文字数（API 制限）
 MAX_BLOCK_TEXT_LENGTH = 2000
 
+# 中身が固定のブロック。毎回作らずこの dict を共有する（送信時にシリアライズされるだけなので、
+# 呼び出し側で書き換えないこと）
+_TOC_BLOCK = {
+    "object": "block",
+    "type": "table_of_contents",
+    "table_of_contents": {"color": "gray"},
+}
+_DIVIDER_BLOCK = {"object": "block", "type": "divider", "divider": {}}
+
+# 番号付きリストの段落判定（"1. " で始まる）と各行の本文抽出
+_NUM_LIST_PREFIX_RE = re.compile(r"^\d+\.\s")
+_NUM_LIST_LINE_RE = re.compile(r"^\d+\.\s+(.*)")
+
+# 箇条書きの行頭マーカー
+_BULLET_PREFIXES = ("- ", "* ")
+
+# 段落の種類判定: 先頭 1 文字 → (接頭辞, 種類) の候補（長い接頭辞から照合する）。
+# 大半を占める通常の段落は先頭文字の dict 参照 1 回で判定が終わる
+_PARAGRAPH_PREFIXES: dict[str, tuple[tuple[str, str], ...]] = {
+    "#": (("### ", "heading_3"), ("## ", "heading_2"), ("# ", "heading_1")),
+    "`": (("```", "code"),),
+    ">": (("> ", "quote"),),
+    "-": (("- ", "bulleted"),),
+    "*": (("* ", "bulleted"),),
+    "[": (("[画像:", "image_caption"),),
+}
+
+# インライン書式: リンク > 太字 > 斜体 > インラインコード（それ以外はプレーンテキスト）
+# 外側の名前付きグループがマッチ全体を囲むため、m.lastgroup がそのまま書式の種類になる
+_INLINE_MD_RE = re.compile(
+    r'(?P<link>\[(?P<link_text>[^\]]+)\]\((?P<link_url>[^)]+)\))'   # [text](url)
+    r'|(?P<bold>\*\*(?P<bold_text>.+?)\*\*)'                         # **bold**
+    r'|(?P<italic>\*(?P<italic_text>.+?)\*)'                         # *italic*
+    r'|(?P<code>`(?P<code_text>[^`]+)`)'                             # `code`
+)
+
+# 書式の種類 → マッチから (content, bold, italic, code, link) のスパンを作る関数
+_INLINE_SPAN_BUILDERS = {
+    "link": lambda m: (m["link_text"], False, False, False, m["link_url"]),
+    "bold": lambda m: (m["bold_text"], True, False, False, None),
+    "italic": lambda m: (m["italic_text"], False, True, False, None),
+    "code": lambda m: (m["code_text"], False, False, True, None),
+}
+
 # Notion API がサポートするコードブロック言語
-NOTION_CODE_LANGUAGES = {
+NOTION_CODE_LANGUAGES = frozenset({
     "abap", "abc", "agda", "arduino", "ascii art", "assembly",
     "bash", "basic", "bnf", "c", "c#", "c++", "clojure",
     "coffeescript", "coq", "css", "dart", "dhall", "diff",
@@ -31,7 +78,7 @@ NOTION_CODE_LANGUAGES = {
     "smalltalk", "solidity", "sql", "swift", "toml", "typescript",
     "vb.net", "verilog", "vhdl", "visual basic", "webassembly",
     "xml", "yaml", "java/c/c++/c#",
-}
+})
 
 # よくある言語名の別名マッピング
 _LANGUAGE_ALIASES = {
@@ -55,8 +102,8 @@ _LANGUAGE_ALIASES = {
 }
 
 
-def _split_paragraphs(content: str) -> list[str]:
-    """マークダウン本文をパラグラフに分割する。
+def _split_paragraph_lines(content: str) -> list[list[str]]:
+    """マークダウン本文をパラグラフ（行のリスト）に分割する。
 
     単純な `content.split("\\n\\n")` だとコードブロック (```...```) 内の空行で
     分断されてしまい、コードブロックの中身が「普通の段落」として処理されてしまう。
@@ -66,7 +113,7 @@ def _split_paragraphs(content: str) -> list[str]:
       - ``` がリテラルでテキストに残る
     を防ぐため、フェンスの開閉を line-by-line で追跡する。
     """
-    paragraphs: list[str] = []
+    paragraphs: list[list[str]] = []
     current: list[str] = []
     in_code = False
 
@@ -76,30 +123,93 @@ def _split_paragraphs(content: str) -> list[str]:
             if in_code:
                 # フェンスを閉じる
                 current.append(line)
-                paragraphs.append("\n".join(current))
+                paragraphs.append(current)
                 current = []
                 in_code = False
             else:
                 # フェンスを開く前に通常段落を flush
                 if current:
-                    paragraphs.append("\n".join(current))
+                    paragraphs.append(current)
                     current = []
                 current.append(line)
                 in_code = True
         elif not in_code and stripped == "":
             # 通常段落の空行 → 段落区切り
             if current:
-                paragraphs.append("\n".join(current))
+                paragraphs.append(current)
                 current = []
         else:
             current.append(line)
 
     if current:
-        paragraphs.append("\n".join(current))
+        paragraphs.append(current)
 
     return paragraphs
 
 
+def _split_paragraphs(content: str) -> list[str]:
+    """マークダウン本文をパラグラフ（文字列）に分割する（_split_paragraph_lines を参照）"""
+    return ["\n".join(lines) for lines in _split_paragraph_lines(content)]
+
+
+def _tokenize_paragraphs(content: str) -> list[tuple[str, list[str]]]:
+    """本文を 1 回走査して (段落の種類, 前後の空白を除いた行のリスト) に分解する
+
+    段落を文字列に join してから strip・再 split する代わりに、行のリストの
+    両端だけを整える。リスト・引用・コードはこの行をそのまま使う。
+    """
+    tokens: list[tuple[str, list[str]]] = []
+    for lines in _split_paragraph_lines(content):
+        # 末尾の空行（閉じ忘れたコードブロックでのみ起こる）を落とす
+        while lines and not lines[-1].strip():
+            lines.pop()
+        if not lines:
+            continue
+        lines[0] = lines[0].lstrip()
+        lines[-1] = lines[-1].rstrip()
+        # 種類は先頭行で決まる（"1." 直後の改行も \s として扱うため改行を補う）
+        head = lines[0] + "\n" if len(lines) > 1 else lines[0]
+        tokens.append((_classify_paragraph(head), lines))
+    return tokens
+
+
+def _build_language_trie(languages: frozenset[str]) -> dict:
+    """対応言語名の文字トライを作る（終端は "" キーに言語名を持つ）"""
+    trie: dict = {}
+    for name in languages:
+        node = trie
+        for ch in name:
+            node = node.setdefault(ch, {})
+        node[""] = name
+    return trie
+
+
+# 部分一致の検索用トライ（import 時に 1 回だけ構築）
+_LANGUAGE_TRIE = _build_language_trie(NOTION_CODE_LANGUAGES)
+
+
+def _match_language_prefix(lang: str) -> str | None:
+    """トライを 1 回たどって部分一致する対応言語を返す。
+
+    lang の先頭に一致する最長の言語（"python3" → "python"）を優先し、
+    なければ lang で始まる言語のうち辞書順で最初のもの（"pyth" → "python"）を返す。
+    """
+    node = _LANGUAGE_TRIE
+    longest = None
+    for ch in lang:
+        node = node.get(ch)
+        if node is None:
+            return longest
+        longest = node.get("", longest)
+    if longest:
+        return longest
+    # lang を使い切った: その先で最初に現れる終端まで辞書順に降りる
+    while "" not in node:
+        node = node[min(node)]
+    return node[""]
+
+
+@lru_cache(maxsize=256)
 def _normalize_code_language(language: str) -> str:
     """コード言語名を Notion がサポートする名前に正規化する"""
     lang = language.strip().lower()
@@ -109,12 +219,53 @@ def _normalize_code_language(language: str) -> str:
     # 別名マッピング
     if lang in _LANGUAGE_ALIASES:
         return _LANGUAGE_ALIASES[lang]
-    # 部分一致（例: "python3" → "python"）
-    for supported in NOTION_CODE_LANGUAGES:
-        if lang.startswith(supported) or supported.startswith(lang):
-            return supported
-    # マッチしない場合は plain text にフォールバック
-    return "plain text"
+    # 部分一致（例: "python3" → "python"）。マッチしない場合は plain text にフォールバック
+    return _match_language_prefix(lang) or "plain text"
+
+
+def _plain_text(rich_text: list[dict]) -> str:
+    """Notion の rich_text 配列を連結したプレーンテキスト"""
+    return "".join([t.get("plain_text", "") for t in rich_text])
+
+
+def _property_ids(db_props: dict) -> dict[str, str]:
+    """DB スキーマの properties からプロパティ名 → ID の対応を作る"""
+    return {
+        name: prop["id"]
+        for name, prop in db_props.items()
+        if isinstance(prop, dict) and prop.get("id")
+    }
+
+
+class NotionSDKClient(_SDKClient):
+    """JSON の送受信を orjson で行う Notion SDK クライアント
+
+    ブロックを 100 件抱えた pages.create / blocks.children.append の本文や、
+    DB 全件をページ送りする data_sources.query の応答は dict が数千個になり、
+    標準 json でのエンコード・デコードが無視できない。
+    リトライ・エラー変換・認証ヘッダは SDK のものをそのまま使う。
+    """
+
+    def _parse_response(self, response):
+        # エラー応答の例外変換は SDK に任せ、成功時の本文だけ orjson で読む
+        if response.is_success:
+            return orjson.loads(response.content)
+        return super()._parse_response(response)
+
+    def _build_request(self, method, path, query=None, body=None, form_data=None, auth=None):
+        # ファイル送信・OAuth 認証付きのリクエストは SDK 既定の組み立てに任せる
+        # （非公開メソッドの上書きなので、引数は notion-client 3.1 の定義に合わせてキーワードで渡す）
+        if body is None or form_data or auth:
+            return super()._build_request(
+                method=method, path=path, query=query, body=body, form_data=form_data, auth=auth
+            )
+        return self.client.build_request(
+            method,
+            path,
+            params=query,
+            content=orjson.dumps(body),
+            headers={"Content-Type": "application/json"},
+        )
 
 
 class NotionClient:
@@ -125,17 +276,18 @@ class NotionClient:
         self.client = NotionSDKClient(auth=config.notion_api_key)
         self.database_id = config.notion_database_id_formatted
         self._has_topics_property = False
+        # プロパティ名 → プロパティ ID（query の filter_properties 用。スキーマ取得時に設定）
+        self._property_ids: dict[str, str] | None = None
 
     def check_access(self) -> bool:
         """データベースへのアクセス権限を確認"""
         try:
             db = self.client.data_sources.retrieve(data_source_id=self.database_id)
-            db_title = ""
-            for t in db.get("title", []):
-                db_title += t.get("plain_text", "")
+            db_title = _plain_text(db.get("title", []))
             # DB スキーマから Topics プロパティの有無を検出
             db_props = db.get("properties", {})
             self._has_topics_property = "Topics" in db_props
+            self._property_ids = _property_ids(db_props)
             log.success(f"Notion DB に接続: 「{db_title}」")
             return True
         except APIResponseError as e:
@@ -152,42 +304,64 @@ class NotionClient:
                 log.error(f"Notion API エラー: {e}")
             return False
 
+    def _filter_properties(self, *names: str) -> dict:
+        """query に渡す filter_properties（レスポンスのプロパティを names だけに絞る）
+
+        全プロパティ入りのページを何百件も受け取ってパースしないための射影。
+        スキーマが取れなければ空 dict を返し、従来どおり全プロパティを取得する。
+        """
+        if self._property_ids is None:
+            try:
+                db = self.client.data_sources.retrieve(data_source_id=self.database_id)
+                self._property_ids = _property_ids(db.get("properties", {}))
+            except Exception:
+                self._property_ids = {}
+        ids = [self._property_ids[n] for n in names if n in self._property_ids]
+        return {"filter_properties": ids} if ids else {}
+
+    def _iter_pages(self, *names: str, **params) -> Iterator[dict]:
+        """DB のページを 1 件ずつ返す（カーソルで全件をたどる。プロパティは names に絞る）
+
+        API エラーはそのまま送出する（呼び出し側で握りつぶして部分結果を返すため）。
+        """
+        query: dict = {
+            "data_source_id": self.database_id,
+            "page_size": 100,
+            **params,
+            **self._filter_properties(*names),
+        }
+        while True:
+            response = self.client.data_sources.query(**query)
+            yield from response.get("results", [])
+            cursor = response.get("next_cursor")
+            if not response.get("has_more", False) or not cursor:
+                return
+            query["start_cursor"] = cursor
+
     def list_articles(self) -> list[dict]:
         """DB 内の既存記事一覧を取得（タイトル・カテゴリ）"""
         articles = []
         try:
-            has_more = True
-            start_cursor = None
-            while has_more:
-                params = {
-                    "data_source_id": self.database_id,
-                    "page_size": 100,
-                    "sorts": [{"property": "create date", "direction": "descending"}],
-                }
-                if start_cursor:
-                    params["start_cursor"] = start_cursor
-
-                response = self.client.data_sources.query(**params)
-
-                for page in response.get("results", []):
-                    props = page.get("properties", {})
-
-                    # タイトル取得
-                    title_parts = props.get("名前", {}).get("title", [])
-                    title = "".join(t.get("plain_text", "") for t in title_parts)
+            pages = self._iter_pages(
+                "名前", "Categories",
+                sorts=[{"property": "create date", "direction": "descending"}],
+            )
+            for page in pages:
+                props = page.get("properties", {})
 
-                    # カテゴリ取得
-                    cats_data = props.get("Categories", {}).get("multi_select", [])
-                    categories = [c.get("name", "") for c in cats_data]
+                # タイトル取得
+                title_parts = props.get("名前", {}).get("title", [])
+                title = _plain_text(title_parts)
 
-                    if title:
-                        articles.append({
-                            "title": title,
-                            "categories": categories,
-                        })
+                # カテゴリ取得
+                cats_data = props.get("Categories", {}).get("multi_select", [])
+                categories = [c.get("name", "") for c in cats_data]
 
-                has_more = response.get("has_more", False)
-                start_cursor = response.get("next_cursor")
+                if title:
+                    articles.append({
+                        "title": title,
+                        "categories": categories,
+                    })
 
             log.step(f"既存記事 {len(articles)} 件を取得")
         except APIResponseError as e:
@@ -200,60 +374,53 @@ class NotionClient:
         urls: set[str] = set()
 
         try:
-            has_more = True
-            start_cursor = None
-            while has_more:
-                params: dict = {
-                    "data_source_id": self.database_id,
-                    "page_size": 100,
-                }
-                if start_cursor:
-                    params["start_cursor"] = start_cursor
+            for page in self._iter_pages("URL"):
+                _collect_url(page, urls)
 
-                response = self.client.data_sources.query(**params)
+            log.step(f"Notion DB に登録済みの URL: {len(urls)} 件")
+        except Exception as e:
+            log.warn(f"Notion DB の URL 取得に失敗: {e}")
 
-                for page in response.get("results", []):
-                    props = page.get("properties", {})
-                    url_val = props.get("URL", {}).get("url")
-                    if url_val:
-                        urls.add(url_val)
+        return urls
 
-                has_more = response.get("has_more", False)
-                start_cursor = response.get("next_cursor")
+    def find_existing_urls(self, candidates: set[str]) -> set[str]:
+        """candidates のうち DB に登録済みの URL を返す（重複チェック用）
 
-            log.step(f"Notion DB に登録済みの URL: {len(urls)} 件")
+        全件の URL 集合を作らず、ページ送りの途中で全候補が見つかった時点で打ち切る。
+        新しい記事を含む場合は結局全件を走査するが、結果は list_existing_urls() と同じ。
+        """
+        remaining = set(candidates)
+        found: set[str] = set()
+        if not remaining:
+            return found
+
+        try:
+            # 最近登録した記事ほど照会されやすいので新しい順にたどる
+            pages = self._iter_pages(
+                "URL",
+                sorts=[{"property": "create date", "direction": "descending"}],
+            )
+            for page in pages:
+                url_val = page.get("properties", {}).get("URL", {}).get("url")
+                if url_val in remaining:
+                    remaining.discard(url_val)
+                    found.add(url_val)
+                    if not remaining:
+                        break
+
+            log.step(f"Notion DB に登録済みの URL: {len(found)}/{len(candidates)} 件")
         except Exception as e:
             log.warn(f"Notion DB の URL 取得に失敗: {e}")
 
-        return urls
+        return found
 
     def list_existing_topics(self) -> list[str]:
         """DB 内の既存 Topics を重複排除してソート済みリストで返す"""
         topics: set[str] = set()
 
         try:
-            has_more = True
-            start_cursor = None
-            while has_more:
-                params: dict = {
-                    "data_source_id": self.database_id,
-                    "page_size": 100,
-                }
-                if start_cursor:
-                    params["start_cursor"] = start_cursor
-
-                response = self.client.data_sources.query(**params)
-
-                for page in response.get("results", []):
-                    props = page.get("properties", {})
-                    topics_data = props.get("Topics", {}).get("multi_select", [])
-                    for t in topics_data:
-                        name = t.get("name", "")
-                        if name:
-                            topics.add(name)
-
-                has_more = response.get("has_more", False)
-                start_cursor = response.get("next_cursor")
+            for page in self._iter_pages("Topics"):
+                _collect_topics(page, topics)
 
             log.step(f"既存 Topics: {len(topics)} 件")
         except Exception as e:
@@ -261,44 +428,49 @@ class NotionClient:
 
         return sorted(topics)
 
-    def list_pages_without_topics(self) -> list[dict]:
-        """Topics が未設定のページ一覧を取得（バックフィル用）"""
-        pages: list[dict] = []
+    def list_existing_urls_and_topics(self) -> tuple[set[str], list[str]]:
+        """既存 URL と既存 Topics を DB の 1 回の走査でまとめて取得
+
+        list_existing_urls() と list_existing_topics() を続けて呼ぶと DB を
+        2 周するため、両方が要るコマンドはこちらを使う。
+        """
+        urls: set[str] = set()
+        topics: set[str] = set()
 
         try:
-            has_more = True
-            start_cursor = None
-            while has_more:
-                params: dict = {
-                    "data_source_id": self.database_id,
-                    "page_size": 100,
-                }
-                if start_cursor:
-                    params["start_cursor"] = start_cursor
+            for page in self._iter_pages("URL", "Topics"):
+                _collect_url(page, urls)
+                _collect_topics(page, topics)
 
-                response = self.client.data_sources.query(**params)
+            log.step(f"Notion DB に登録済みの URL: {len(urls)} 件 / 既存 Topics: {len(topics)} 件")
+        except Exception as e:
+            log.warn(f"Notion DB の URL・Topics 取得に失敗: {e}")
+
+        return urls, sorted(topics)
 
-                for page in response.get("results", []):
-                    props = page.get("properties", {})
+    def list_pages_without_topics(self) -> list[dict]:
+        """Topics が未設定のページ一覧を取得（バックフィル用）"""
+        pages: list[dict] = []
 
-                    # Topics が空または未設定のページを対象にする
-                    topics_data = props.get("Topics", {}).get("multi_select", [])
-                    if topics_data:
-                        continue
+        try:
+            for page in self._iter_pages("名前", "URL", "Topics"):
+                props = page.get("properties", {})
 
-                    title_parts = props.get("名前", {}).get("title", [])
-                    title = "".join(t.get("plain_text", "") for t in title_parts)
-                    url = props.get("URL", {}).get("url", "")
+                # Topics が空または未設定のページを対象にする
+                topics_data = props.get("Topics", {}).get("multi_select", [])
+                if topics_data:
+                    continue
 
-                    if title:
-                        pages.append({
-                            "page_id": page["id"],
-                            "title": title,
-                            "url": url,
-                        })
+                title_parts = props.get("名前", {}).get("title", [])
+                title = _plain_text(title_parts)
+                url = props.get("URL", {}).get("url", "")
 
-                has_more = response.get("has_more", False)
-                start_cursor = response.get("next_cursor")
+                if title:
+                    pages.append({
+                        "page_id": page["id"],
+                        "title": title,
+                        "url": url,
+                    })
 
             log.step(f"Topics 未設定: {len(pages)} 件")
         except APIResponseError as e:
@@ -324,9 +496,7 @@ class NotionClient:
                     block_type = block.get("type", "")
                     block_data = block.get(block_type, {})
                     rich_text = block_data.get("rich_text", [])
-                    text = "".join(
-                        t.get("plain_text", "") for t in rich_text
-                    )
+                    text = _plain_text(rich_text)
                     if text:
                         texts.append(text)
 
@@ -469,64 +639,65 @@ class NotionClient:
         blocks.append(self._heading_block("翻訳", level=2))
 
         # 本文を段落ブロックに分割（コードフェンス内の空行は段落区切りにしない）
-        paragraphs = _split_paragraphs(result.japanese_content)
-        for para in paragraphs:
-            para = para.strip()
-            if not para:
-                continue
-
-            # 見出し判定
-            if para.startswith("### "):
-                blocks.append(self._heading_block(para[4:], level=3))
-            elif para.startswith("## "):
-                blocks.append(self._heading_block(para[3:], level=2))
-            elif para.startswith("# "):
-                blocks.append(self._heading_block(para[2:], level=1))
-            elif para.startswith("```"):
+        # 長文では数千回回るループなので、append やブロック生成メソッドは束縛済みのものを使い、
+        # 1 段落から複数ブロックができる場合は extend でまとめて足す
+        append = blocks.append
+        extend = blocks.extend
+        rich_paragraph = self._rich_paragraph_block
+        bulleted = self._bulleted_list_block
+        numbered = self._numbered_list_block
+        split_text = self._split_text
+        for kind, lines in _tokenize_paragraphs(result.japanese_content):
+            if kind == "heading_3":
+                append(self._heading_block("\n".join(lines)[4:], level=3))
+            elif kind == "heading_2":
+                append(self._heading_block("\n".join(lines)[3:], level=2))
+            elif kind == "heading_1":
+                append(self._heading_block("\n".join(lines)[2:], level=1))
+            elif kind == "code":
                 # コードブロック: 1行目が ```language、最終行が ``` の体裁
-                code_lines = para.split("\n")
-                first = code_lines[0].lstrip("`").strip()
+                first = lines[0].lstrip("`").strip()
                 language = first if first else "plain text"
                 # 末尾フェンスを除去（閉じ忘れの場合は除去しない）
-                if len(code_lines) > 1 and code_lines[-1].strip() == "```":
-                    body_lines = code_lines[1:-1]
+                if len(lines) > 1 and lines[-1].strip() == "```":
+                    body_lines = lines[1:-1]
                 else:
-                    body_lines = code_lines[1:]
+                    body_lines = lines[1:]
                 code_content = "\n".join(body_lines)
                 language = _normalize_code_language(language)
-                for chunk in self._split_text(code_content, MAX_BLOCK_TEXT_LENGTH):
-                    blocks.append(self._code_block(chunk, language))
-            elif para.startswith("> "):
+                extend(
+                    self._code_block(chunk, language)
+                    for chunk in split_text(code_content, MAX_BLOCK_TEXT_LENGTH)
+                )
+            elif kind == "quote":
                 # 引用ブロック
                 quote_text = "\n".join(
                     line.lstrip("> ").strip()
-                    for line in para.split("\n")
+                    for line in lines
                 )
-                blocks.append(self._quote_block(quote_text))
-            elif re.match(r"^\d+\.\s", para):
+                append(self._quote_block(quote_text))
+            elif kind == "numbered":
                 # 番号付きリスト
-                for line in para.split("\n"):
-                    line = line.strip()
-                    m = re.match(r"^\d+\.\s+(.*)", line)
+                for line in lines:
+                    m = _NUM_LIST_LINE_RE.match(line.strip())
                     if m:
-                        blocks.append(
-                            self._numbered_list_block(m.group(1).strip())
-                        )
-            elif para.startswith("- ") or para.startswith("* "):
+                        append(numbered(m.group(1).strip()))
+            elif kind == "bulleted":
                 # 箇条書き
-                for line in para.split("\n"):
+                for line in lines:
                     line = line.strip()
-                    if line.startswith("- ") or line.startswith("* "):
-                        blocks.append(
-                            self._bulleted_list_block(line[2:].strip())
-                        )
-            elif para.startswith("[画像:"):
+                    if line[:2] in _BULLET_PREFIXES:
+                        append(bulleted(line[2:].strip()))
+            elif kind == "image_caption":
                 # 画像キャプション → イタリックの段落
-                blocks.append(self._paragraph_block(para, italic=True))
+                append(self._paragraph_block("\n".join(lines), italic=True))
             else:
                 # 通常の段落（インライン書式付き）
-                for chunk in self._split_text(para, MAX_BLOCK_TEXT_LENGTH):
-                    blocks.append(self._rich_paragraph_block(chunk))
+                para = "\n".join(lines)
+                extend(
+                    rich_paragraph(chunk)
+                    for chunk in split_text(para, MAX_BLOCK_TEXT_LENGTH)
+                )
 
         # 元記事リンク
         blocks.append(self._divider_block())
@@ -546,50 +717,8 @@ class NotionClient:
           `コード`  →  code
           [テキスト](URL)  →  リンク
         """
-        parts: list[dict] = []
-
-        # パターン: リンク > 太字 > 斜体 > インラインコード > プレーンテキスト
-        pattern = re.compile(
-            r'\[([^\]]+)\]\(([^)]+)\)'   # [text](url)
-            r'|\*\*(.+?)\*\*'            # **bold**
-            r'|\*(.+?)\*'                # *italic*
-            r'|`([^`]+)`'                # `code`
-        )
-
-        last_end = 0
-        for m in pattern.finditer(text):
-            # マッチ前のプレーンテキスト
-            if m.start() > last_end:
-                plain = text[last_end:m.start()]
-                if plain:
-                    parts.append(_text_obj(plain))
-
-            if m.group(1) is not None:
-                # リンク [text](url)
-                parts.append(_text_obj(m.group(1), link=m.group(2)))
-            elif m.group(3) is not None:
-                # 太字 **bold**
-                parts.append(_text_obj(m.group(3), bold=True))
-            elif m.group(4) is not None:
-                # 斜体 *italic*
-                parts.append(_text_obj(m.group(4), italic=True))
-            elif m.group(5) is not None:
-                # インラインコード `code`
-                parts.append(_text_obj(m.group(5), code=True))
-
-            last_end = m.end()
-
-        # 残りのテキスト
-        if last_end < len(text):
-            remaining = text[last_end:]
-            if remaining:
-                parts.append(_text_obj(remaining))
-
-        # パースできなかった場合はプレーンテキスト
-        if not parts:
-            parts.append(_text_obj(text))
-
-        return parts
+        # 同じ文字列（見出し・キャプション等）は走査結果を使い回し、dict だけ毎回作る
+        return [_text_obj(*span) for span in _inline_markdown_spans(text)]
 
     # === ブロック生成ヘルパー ===
 
@@ -638,11 +767,7 @@ class NotionClient:
     @staticmethod
     def _table_of_contents_block() -> dict:
         """目次ブロック — Notion が自動的に見出しから目次を生成する"""
-        return {
-            "object": "block",
-            "type": "table_of_contents",
-            "table_of_contents": {"color": "gray"},
-        }
+        return _TOC_BLOCK
 
     def _build_summary_blocks(self, summary: str) -> list[dict]:
         """構造化要約をセクションごとのコールアウトブロックに分割
@@ -755,32 +880,67 @@ class NotionClient:
 
     @staticmethod
     def _divider_block() -> dict:
-        return {"object": "block", "type": "divider", "divider": {}}
+        return _DIVIDER_BLOCK
 
     @staticmethod
     def _split_text(text: str, max_length: int) -> list[str]:
         """テキストを最大長で分割"""
         if len(text) <= max_length:
             return [text]
+        # 元の文字列上の添字だけを動かし、返すチャンク以外の部分文字列を作らない。
+        # 分割後の残りは前後の空白を除いた範囲 [start, end) として扱う
         chunks = []
-        while text:
-            if len(text) <= max_length:
-                chunks.append(text)
-                break
-            split_pos = text.rfind("。", 0, max_length)
+        start = 0
+        end = len(text.rstrip())
+        while True:
+            limit = start + max_length
+            split_pos = text.rfind("。", start, limit)
             if split_pos == -1:
-                split_pos = text.rfind(". ", 0, max_length)
+                split_pos = text.rfind(". ", start, limit)
             if split_pos == -1:
-                split_pos = max_length
+                split_pos = limit
             else:
                 split_pos += 1
-            chunks.append(text[:split_pos])
-            text = text[split_pos:].strip()
+            chunks.append(text[start:split_pos])
+            start = split_pos
+            while start < end and text[start].isspace():
+                start += 1
+            if start >= end:
+                break
+            if end - start <= max_length:
+                chunks.append(text[start:end])
+                break
         return chunks
 
 
 # === モジュールレベルのヘルパー関数 ===
 
+def _collect_url(page: dict, urls: set[str]) -> None:
+    """ページの URL プロパティを urls に追加"""
+    url_val = page.get("properties", {}).get("URL", {}).get("url")
+    if url_val:
+        urls.add(url_val)
+
+
+def _collect_topics(page: dict, topics: set[str]) -> None:
+    """ページの Topics（multi_select）の名前を topics に追加"""
+    topics_data = page.get("properties", {}).get("Topics", {}).get("multi_select", [])
+    for t in topics_data:
+        name = t.get("name", "")
+        if name:
+            topics.add(name)
+
+
+def _classify_paragraph(para: str) -> str:
+    """段落の種類を先頭文字で振り分けて判定（該当なしは "paragraph"）"""
+    for prefix, kind in _PARAGRAPH_PREFIXES.get(para[:1], ()):
+        if para.startswith(prefix):
+            return kind
+    if para[:1].isdigit() and _NUM_LIST_PREFIX_RE.match(para):
+        return "numbered"
+    return "paragraph"
+
+
 def _text_obj(
     content: str,
     bold: bool = False,
@@ -788,13 +948,15 @@ def _text_obj(
     code: bool = False,
     link: str | None = None,
 ) -> dict:
-    """Notion rich_text オブジェクトを生成"""
-    obj: dict = {
-        "type": "text",
-        "text": {"content": content},
-    }
-    if link and link.strip() and link.strip().startswith(("http://", "https://")):
-        obj["text"]["link"] = {"url": link}
+    """Notion rich_text オブジェクトを生成
+
+    SDK にそのまま渡す dict を 1 回だけ組み立てる（中間表現は作らない）。
+    書式なしの断片には annotations キー自体を付けない。
+    """
+    text: dict = {"content": content}
+    if link and link.lstrip().startswith(("http://", "https://")):
+        text["link"] = {"url": link}
+    obj: dict = {"type": "text", "text": text}
 
     annotations = {}
     if bold:
@@ -807,3 +969,38 @@ def _text_obj(
         obj["annotations"] = annotations
 
     return obj
+
+
+@lru_cache(maxsize=1024)
+def _inline_markdown_spans(text: str) -> tuple[tuple, ...]:
+    """インライン書式を (content, bold, italic, code, link) のスパン列に分解する
+
+    結果は lru_cache で共有されるため、変更可能な dict ではなくタプルで返す。
+    """
+    spans: list[tuple] = []
+    # ループ内の属性・グローバル参照をローカルに束縛しておく
+    append = spans.append
+    builders = _INLINE_SPAN_BUILDERS
+
+    last_end = 0
+    for m in _INLINE_MD_RE.finditer(text):
+        start, end = m.span()
+        # マッチ前のプレーンテキスト
+        if start > last_end:
+            append((text[last_end:start], False, False, False, None))
+
+        append(builders[m.lastgroup](m))
+
+        last_end = end
+
+    # 残りのテキスト
+    if last_end < len(text):
+        remaining = text[last_end:]
+        if remaining:
+            spans.append((remaining, False, False, False, None))
+
+    # パースできなかった場合はプレーンテキスト
+    if not spans:
+        spans.append((text, False, False, False, None))
+
+    return tuple(spans)
@@ -11,6 +11,9 @@ from .errors import ClaudeCliNotFound
 from .models import FeedItem, ScoredItem
 from .. import logger as log
 
+# Claude 応答中の ```json ブロック
+_JSON_BLOCK_RE = re.compile(r"```json\s*\n(.*?)```", re.DOTALL)
+
 SCORING_PROMPT = textwrap.dedent("""\
     あなたは Engineering Manager（CTO・事業責任者へ移行中）の情報キュレーターです。
     以下の「関心プロファイル」に照らして、各記事を 0〜10 で採点してください。
@@ -98,7 +101,7 @@ class Curator:
         return result
 
     def _parse_json_list(self, text: str) -> list[dict]:
-        m = re.search(r"```json\s*\n(.*?)```", text, re.DOTALL)
+        m = _JSON_BLOCK_RE.search(text)
         if m:
             try:
                 data = json.loads(m.group(1).strip())
@@ -140,7 +143,7 @@ class Curator:
             raise RuntimeError("Claude Code CLI がタイムアウトしました（10分）")
 
         if proc.returncode != 0:
-            detail = (proc.stderr or proc.stdout or "出力なし").strip()[:500]
+            detail = (proc.stderr or proc.stdout or "出力なし")[:500].strip()
             raise RuntimeError(f"Claude Code CLI エラー (exit {proc.returncode}): {detail}")
         output = proc.stdout.strip()
         if not output:
@@ -21,6 +21,9 @@ from .errors import ClaudeCliNotFound, ClaudeTimeout  # noqa: F401 (re-export)
 MAX_CHUNK_SIZE = 15000
 RETRY_ATTEMPTS = 3  # 初回 + リトライ2回
 
+# Claude 応答中の ```json ブロック
+_JSON_BLOCK_RE = re.compile(r"```json\s*\n(.*?)```", re.DOTALL)
+
 TRANSLATE_PROMPT = textwrap.dedent("""\
     あなたは技術記事の翻訳者です。以下の英語記事を自然な日本語に翻訳してください。
     技術用語は英語/カタカナを適宜維持し、コードブロックや見出し等のマークダウン構造を保ちます。
@@ -151,7 +154,7 @@ class DeepDiver:
         return self._run_with_retry(once)
 
     def _parse_json(self, text: str) -> dict | None:
-        m = re.search(r"```json\s*\n(.*?)```", text, re.DOTALL)
+        m = _JSON_BLOCK_RE.search(text)
         if m:
             try:
                 return json.loads(m.group(1).strip())
@@ -185,7 +188,7 @@ class DeepDiver:
         except subprocess.TimeoutExpired:
             raise ClaudeTimeout("Claude Code CLI がタイムアウトしました（10分）")
         if proc.returncode != 0:
-            detail = (proc.stderr or proc.stdout or "出力なし").strip()[:500]
+            detail = (proc.stderr or proc.stdout or "出力なし")[:500].strip()
             raise RuntimeError(f"Claude Code CLI エラー (exit {proc.returncode}): {detail}")
         output = proc.stdout.strip()
         if not output:
@@ -2,9 +2,8 @@
 
 from datetime import date
 
-from notion_client import Client as NotionSDKClient
-
 from ..config import Config
+from ..notion_client import NotionSDKClient
 from .models import ScoredItem, DeepDive
 from .notion_blocks import markdown_to_blocks, _heading, _paragraph, _bullet
 from .. import logger as log
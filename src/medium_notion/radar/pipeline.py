@@ -9,7 +9,7 @@ from .curator import Curator
 from .digest import build_digest
 from .models import Digest
 from .notion_writer import RadarNotionWriter
-from .sources.rss import RssSource
+from .sources.rss import RssSource, feed_client
 from .state import SeenStore
 from .. import logger as log
 
@@ -39,11 +39,13 @@ def run_radar(
     # --limit 未指定でもデフォルト上限を必ず適用（バックログ全件処理を防ぐ）
     effective_limit = limit if limit is not None else DEFAULT_FEED_LIMIT
     all_items = []
-    for spec in radar_cfg.feeds:
-        try:
-            all_items.extend(RssSource(spec).fetch(effective_limit))
-        except Exception as e:
-            log.warn(f"フィード取得失敗（スキップ）: {spec.name}: {e}")
+    # 接続プールを全フィードで共有し、同じホスト（medium.com/feed/... 等）への接続を再利用する
+    with feed_client() as client:
+        for spec in radar_cfg.feeds:
+            try:
+                all_items.extend(RssSource(spec, client=client).fetch(effective_limit))
+            except Exception as e:
+                log.warn(f"フィード取得失敗（スキップ）: {spec.name}: {e}")
 
     # 2. 新着のみ
     new_items = seen.filter_new(all_items)
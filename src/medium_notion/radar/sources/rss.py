@@ -13,22 +13,32 @@ FETCH_TIMEOUT = 15
 _HEADERS = {"User-Agent": "Mozilla/5.0 (medium-notion radar)"}
 
 
+def feed_client() -> httpx.Client:
+    """フィード取得用の httpx.Client（タイムアウト・リダイレクト追従・UA 設定済み）"""
+    return httpx.Client(timeout=FETCH_TIMEOUT, follow_redirects=True, headers=_HEADERS)
+
+
 class RssSource:
     """1 つの RSS/Atom フィードから FeedItem を取得する"""
 
-    def __init__(self, spec: FeedSpec):
+    def __init__(self, spec: FeedSpec, client: httpx.Client | None = None):
         self.spec = spec
         self.name = spec.name
         self.layer = spec.layer
+        # 複数フィードで共有する接続プール（同一ホストへの TLS ハンドシェイクを使い回す）
+        self._client = client
 
     def fetch(self, limit: int | None = None) -> list[FeedItem]:
         """フィード URL をタイムアウト付きで取得して FeedItem のリストを返す"""
-        resp = httpx.get(
-            self.spec.url,
-            timeout=FETCH_TIMEOUT,
-            follow_redirects=True,
-            headers=_HEADERS,
-        )
+        if self._client is not None:
+            resp = self._client.get(self.spec.url)
+        else:
+            resp = httpx.get(
+                self.spec.url,
+                timeout=FETCH_TIMEOUT,
+                follow_redirects=True,
+                headers=_HEADERS,
+            )
         resp.raise_for_status()
         parsed = feedparser.parse(resp.content)
         return self._to_items(parsed, limit)
@@ -6,28 +6,34 @@ from . import logger as log
 from .radar.digest import render_slack_payload
 
 
-async def notify_slack(
-    webhook_url: str,
-    successes: list[tuple[str, str, str]],  # (medium_url, japanese_title, notion_url)
-    failures: list[tuple[str, str]],         # (medium_url, error)
-) -> bool:
-    """翻訳結果を Slack にまとめて通知する
+def _truncate(text: str, limit: int) -> str:
+    """limit 文字を超える分を "..." に置き換える"""
+    return text if len(text) <= limit else text[:limit] + "..."
 
-    Args:
-        webhook_url: Slack Incoming Webhook の URL
-        successes: 成功した記事のリスト (Medium URL, 日本語タイトル, Notion URL)
-        failures: 失敗した記事のリスト (Medium URL, エラーメッセージ)
 
-    Returns:
-        送信成功なら True
-    """
-    if not webhook_url:
-        return False
+def _mrkdwn_payload(fallback: str, text: str) -> dict:
+    """mrkdwn セクション 1 つだけの Webhook ペイロード（fallback は通知プレビュー用）"""
+    return {
+        "text": fallback,
+        "blocks": [
+            {
+                "type": "section",
+                "text": {
+                    "type": "mrkdwn",
+                    "text": text,
+                },
+            },
+        ],
+    }
 
-    # メッセージ構築
+
+def _build_summary_text(
+    successes: list[tuple[str, str, str]],
+    failures: list[tuple[str, str]],
+) -> str:
+    """翻訳結果サマリーの本文（件数 → 成功記事のリンク → 失敗 URL）"""
     total = len(successes) + len(failures)
-    lines = [f"*Medium → Notion 翻訳完了*  ({total}件処理)"]
-    lines.append("")
+    lines = [f"*Medium → Notion 翻訳完了*  ({total}件処理)", ""]
 
     if successes:
         lines.append(f":white_check_mark: 成功: {len(successes)}件")
@@ -37,30 +43,40 @@ async def notify_slack(
     lines.append("")
 
     # 成功した記事のリンク一覧
-    for medium_url, title, notion_url in successes:
-        lines.append(f":link: <{notion_url}|{title}>")
+    lines.extend(
+        f":link: <{notion_url}|{title}>" for _, title, notion_url in successes
+    )
 
     # 失敗した記事
     if failures:
         lines.append("")
-        for medium_url, error in failures:
-            short_url = medium_url[:60] + "..." if len(medium_url) > 60 else medium_url
-            lines.append(f":warning: {short_url}")
+        lines.extend(
+            f":warning: {_truncate(medium_url, 60)}" for medium_url, _ in failures
+        )
 
-    text = "\n".join(lines)
+    return "\n".join(lines)
 
-    payload = {
-        "text": f"Medium → Notion: {len(successes)}件翻訳完了",
-        "blocks": [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": text,
-                },
-            },
-        ],
-    }
+
+async def notify_slack(
+    webhook_url: str,
+    successes: list[tuple[str, str, str]],  # (medium_url, japanese_title, notion_url)
+    failures: list[tuple[str, str]],         # (medium_url, error)
+) -> bool:
+    """翻訳結果を Slack にまとめて通知する
+
+    Args:
+        webhook_url: Slack Incoming Webhook の URL
+        successes: 成功した記事のリスト (Medium URL, 日本語タイトル, Notion URL)
+        failures: 失敗した記事のリスト (Medium URL, エラーメッセージ)
+
+    Returns:
+        送信成功なら True
+    """
+    if not webhook_url:
+        return False
+
+    text = _build_summary_text(successes, failures)
+    payload = _mrkdwn_payload(f"Medium → Notion: {len(successes)}件翻訳完了", text)
 
     try:
         async with httpx.AsyncClient() as client:
@@ -99,27 +115,15 @@ async def notify_fatal_error(
     if not webhook_url:
         return False
 
-    short_message = message if len(message) <= 500 else message[:500] + "..."
-
     text = (
         f":rotating_light: *Medium → Notion: 致命的エラー*\n"
         f"*種別:* `{error_type}`\n"
-        f"```\n{short_message}\n```\n"
+        f"```\n{_truncate(message, 500)}\n```\n"
         f"_自動処理は中断されました。手動で対応してください。_"
     )
-
-    payload = {
-        "text": f":rotating_light: Medium → Notion 致命的エラー: {error_type}",
-        "blocks": [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": text,
-                },
-            },
-        ],
-    }
+    payload = _mrkdwn_payload(
+        f":rotating_light: Medium → Notion 致命的エラー: {error_type}", text
+    )
 
     try:
         async with httpx.AsyncClient() as client:
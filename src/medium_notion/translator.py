@@ -1,46 +1,40 @@
 """翻訳モジュール — Claude Code CLI (Max プラン) を使用
 
+15,000 文字以下の記事は 1 回の呼び出しで訳文（<translation> タグ内）と
+メタデータ JSON をまとめて取得する。長文記事と、一括応答を解釈できなかった場合は
 2ステップ方式:
   Step 1: 記事本文をマークダウンで翻訳（プレーンテキスト出力）
   Step 2: タイトル翻訳・カテゴリ・構造化要約を JSON で取得
 """
 
+import hashlib
+import io
 import json
+import os
+import re
 import subprocess
+import tempfile
 import textwrap
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from .config import Config
 from .models import MediumArticle, TranslationResult
 from . import logger as log
 
-# --- Step 1: 翻訳プロンプト（マークダウン出力） ---
-TRANSLATE_PROMPT = textwrap.dedent("""\
-    あなたは技術記事の翻訳者です。以下の英語記事を日本語に翻訳してください。
-
-    ## ルール
+# --- 翻訳ルール（単独翻訳・一括プロンプトで共有） ---
+_TRANSLATE_RULES = textwrap.dedent("""\
     - 自然で読みやすい日本語にする
     - 技術用語（Web3, blockchain, cross-chain bridge, DeFi, smart contract 等）は
       原文の英語をそのまま残すか、「クロスチェーンブリッジ」のようにカタカナ表記する
     - コードブロックやコマンドはそのまま維持する
     - 段落構造を維持する
     - マークダウン形式で出力する
-    - 翻訳のみを出力し、前置きや説明は不要
-
-    ---
-
-    ## 記事タイトル
-    {title}
-
-    ## 記事本文
-    {content}
 """)
 
-# --- Step 2: メタデータ抽出プロンプト（JSON 出力） ---
-METADATA_PROMPT = textwrap.dedent("""\
-    あなたは Engineering Manager 向けのナレッジキュレーターです。
-    以下の技術記事を分析し、JSON で結果を返してください。
-    JSON のみを出力し、他のテキストは含めないでください。
-
+# --- メタデータの出力形式とルール（メタデータ抽出・一括プロンプトで共有） ---
+_METADATA_SPEC = textwrap.dedent("""\
     出力形式:
     {{
       "japanese_title": "日本語タイトル",
@@ -79,25 +73,120 @@ METADATA_PROMPT = textwrap.dedent("""\
     Layer2, NFT, DAO, Security, Development, AI, ML, LLM,
     DevOps, DevTools, Programming, Cloud, Infrastructure,
     Frontend, Backend, Mobile, Data, Design, Career, Other
+""")
+
+# --- メタデータ抽出時に渡す既存 Topics・既存記事一覧 ---
+_METADATA_CONTEXT = textwrap.dedent("""\
+    既存 Topics 一覧（同じ概念は既存の表記を優先すること）:
+    {existing_topics}
+
+    過去に読んだ記事一覧（Notion DB に登録済み）:
+    {existing_articles}
+""")
+
+# --- Step 1: 翻訳プロンプト（マークダウン出力） ---
+TRANSLATE_PROMPT = textwrap.dedent("""\
+    あなたは技術記事の翻訳者です。以下の英語記事を日本語に翻訳してください。
+
+    ## ルール
+""") + _TRANSLATE_RULES + textwrap.dedent("""\
+    - 翻訳のみを出力し、前置きや説明は不要
+
+    ---
+
+    ## 記事タイトル
+    {title}
+
+    ## 記事本文
+    {content}
+""")
+
+# チャンク翻訳用に TRANSLATE_PROMPT を本文の前後で分けたもの
+# （前半はタイトルを埋めて記事ごとに 1 回だけ format し、チャンクは連結するだけ）
+_TRANSLATE_PROMPT_HEAD, _, _TRANSLATE_PROMPT_TAIL = TRANSLATE_PROMPT.partition("{content}")
+_TRANSLATE_PROMPT_TAIL = _TRANSLATE_PROMPT_TAIL.format()
+
+# --- Step 2: メタデータ抽出プロンプト（JSON 出力） ---
+METADATA_PROMPT = textwrap.dedent("""\
+    あなたは Engineering Manager 向けのナレッジキュレーターです。
+    以下の技術記事を分析し、JSON で結果を返してください。
+    JSON のみを出力し、他のテキストは含めないでください。
+
+""") + _METADATA_SPEC + textwrap.dedent("""\
 
     ---
 
     記事タイトル: {title}
 
-    記事本文（先頭3000文字）:
+    記事本文（先頭部分）:
     {content_preview}
 
     ---
 
-    既存 Topics 一覧（同じ概念は既存の表記を優先すること）:
-    {existing_topics}
+""") + _METADATA_CONTEXT
 
-    過去に読んだ記事一覧（Notion DB に登録済み）:
-    {existing_articles}
-""")
+# --- 一括プロンプト: 翻訳とメタデータを 1 回の呼び出しで得る（チャンク分割しない記事用） ---
+COMBINED_PROMPT = textwrap.dedent("""\
+    あなたは技術記事の翻訳者であり、Engineering Manager 向けのナレッジキュレーターです。
+    以下の英語記事について、次の 2 つをこの順に出力してください。
+
+    1. 記事本文の日本語訳を <translation> と </translation> で囲んで出力する
+    2. その直後に、記事を分析したメタデータを JSON で出力する
+
+    前置きや説明は不要です。<translation> の外には JSON 以外を出力しないでください。
+
+    ## 翻訳のルール
+""") + _TRANSLATE_RULES + textwrap.dedent("""\
+
+    ## メタデータ（JSON）のルール
+""") + _METADATA_SPEC + textwrap.dedent("""\
+
+    ---
+
+    ## 記事タイトル
+    {title}
+
+    ## 記事本文
+    {content}
+
+    ---
+
+""") + _METADATA_CONTEXT
+
+# 一括プロンプトの応答から訳文と、その後ろ（メタデータ JSON）を切り出す
+_TRANSLATION_ENVELOPE_RE = re.compile(
+    r"<translation>\s*(.*?)\s*</translation>(.*)", re.DOTALL
+)
+
+# Claude 応答中の ```json ブロック
+_JSON_BLOCK_RE = re.compile(r"```json\s*\n(.*?)```", re.DOTALL)
+
+# 応答テキスト途中の JSON オブジェクトを読み出すデコーダ（ステートレスなので共有）
+_JSON_DECODER = json.JSONDecoder()
 
 MAX_CHUNK_SIZE = 15000
 
+# メタデータ抽出プロンプト全体の目安の文字数（本文プレビューは既存記事・Topics の残りを使う）
+METADATA_PROMPT_BUDGET = 32000
+# 既存記事・Topics が多くても本文プレビューはこの文字数までは載せる
+MIN_CONTENT_PREVIEW = 2000
+
+# 長すぎる段落を分けるときの文の切れ目（文末記号の後の空白。空白は区切りとして残す）
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?。！？])(\s+)")
+
+# Claude Code CLI 1 回あたりのタイムアウト（秒）
+CLAUDE_TIMEOUT = 600
+
+# CLAUDE_BACKEND=api で Anthropic API を直接呼ぶときの最大出力トークン数
+API_MAX_TOKENS = 16384
+
+# CLAUDE_MODEL の CLI 向けエイリアス → API のモデル ID（それ以外はそのまま渡す）
+_API_MODEL_ALIASES = {
+    "sonnet": "claude-sonnet-4-5",
+    "opus": "claude-opus-4-1",
+    "haiku": "claude-haiku-4-5",
+}
+
 # --- Topics 専用抽出プロンプト（バックフィル用） ---
 TOPICS_ONLY_PROMPT = textwrap.dedent("""\
     あなたは Engineering Manager 向けのナレッジキュレーターです。
@@ -133,10 +222,29 @@ TOPICS_ONLY_PROMPT = textwrap.dedent("""\
 
 
 class TranslationService:
-    """Claude Code CLI を使った翻訳サービス（2ステップ方式）"""
+    """Claude Code CLI を使った翻訳サービス（一括呼び出し、長文・失敗時は 2 ステップ）"""
 
     def __init__(self, config: Config):
         self.config = config
+        # CLAUDE_BACKEND=api のときだけ使う Anthropic SDK クライアント（プロセス起動なしで使い回す）
+        self._client = self._make_api_client(config)
+        # _format_context の前回の結果（(キー, 元のリスト, テキスト)）
+        self._context_cache: tuple | None = None
+
+    @staticmethod
+    def _make_api_client(config: Config):
+        """Anthropic SDK のクライアントを作る（CLI を使う設定、または SDK 未導入なら None）"""
+        if config.claude_backend != "api":
+            return None
+        try:
+            import anthropic
+        except ImportError:
+            log.warn(
+                "CLAUDE_BACKEND=api ですが anthropic パッケージがありません。Claude Code CLI を使います\n"
+                "  → pip install 'medium-notion-translator[api]'"
+            )
+            return None
+        return anthropic.Anthropic(timeout=CLAUDE_TIMEOUT)
 
     def translate_article(
         self,
@@ -144,28 +252,78 @@ class TranslationService:
         existing_articles: list[dict] | None = None,
         existing_topics: list[str] | None = None,
     ) -> TranslationResult:
-        """記事を日本語に翻訳（2ステップ）"""
-        log.step(f"記事を翻訳中: 「{article.title}」({article.char_count}文字)")
+        """記事を日本語に翻訳する
 
-        # === Step 1: 翻訳 ===
-        log.step("[Step 1/2] 本文を翻訳中...")
-        if article.char_count > MAX_CHUNK_SIZE:
-            translated_content = self._translate_chunked(article)
-        else:
-            prompt = TRANSLATE_PROMPT.format(
-                title=article.title,
-                content=article.content,
+        チャンク分割しない長さの記事は、翻訳とメタデータ抽出を 1 回の CLI 呼び出しで
+        済ませる（起動コストと待ち時間を 1 回分に抑える）。応答から訳文・JSON を
+        取り出せなかった部分だけ、従来の 2 ステップで取り直す。
+        """
+        log.step(f"記事を翻訳中: 「{article.title}」({article.char_count}文字)")
+        existing_articles = existing_articles or []
+        existing_topics = existing_topics or []
+
+        translated_content: str | None = None
+        # 同じ記事（URL と本文が同じ）のメタデータを取得済みなら Step 2 は省き、訳文だけ取る
+        metadata = self._load_cached_metadata(article, existing_topics)
+        if metadata is None and article.char_count <= MAX_CHUNK_SIZE:
+            log.step("本文の翻訳とタイトル翻訳・カテゴリ・要約・Topics の抽出を一括で実行中...")
+            translated_content, metadata = self._translate_combined(
+                article, existing_articles, existing_topics
             )
-            translated_content = self._call_claude(prompt)
-
-        log.success(f"翻訳完了 ({len(translated_content)} 文字)")
 
-        # === Step 2: タイトル翻訳・カテゴリ・構造化要約・Topics を抽出 ===
-        log.step("[Step 2/2] タイトル翻訳・カテゴリ・要約・Topics を抽出中...")
-        japanese_title, categories, summary, topics = self._extract_metadata(
-            article, existing_articles or [], existing_topics or []
+        return self._finish_translation(
+            article, translated_content, metadata, existing_articles, existing_topics
         )
 
+    def _finish_translation(
+        self,
+        article: MediumArticle,
+        translated_content: str | None,
+        metadata: tuple[str | None, list[str], str | None, list[str] | None] | None,
+        existing_articles: list[dict],
+        existing_topics: list[str],
+    ) -> TranslationResult:
+        """一括応答で得られなかった訳文・メタデータを 2 ステップで補い、結果にまとめる
+
+        Step 2 のプロンプトは訳文に依存しないので、両方とも必要なときは
+        Step 2 を別スレッドで先に走らせ、Step 1 と同時に待つ。
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # === Step 2: タイトル翻訳・カテゴリ・構造化要約・Topics を抽出 ===
+            metadata_future = None
+            topics_future = None
+            if metadata is None:
+                log.step("[Step 2/2] タイトル翻訳・カテゴリ・要約・Topics を抽出中...")
+                metadata_future = executor.submit(
+                    self._extract_metadata, article, existing_articles, existing_topics
+                )
+            elif metadata[3] is None:
+                # キャッシュの Topics は別の既存 Topics 一覧に合わせたものなので、Topics だけ取り直す
+                log.step("[Step 2/2] 既存 Topics 一覧が変わったため Topics を抽出し直し中...")
+                topics_future = executor.submit(
+                    self.extract_topics, article.title, article.content, existing_topics
+                )
+
+            # === Step 1: 翻訳（長文記事、または一括応答から訳文を取り出せなかった場合） ===
+            if translated_content is None:
+                log.step("[Step 1/2] 本文を翻訳中...")
+                if article.char_count > MAX_CHUNK_SIZE:
+                    translated_content = self._translate_chunked(article)
+                else:
+                    prompt = TRANSLATE_PROMPT.format(
+                        title=article.title,
+                        content=article.content,
+                    )
+                    translated_content = self._call_claude(prompt)
+
+            log.success(f"翻訳完了 ({len(translated_content)} 文字)")
+
+            if metadata_future is not None:
+                metadata = metadata_future.result()
+            elif topics_future is not None:
+                metadata = (*metadata[:3], topics_future.result())
+        japanese_title, categories, summary, topics = metadata
+
         # 日英併記タイトル: 「日本語タイトル | English Title」
         if japanese_title and japanese_title != article.title:
             display_title = f"{japanese_title} | {article.title}"
@@ -188,42 +346,122 @@ class TranslationService:
 
     def _translate_chunked(self, article: MediumArticle) -> str:
         """長い記事をチャンク分割して翻訳"""
-        paragraphs = article.content.split("\n\n")
-        chunks: list[str] = []
-        current_chunk: list[str] = []
-        current_size = 0
-
-        for para in paragraphs:
-            if current_size + len(para) > MAX_CHUNK_SIZE and current_chunk:
-                chunks.append("\n\n".join(current_chunk))
-                current_chunk = []
-                current_size = 0
-            current_chunk.append(para)
-            current_size += len(para)
-
-        if current_chunk:
-            chunks.append("\n\n".join(current_chunk))
-
-        log.step(f"{len(chunks)} チャンクに分割しました")
-
-        translated_parts: list[str] = []
-        for i, chunk in enumerate(chunks, start=1):
-            log.step(f"チャンク {i}/{len(chunks)} を翻訳中...")
-            prompt = TRANSLATE_PROMPT.format(
-                title=article.title,
-                content=chunk,
-            )
-            translated_parts.append(self._call_claude(prompt))
+        chunks = self._split_chunks(article.content)
+
+        # チャンク同士は独立しているので、CLI 呼び出し（サブプロセス待ち）を並行に走らせる。
+        # 長いチャンクから投入して、短い末尾チャンクが最後に単独で残らないようにする
+        # （結果は元の段落順に並べ直して連結する）
+        workers = max(1, min(self.config.translate_concurrency, len(chunks)))
+        log.step(f"{len(chunks)} チャンクに分割しました（同時 {workers} 件で翻訳）")
+
+        head = _TRANSLATE_PROMPT_HEAD.format(title=article.title)
+        order = sorted(range(len(chunks)), key=lambda i: len(chunks[i]), reverse=True)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                i: executor.submit(
+                    self._call_claude, f"{head}{chunks[i]}{_TRANSLATE_PROMPT_TAIL}"
+                )
+                for i in order
+            }
+            translated_parts = [futures[i].result() for i in range(len(chunks))]
 
         return "\n\n".join(translated_parts)
 
-    def _extract_metadata(
+    @staticmethod
+    def _split_chunks(content: str) -> list[str]:
+        """段落順を保ったまま、区切りを含めて MAX_CHUNK_SIZE に収まるだけ段落を詰めてチャンクにする
+
+        MAX_CHUNK_SIZE を超える段落は文の切れ目（入らなければ文字数）で分け、
+        その断片も前のチャンクの空きに詰める。
+        """
+        # (直前との区切り, テキスト) の並び。段落の区切りは "\n\n"、文の区切りは元の空白
+        units: list[tuple[str, str]] = []
+        for para in content.split("\n\n"):
+            if len(para) <= MAX_CHUNK_SIZE:
+                units.append(("\n\n", para))
+                continue
+            parts = _SENTENCE_BREAK_RE.split(para)
+            sep = "\n\n"
+            for k in range(0, len(parts), 2):
+                sentence = parts[k]
+                for start in range(0, len(sentence), MAX_CHUNK_SIZE):
+                    units.append((sep, sentence[start : start + MAX_CHUNK_SIZE]))
+                    sep = ""
+                sep = parts[k + 1] if k + 1 < len(parts) else ""
+
+        chunks: list[str] = []
+        current: list[str] = []
+        current_size = 0
+        for sep, text in units:
+            size = len(text)
+            if current:
+                grown = current_size + len(sep) + size
+                if grown <= MAX_CHUNK_SIZE:
+                    current.append(sep)
+                    current.append(text)
+                    current_size = grown
+                    continue
+                chunks.append("".join(current))
+            current = [text]
+            current_size = size
+
+        if current:
+            chunks.append("".join(current))
+        return chunks
+
+    def _translate_combined(
         self,
         article: MediumArticle,
         existing_articles: list[dict],
         existing_topics: list[str],
-    ) -> tuple[str | None, list[str], str | None, list[str]]:
-        """タイトル翻訳・カテゴリ・構造化要約・トピックスを抽出"""
+    ) -> tuple[str | None, tuple[str | None, list[str], str | None, list[str]] | None]:
+        """翻訳とメタデータ抽出を 1 回の呼び出しで行う
+
+        Returns:
+            (訳文, メタデータ)。応答から取り出せなかった方は None
+        """
+        articles_text, topics_text = self._format_context(existing_articles, existing_topics)
+        prompt = COMBINED_PROMPT.format(
+            title=article.title,
+            content=article.content,
+            existing_topics=topics_text,
+            existing_articles=articles_text,
+        )
+        translated_content, metadata = self._parse_combined(self._call_claude(prompt))
+        if metadata is not None:
+            self._save_metadata(article, metadata, existing_topics)
+        return translated_content, metadata
+
+    def _parse_combined(
+        self, raw: str
+    ) -> tuple[str | None, tuple[str | None, list[str], str | None, list[str]] | None]:
+        """一括応答（<translation> で囲んだ訳文 + メタデータ JSON）を (訳文, メタデータ) にする"""
+        m = _TRANSLATION_ENVELOPE_RE.search(raw)
+        if not m or not m.group(1):
+            log.warn("一括応答から訳文を取り出せませんでした。2 ステップで翻訳し直します")
+            return None, None
+
+        data = self._parse_json(m.group(2))
+        if not data:
+            log.warn("一括応答からメタデータを取り出せませんでした。メタデータのみ取り直します")
+            return m.group(1), None
+        return m.group(1), self._metadata_from_data(data)
+
+    def _format_context(
+        self,
+        existing_articles: list[dict],
+        existing_topics: list[str],
+    ) -> tuple[str, str]:
+        """プロンプトに埋め込む既存記事一覧・既存 Topics のテキスト
+
+        バッチでは同じリスト（末尾に追記されるだけ）で記事ごとに呼ばれるので、
+        リストの同一性と長さが前回と同じなら前回のテキストを返す。
+        """
+        key = (id(existing_articles), len(existing_articles), id(existing_topics), len(existing_topics))
+        cached = self._context_cache
+        if cached is not None and cached[0] == key:
+            return cached[2]
+
         # 既存記事一覧をフォーマット
         if existing_articles:
             articles_text = "\n".join(
@@ -239,9 +477,52 @@ class TranslationService:
         else:
             topics_text = "（まだ登録された Topics はありません）"
 
+        texts = (articles_text, topics_text)
+        # リスト本体も持っておき、id が別のリストに再利用されないようにする
+        self._context_cache = (key, (existing_articles, existing_topics), texts)
+        return texts
+
+    @staticmethod
+    def _preview_chars(content: str, articles_text: str, topics_text: str) -> int:
+        """メタデータ抽出プロンプトに載せる本文の文字数（既存記事・Topics の残りの枠、本文長が上限）"""
+        return min(
+            len(content),
+            max(
+                MIN_CONTENT_PREVIEW,
+                METADATA_PROMPT_BUDGET - len(articles_text) - len(topics_text) - len(METADATA_PROMPT),
+            ),
+        )
+
+    def _metadata_from_data(
+        self, data: dict
+    ) -> tuple[str | None, list[str], str | None, list[str]]:
+        """メタデータ JSON を (タイトル, カテゴリ, 要約, Topics) に変換"""
+        japanese_title = data.get("japanese_title", "")
+        categories = data.get("categories", [])
+        topics = data.get("topics", [])
+        summary_data = data.get("summary", {})
+
+        # 構造化要約をマークダウン文字列に変換
+        if isinstance(summary_data, dict):
+            summary = self._format_structured_summary(summary_data)
+        else:
+            summary = str(summary_data)
+
+        return japanese_title, categories, summary, topics
+
+    def _extract_metadata(
+        self,
+        article: MediumArticle,
+        existing_articles: list[dict],
+        existing_topics: list[str],
+    ) -> tuple[str | None, list[str], str | None, list[str]]:
+        """タイトル翻訳・カテゴリ・構造化要約・トピックスを抽出"""
+        articles_text, topics_text = self._format_context(existing_articles, existing_topics)
+        preview_chars = self._preview_chars(article.content, articles_text, topics_text)
+
         prompt = METADATA_PROMPT.format(
             title=article.title,
-            content_preview=article.content[:3000],
+            content_preview=article.content[:preview_chars],
             existing_topics=topics_text,
             existing_articles=articles_text,
         )
@@ -250,18 +531,9 @@ class TranslationService:
             raw = self._call_claude(prompt)
             data = self._parse_json(raw)
             if data:
-                japanese_title = data.get("japanese_title", "")
-                categories = data.get("categories", [])
-                topics = data.get("topics", [])
-                summary_data = data.get("summary", {})
-
-                # 構造化要約をマークダウン文字列に変換
-                if isinstance(summary_data, dict):
-                    summary = self._format_structured_summary(summary_data)
-                else:
-                    summary = str(summary_data)
-
-                return japanese_title, categories, summary, topics
+                metadata = self._metadata_from_data(data)
+                self._save_metadata(article, metadata, existing_topics)
+                return metadata
         except Exception as e:
             log.warn(f"メタデータ抽出に失敗（翻訳は成功済み）: {e}")
 
@@ -288,31 +560,25 @@ class TranslationService:
 
     def _parse_json(self, text: str) -> dict | None:
         """テキストから JSON を抽出してパース"""
-        import re
-
         # ```json ブロック
-        m = re.search(r"```json\s*\n(.*?)```", text, re.DOTALL)
+        m = _JSON_BLOCK_RE.search(text)
         if m:
             try:
                 return json.loads(m.group(1).strip())
             except json.JSONDecodeError:
                 pass
 
-        # トップレベルの { } を探す
-        brace_start = text.find("{")
-        if brace_start != -1:
-            depth = 0
-            for i in range(brace_start, len(text)):
-                if text[i] == "{":
-                    depth += 1
-                elif text[i] == "}":
-                    depth -= 1
-                    if depth == 0:
-                        try:
-                            return json.loads(text[brace_start : i + 1])
-                        except json.JSONDecodeError:
-                            pass
-                        break
+        # "{" の位置から順に raw_decode を試し、最初に読めたオブジェクトを返す
+        i = text.find("{")
+        while i != -1:
+            try:
+                obj, _ = _JSON_DECODER.raw_decode(text, i)
+            except json.JSONDecodeError:
+                pass
+            else:
+                if isinstance(obj, dict):
+                    return obj
+            i = text.find("{", i + 1)
 
         return None
 
@@ -345,47 +611,153 @@ class TranslationService:
         return []
 
     def _call_claude(self, prompt: str) -> str:
-        """Claude Code CLI を呼び出して応答を取得（stdin 経由）"""
-        cmd = [
-            "claude",
-            "-p",
-            "--output-format", "text",
-        ]
+        """Claude Code CLI を呼び出して応答を取得（応答キャッシュがあればそれを返す）"""
+        cache_path = self._cache_path(prompt)
+        if cache_path is not None and cache_path.is_file():
+            log.step(f"Claude Code CLI の応答をキャッシュから取得 ({cache_path.name[:12]})")
+            return cache_path.read_text(encoding="utf-8")
+
+        output = self._run_claude(prompt)
+
+        if cache_path is not None:
+            self._write_cache(cache_path, output)
+        return output
+
+    def _cache_path(self, prompt: str) -> Path | None:
+        """プロンプトとモデル名から決まる応答キャッシュのパス（キャッシュ無効なら None）"""
+        cache_dir = self.config.claude_cache_dir
+        if cache_dir is None:
+            return None
+        key = hashlib.sha256(
+            f"{self.config.claude_model}\0{prompt}".encode("utf-8")
+        ).hexdigest()
+        return cache_dir / f"{key}.txt"
+
+    def _metadata_cache_path(self, article: MediumArticle) -> Path | None:
+        """記事の URL と本文から決まるメタデータキャッシュのパス（キャッシュ無効なら None）"""
+        cache_dir = self.config.claude_cache_dir
+        if cache_dir is None:
+            return None
+        key = hashlib.sha256(
+            f"{article.url}\0{article.content}".encode("utf-8")
+        ).hexdigest()[:16]
+        return cache_dir / "meta" / f"{key}.json"
 
-        log.step(f"Claude Code CLI を呼び出し中 (プロンプト {len(prompt)} 文字)...")
+    @staticmethod
+    def _topics_key(existing_topics: list[str]) -> str:
+        """Topics の表記合わせに使った既存 Topics 一覧のハッシュ"""
+        return hashlib.sha256("\0".join(existing_topics).encode("utf-8")).hexdigest()[:16]
+
+    def _load_cached_metadata(
+        self, article: MediumArticle, existing_topics: list[str]
+    ) -> tuple[str | None, list[str], str | None, list[str] | None] | None:
+        """取得済みのメタデータ（タイトル, カテゴリ, 要約, Topics）を返す（無ければ None）
+
+        Topics は既存 Topics 一覧に表記を合わせているので、保存時と一覧が変わっていれば
+        None にして呼び出し側で取り直させる。
+        """
+        path = self._metadata_cache_path(article)
+        if path is None or not path.is_file():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        log.step(f"メタデータをキャッシュから取得 ({path.stem})")
+        topics_fresh = data.get("topics_key") == self._topics_key(existing_topics)
+        return (
+            data.get("japanese_title"),
+            data.get("categories", []),
+            data.get("summary"),
+            data.get("topics", []) if topics_fresh else None,
+        )
 
+    def _save_metadata(
+        self,
+        article: MediumArticle,
+        metadata: tuple[str | None, list[str], str | None, list[str]],
+        existing_topics: list[str],
+    ) -> None:
+        """抽出できたメタデータを記事単位で保存（タイトルが取れなかったものは保存しない）"""
+        path = self._metadata_cache_path(article)
+        japanese_title, categories, summary, topics = metadata
+        if path is None or not japanese_title:
+            return
+        self._write_cache(
+            path,
+            json.dumps(
+                {
+                    "japanese_title": japanese_title,
+                    "categories": categories,
+                    "summary": summary,
+                    "topics": topics,
+                    "topics_key": self._topics_key(existing_topics),
+                },
+                ensure_ascii=False,
+            ),
+        )
+
+    @staticmethod
+    def _write_cache(cache_path: Path, output: str) -> None:
+        """応答をキャッシュに保存（一時ファイル経由で置き換え、書きかけを読ませない）"""
         try:
-            proc = subprocess.run(
-                cmd,
-                input=prompt,
-                capture_output=True,
-                text=True,
-                timeout=600,
-            )
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(output)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            log.warn(f"Claude Code CLI 応答のキャッシュ保存に失敗: {e}")
+
+    def _run_claude(self, prompt: str) -> str:
+        """Claude を呼び出して応答を取得（API クライアントがあれば API、無ければ CLI に stdin 経由）"""
+        if self._client is not None:
+            log.step(f"Anthropic API を呼び出し中 (プロンプト {len(prompt)} 文字)...")
+            output = self._run_claude_api(prompt)
+        else:
+            log.step(f"Claude Code CLI を呼び出し中 (プロンプト {len(prompt)} 文字)...")
+            output = self._run_claude_cli(prompt)
 
-            if proc.returncode != 0:
-                stderr_msg = proc.stderr.strip() if proc.stderr else ""
-                stdout_msg = proc.stdout.strip() if proc.stdout else ""
-                debug_info = []
-                if stderr_msg:
-                    debug_info.append(f"stderr: {stderr_msg[:500]}")
-                if stdout_msg:
-                    debug_info.append(f"stdout: {stdout_msg[:500]}")
-                detail = "\n  ".join(debug_info) if debug_info else "出力なし"
+        if not output:
+            if self._client is not None:
                 raise RuntimeError(
-                    f"Claude Code CLI エラー (exit code: {proc.returncode}):\n  {detail}"
+                    "Anthropic API から空の応答が返されました。\n"
+                    "  → ANTHROPIC_API_KEY とモデル名（CLAUDE_MODEL）を確認してください"
                 )
+            raise RuntimeError(
+                "Claude Code CLI から空の応答が返されました。\n"
+                "  → claude login でログイン状態を確認してください"
+            )
 
-            output = proc.stdout.strip()
-            if not output:
-                raise RuntimeError(
-                    "Claude Code CLI から空の応答が返されました。\n"
-                    "  → claude login でログイン状態を確認してください"
-                )
+        log.success(f"Claude 応答取得 ({len(output)} 文字)")
+        return output
 
-            log.success(f"Claude Code CLI 応答取得 ({len(output)} 文字)")
-            return output
+    def _run_claude_api(self, prompt: str) -> str:
+        """Anthropic API（Messages）を 1 回呼び出し、text ブロックを連結して返す"""
+        model = _API_MODEL_ALIASES.get(self.config.claude_model, self.config.claude_model)
+        try:
+            message = self._client.messages.create(
+                model=model,
+                max_tokens=API_MAX_TOKENS,
+                messages=[{"role": "user", "content": prompt}],
+            )
+        except Exception as e:
+            raise RuntimeError(f"Anthropic API エラー ({model}): {e}") from e
+        # 出力上限で打ち切られた応答は訳文が途中で切れているので、成功扱い（キャッシュ）にしない
+        if message.stop_reason == "max_tokens":
+            raise RuntimeError(
+                f"Anthropic API の応答が出力上限（{API_MAX_TOKENS} トークン）で打ち切られました ({model})"
+            )
+        return "".join(
+            block.text for block in message.content if block.type == "text"
+        ).strip()
 
+    def _run_claude_cli(self, prompt: str) -> str:
+        """Claude Code CLI を起動して応答を取得（stream-json / text は設定で切り替え）"""
+        try:
+            if self.config.claude_stream:
+                return self._run_claude_stream(prompt)
+            return self._run_claude_text(prompt)
         except FileNotFoundError:
             raise RuntimeError(
                 "Claude Code CLI が見つかりません。\n"
@@ -394,3 +766,109 @@ class TranslationService:
             )
         except subprocess.TimeoutExpired:
             raise RuntimeError("Claude Code CLI がタイムアウトしました（10分）")
+
+    def _run_claude_text(self, prompt: str) -> str:
+        """--output-format text で呼び出し、終了後に stdout 全体を応答とする"""
+        proc = subprocess.run(
+            ["claude", "-p", "--output-format", "text"],
+            input=prompt,
+            capture_output=True,
+            text=True,
+            timeout=CLAUDE_TIMEOUT,
+        )
+        if proc.returncode != 0:
+            raise self._cli_error(proc.returncode, proc.stderr, proc.stdout)
+        return proc.stdout.strip()
+
+    def _run_claude_stream(self, prompt: str) -> str:
+        """--output-format stream-json で呼び出し、イベントを 1 行ずつ読みながら応答を組み立てる"""
+        cmd = ["claude", "-p", "--output-format", "stream-json", "--verbose"]
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+
+        # stderr は別スレッドで吸い出す（パイプが詰まって CLI が止まるのを防ぐ）
+        stderr_parts: list[str] = []
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_parts.append(proc.stderr.read()), daemon=True
+        )
+        stderr_reader.start()
+        timed_out = threading.Event()
+
+        def _kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        watchdog = threading.Timer(CLAUDE_TIMEOUT, _kill_on_timeout)
+        watchdog.start()
+
+        buf = io.StringIO()
+        result: str | None = None
+        result_error = False
+        try:
+            try:
+                proc.stdin.write(prompt)
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass  # CLI が入力を読む前に落ちた場合は終了コードで報告する
+            for line in proc.stdout:
+                event = self._parse_stream_event(line)
+                if event is None:
+                    continue
+                kind = event.get("type")
+                if kind == "assistant":
+                    for part in event.get("message", {}).get("content", []):
+                        if part.get("type") == "text":
+                            buf.write(part.get("text", ""))
+                    log.step(f"Claude Code CLI 応答受信中 ({buf.tell()} 文字)...")
+                elif kind == "result":
+                    result_error = bool(event.get("is_error"))
+                    if isinstance(event.get("result"), str):
+                        result = event["result"]
+            returncode = proc.wait()
+        finally:
+            watchdog.cancel()
+            if proc.poll() is None:
+                proc.kill()
+        stderr_reader.join()
+
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, CLAUDE_TIMEOUT)
+        # result イベントの本文を正とし、無ければ assistant イベントの text を連結したものを使う
+        output = (result if result is not None else buf.getvalue()).strip()
+        if returncode != 0 or result_error:
+            raise self._cli_error(returncode, "".join(stderr_parts), output)
+        return output
+
+    @staticmethod
+    def _parse_stream_event(line: str) -> dict | None:
+        """stream-json の 1 行をイベント dict にする（空行・JSON でない行は None）"""
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+        return event if isinstance(event, dict) else None
+
+    @staticmethod
+    def _cli_error(returncode: int, stderr: str | None, stdout: str | None) -> RuntimeError:
+        """CLI の異常終了を stderr / stdout の先頭付きの RuntimeError にする"""
+        # 巨大な出力でも先頭 500 文字だけを扱う（全体を strip でコピーしない）
+        stderr_msg = (stderr or "")[:500].strip()
+        stdout_msg = (stdout or "")[:500].strip()
+        debug_info = []
+        if stderr_msg:
+            debug_info.append(f"stderr: {stderr_msg}")
+        if stdout_msg:
+            debug_info.append(f"stdout: {stdout_msg}")
+        detail = "\n  ".join(debug_info) if debug_info else "出力なし"
+        return RuntimeError(
+            f"Claude Code CLI エラー (exit code: {returncode}):\n  {detail}"
+        )
@@ -0,0 +1,85 @@
+"""記事インデックス（article-index.json + 追記用 JSONL）のテスト"""
+
+import json
+
+import orjson
+import pytest
+
+from medium_notion import cli
+
+
+@pytest.fixture
+def index_config(mock_config, tmp_path):
+    mock_config.index_path = tmp_path / "article-index.json"
+    mock_config.index_jsonl_path = tmp_path / "article-index.jsonl"
+    yield mock_config
+    cli._index_urls.pop(mock_config.index_jsonl_path, None)
+
+
+class TestArticleIndex:
+    def test_append_writes_one_jsonl_line(self, index_config, sample_translation):
+        cli._append_to_index(index_config, sample_translation)
+
+        lines = index_config.index_jsonl_path.read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["url"] == sample_translation.original.url
+        assert not index_config.index_path.exists()
+
+    def test_append_skips_duplicate_url(self, index_config, sample_translation):
+        cli._append_to_index(index_config, sample_translation)
+        cli._append_to_index(index_config, sample_translation)
+
+        assert len(index_config.index_jsonl_path.read_text().splitlines()) == 1
+
+    def test_append_skips_url_already_in_json(self, index_config, sample_translation):
+        index_config.index_path.write_text(
+            json.dumps([{"title": "t", "url": sample_translation.original.url}])
+        )
+        cli._append_to_index(index_config, sample_translation)
+
+        assert not index_config.index_jsonl_path.exists()
+
+    def test_load_merges_json_and_jsonl(self, index_config, sample_translation):
+        index_config.index_path.write_text(json.dumps([{"title": "old", "categories": []}]))
+        cli._append_to_index(index_config, sample_translation)
+
+        articles = cli._load_article_index(index_config)
+        assert [a["title"] for a in articles] == ["old", sample_translation.japanese_title]
+
+    def test_load_skips_corrupt_jsonl_line(self, index_config, sample_translation):
+        """壊れた行だけを読み飛ばし、その後の行も読み込むこと"""
+        index_config.index_jsonl_path.write_bytes(
+            b'{"title": "a"}\n{"title": "b"\n{"title": "c"}\n'
+        )
+
+        articles = cli._load_article_index(index_config)
+        assert [a["title"] for a in articles] == ["a", "c"]
+
+    def test_write_compacts_jsonl(self, index_config, sample_translation):
+        cli._append_to_index(index_config, sample_translation)
+        articles = cli._load_article_index(index_config)
+
+        cli._write_article_index(index_config, articles)
+
+        assert not index_config.index_jsonl_path.exists()
+        assert cli._load_article_index(index_config) == articles
+
+    def test_append_after_load_does_not_reread(self, index_config, sample_translation, monkeypatch):
+        cli._load_article_index(index_config)
+        monkeypatch.setattr(cli, "_load_article_index", lambda c: pytest.fail("reread"))
+
+        cli._append_to_index(index_config, sample_translation)
+
+        assert index_config.index_jsonl_path.exists()
+
+    @pytest.mark.parametrize("articles", [
+        [],
+        [{"title": "記事", "categories": ["AI"], "topics": [], "url": "https://medium.com/a"}],
+        [{"title": "a", "categories": []}, {"title": "b", "categories": ["x", "y"]}],
+    ])
+    def test_write_matches_indented_dump(self, index_config, articles):
+        cli._write_article_index(index_config, articles)
+
+        assert index_config.index_path.read_bytes() == orjson.dumps(
+            articles, option=orjson.OPT_INDENT_2
+        )
@@ -0,0 +1,99 @@
+"""browser_daemon のテスト"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from medium_notion import browser_daemon
+from medium_notion.browser import BrowserClient
+
+
+@pytest.fixture
+def short_tmp(tmp_path_factory):
+    # Unix ソケットのパス長制限を避けるため短いパスを使う
+    return tmp_path_factory.mktemp("d")
+
+
+class TestFetchViaDaemon:
+    async def test_no_socket_returns_none(self, tmp_path):
+        result = await browser_daemon.fetch_via_daemon(
+            "https://medium.com/@u/a", tmp_path / "none.sock"
+        )
+        assert result is None
+
+    async def test_roundtrip(self, mock_config, sample_article, short_tmp, monkeypatch):
+        fake = MagicMock()
+        fake.fetch_article = AsyncMock(return_value=sample_article)
+        fake.close = AsyncMock()
+        monkeypatch.setattr(BrowserClient, "shared", classmethod(lambda cls, c: fake))
+        sock = short_tmp / "s.sock"
+
+        task = asyncio.create_task(browser_daemon.serve(mock_config, sock))
+        for _ in range(50):
+            if sock.exists():
+                break
+            await asyncio.sleep(0.01)
+
+        article = await browser_daemon.fetch_via_daemon(sample_article.url, sock)
+        assert article == sample_article
+        fake.fetch_article.assert_awaited_once_with(sample_article.url)
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert not sock.exists()
+        fake.close.assert_awaited_once()
+
+    async def test_error_raises_and_resets_page(self, mock_config, short_tmp, monkeypatch):
+        fake = MagicMock()
+        fake.fetch_article = AsyncMock(side_effect=RuntimeError("boom"))
+        fake.reset_page = AsyncMock()
+        fake.close = AsyncMock()
+        monkeypatch.setattr(BrowserClient, "shared", classmethod(lambda cls, c: fake))
+        sock = short_tmp / "e.sock"
+
+        task = asyncio.create_task(browser_daemon.serve(mock_config, sock))
+        for _ in range(50):
+            if sock.exists():
+                break
+            await asyncio.sleep(0.01)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await browser_daemon.fetch_via_daemon("https://medium.com/@u/a", sock)
+        fake.reset_page.assert_awaited_once()
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+class TestFetchViaDaemonFallback:
+    """デーモンとの通信が壊れたときは None を返して自前のブラウザ取得に任せる"""
+
+    @staticmethod
+    async def _fake_daemon(sock, reply: bytes | None):
+        async def handle(reader, writer):
+            await reader.readline()
+            if reply is None:
+                await asyncio.sleep(10)  # 応答しない
+            else:
+                writer.write(reply)
+                await writer.drain()
+            writer.close()
+
+        return await asyncio.start_unix_server(handle, path=str(sock))
+
+    @pytest.mark.parametrize("reply", [b"", b'{"ok": true, "arti', b"[1]\n"])
+    async def test_broken_response_returns_none(self, short_tmp, reply):
+        sock = short_tmp / "b.sock"
+        server = await self._fake_daemon(sock, reply)
+        async with server:
+            assert await browser_daemon.fetch_via_daemon("https://medium.com/@u/a", sock) is None
+
+    async def test_timeout_returns_none(self, short_tmp, monkeypatch):
+        monkeypatch.setattr(browser_daemon, "_RESPONSE_TIMEOUT", 0.05)
+        sock = short_tmp / "t.sock"
+        server = await self._fake_daemon(sock, None)
+        async with server:
+            assert await browser_daemon.fetch_via_daemon("https://medium.com/@u/a", sock) is None
@@ -0,0 +1,119 @@
+"""ページ HTML からの本文抽出（trafilatura）のテスト"""
+
+import json
+
+from medium_notion.browser import (
+    _extract_fallback_text,
+    _extract_markdown_from_html,
+    _parse_article_html,
+    _read_storage_state,
+    _session_cookies,
+)
+
+_PARAGRAPH = (
+    "This paragraph explains how the system was designed and why each "
+    "component exists, with enough words to look like real article prose. "
+)
+
+
+def _html(body: str) -> str:
+    return f"<html><head><title>t</title></head><body><nav>menu</nav>{body}<footer>f</footer></body></html>"
+
+
+class TestExtractMarkdownFromHtml:
+    def test_extracts_article_as_markdown(self):
+        html = _html(
+            "<article><h1>Title</h1>"
+            f"<p>{_PARAGRAPH * 3} with <strong>bold</strong> text.</p>"
+            "<h2>Section</h2>"
+            f"<p>{_PARAGRAPH * 3}</p>"
+            "<pre><code>def foo():\n    return 1\n</code></pre>"
+            "</article>"
+        )
+        markdown = _extract_markdown_from_html(html)
+        assert "## Section" in markdown
+        assert "**bold**" in markdown
+        assert "def foo():" in markdown
+        assert "menu" not in markdown
+
+    def test_returns_empty_when_too_short(self):
+        assert _extract_markdown_from_html(_html("<article><p>short</p></article>")) == ""
+
+    def test_returns_empty_for_garbage(self):
+        assert _extract_markdown_from_html("") == ""
+
+
+class TestExtractFallbackText:
+    def test_joins_long_text_and_drops_chrome(self):
+        html = _html(
+            "<div><p>This is a long enough sentence.</p><span>tiny</span>"
+            "<script>var x = 'script content here';</script>"
+            "<button>Click this button please</button>"
+            "<p>Another long enough sentence.</p></div>"
+        )
+        assert _extract_fallback_text(html) == (
+            "This is a long enough sentence.\n\nAnother long enough sentence."
+        )
+
+    def test_returns_empty_for_empty_html(self):
+        assert _extract_fallback_text("") == ""
+
+    def test_stops_at_limit(self):
+        html = _html("".join(f"<p>paragraph number {i:04d}</p>" for i in range(100)))
+        text = _extract_fallback_text(html, limit=100)
+        assert len(text) == 100
+        assert text.startswith("paragraph number 0000")
+
+
+class TestParseArticleHtml:
+    def _page(self, body: str, title: str = "My Post") -> str:
+        return (
+            f"<html><head><title>{title}</title>"
+            '<meta name="author" content="Jane Doe"></head>'
+            f"<body>{body}</body></html>"
+        )
+
+    def test_builds_article_from_full_html(self):
+        html = self._page(f"<article><h1>My Post</h1><p>{_PARAGRAPH * 20}</p></article>")
+        article = _parse_article_html(html, "https://medium.com/@jane/my-post")
+        assert article.title == "My Post"
+        assert article.author == "Jane Doe"
+        assert article.url == "https://medium.com/@jane/my-post"
+        assert article.is_preview_only is False
+
+    def test_rejects_paywalled_page(self):
+        html = self._page(
+            f"<article><p>Member-only story</p><p>{_PARAGRAPH * 20}</p></article>"
+        )
+        assert _parse_article_html(html, "https://medium.com/x") is None
+
+    def test_ignores_paywall_words_inside_scripts(self):
+        html = self._page(
+            "<script>var s = 'become a member';</script>"
+            f"<article><p>{_PARAGRAPH * 20}</p></article>"
+        )
+        assert _parse_article_html(html, "https://medium.com/x") is not None
+
+    def test_rejects_short_body(self):
+        html = self._page(f"<article><p>{_PARAGRAPH * 5}</p></article>")
+        assert _parse_article_html(html, "https://medium.com/x") is None
+
+    def test_rejects_cloudflare_challenge(self):
+        html = self._page(f"<p>{_PARAGRAPH * 20}</p>", title="Just a moment...")
+        assert _parse_article_html(html, "https://medium.com/x") is None
+
+
+class TestSessionCookies:
+    def test_keeps_only_medium_cookies(self, tmp_path):
+        path = tmp_path / "session.json"
+        path.write_text(json.dumps({"cookies": [
+            {"name": "sid", "value": "1", "domain": ".medium.com"},
+            {"name": "other", "value": "2", "domain": ".example.com"},
+        ]}))
+        assert _session_cookies(_read_storage_state(path)) == {"sid": "1"}
+
+    def test_returns_empty_for_broken_file(self, tmp_path):
+        path = tmp_path / "session.json"
+        path.write_text("{not json")
+        assert _read_storage_state(path) is None
+        assert _session_cookies(None) == {}
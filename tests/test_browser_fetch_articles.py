@@ -0,0 +1,160 @@
+"""BrowserClient の共有インスタンスと記事取得のテスト"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from medium_notion.browser import BrowserClient
+
+
+@pytest.fixture
+def client(mock_config, tmp_path):
+    mock_config.session_path = tmp_path / "medium-session.json"
+    mock_config.session_path.write_text("{}")
+    mock_config.headless = False
+    mock_config.http_fetch = False
+    client = BrowserClient(mock_config)
+    # 実ブラウザは起動しない
+    client._launch = AsyncMock()
+    return client
+
+
+class TestShared:
+    async def test_returns_same_instance_until_closed(self, mock_config):
+        first = BrowserClient.shared(mock_config)
+        assert BrowserClient.shared(mock_config) is first
+        await first.close()
+        assert BrowserClient.shared(mock_config) is not first
+        await BrowserClient.shared(mock_config).close()
+
+    async def test_ensure_browser_launches_once(self, mock_config):
+        browser = BrowserClient(mock_config)
+        with patch.object(browser, "_launch", AsyncMock()) as launch:
+            await asyncio.gather(browser._ensure_browser(), browser._ensure_browser())
+            await browser._ensure_browser()
+        launch.assert_awaited_once()
+
+    async def test_close_stops_playwright_driver(self, mock_config):
+        """close() でブラウザだけでなく Playwright のドライバも止め、再起動できること"""
+        browser = BrowserClient(mock_config)
+        playwright = MagicMock(stop=AsyncMock())
+        browser._playwright = playwright
+        browser._browser = MagicMock(close=AsyncMock())
+
+        await browser.close()
+
+        playwright.stop.assert_awaited_once()
+        assert browser._playwright is None
+        assert browser._launch_task is None
+
+    async def test_initialize_does_not_launch(self, mock_config):
+        browser = BrowserClient(mock_config)
+        with patch.object(browser, "_launch", AsyncMock()) as launch:
+            await browser.initialize()
+        launch.assert_not_awaited()
+
+
+class TestFetchArticle:
+    async def test_http_fetch_skips_browser_launch(self, client):
+        client.config.http_fetch = True
+        article = MagicMock(title="t")
+        with patch.object(client, "_try_http_fetch", AsyncMock(return_value=article)):
+            assert await client.fetch_article("https://a") is article
+        client._launch.assert_not_awaited()
+
+    @staticmethod
+    def _article_page(meta_sequence: list[dict]) -> MagicMock:
+        """goto → 待機 → evaluate の呼び出し順を記録する偽ページ"""
+        page = MagicMock()
+        page.url = "https://medium.com/@a/post"
+        calls: list[str] = []
+        metas = iter(meta_sequence)
+
+        async def evaluate(script, *args):
+            if "__mnCollectPageMeta" in script:
+                calls.append("meta")
+                return next(metas)
+            return {"blocks": 50, "scrolled": False}
+
+        page.goto = AsyncMock(return_value=MagicMock(status=200))
+        page.evaluate = AsyncMock(side_effect=evaluate)
+        page.wait_for_selector = AsyncMock(side_effect=lambda *a, **kw: calls.append("container"))
+        page.wait_for_function = AsyncMock(side_effect=lambda *a, **kw: calls.append("stable"))
+        page.calls = calls
+        return page
+
+    async def test_404_detected_before_container_wait(self, client):
+        """無効ページは記事コンテナの待機（最大 10 秒）に入る前に弾くこと"""
+        page = self._article_page([{"is404": True, "hasArticleStructure": False}])
+
+        with pytest.raises(RuntimeError, match="404"):
+            await client._fetch_article_on_page(page, "https://medium.com/@a/gone")
+
+        page.wait_for_selector.assert_not_awaited()
+
+    async def test_paywall_read_after_render_settles(self, client):
+        """ペイウォール判定は描画が落ち着いた後の DOM で行うこと"""
+        page = self._article_page([
+            {"is404": False, "paywallHit": ""},
+            {"is404": False, "title": "T", "paywallHit": "member-only story"},
+        ])
+
+        with patch.object(client, "_extract_content", AsyncMock(return_value=("本文", False))):
+            article = await client._fetch_article_on_page(page, page.url)
+
+        assert page.calls == ["meta", "container", "stable", "meta"]
+        assert article.is_preview_only is True
+        assert article.title == "T"
+
+
+class TestLoginCheck:
+    async def test_always_probes_even_with_recent_session(self, client):
+        """セッションファイルが新しくても、未確認ならトップページで確認すること"""
+        client._page = MagicMock()
+        client._page.goto = AsyncMock(side_effect=TimeoutError())
+        assert await client.ensure_login() is False
+        client._page.goto.assert_called_once()
+
+    async def test_refetches_after_relogin_when_preview_only(self, client):
+        client._page = MagicMock()
+        preview = MagicMock(is_preview_only=True)
+        full = MagicMock(is_preview_only=False)
+        with patch.object(
+            client, "_fetch_article_on_page", AsyncMock(side_effect=[preview, full])
+        ), patch.object(client, "ensure_login", AsyncMock(return_value=True)) as login:
+            assert await client.fetch_article("https://a") is full
+        login.assert_awaited_once_with(force=True)
+
+    async def test_no_relogin_when_already_verified(self, client):
+        """このクライアントで確認済みなら、プレビューのみでも再確認しないこと"""
+        client._page = MagicMock()
+        client._login_verified = True
+        preview = MagicMock(is_preview_only=True)
+        with patch.object(
+            client, "_fetch_article_on_page", AsyncMock(return_value=preview)
+        ), patch.object(client, "ensure_login", AsyncMock()) as login:
+            assert await client.fetch_article("https://a") is preview
+        login.assert_not_awaited()
+
+    async def test_skips_probe_after_successful_check(self, client):
+        client._page = MagicMock()
+        client._page.goto = AsyncMock()
+        client._login_verified = True
+        assert await client.ensure_login() is True
+        assert await client._check_login_quick() is True
+        client._page.goto.assert_not_called()
+
+
+class TestStorageStateCache:
+    async def test_reads_session_file_once(self, client):
+        first = await client._load_storage_state()
+        client.session_path.write_text('{"cookies": [{"name": "x"}]}')
+        assert await client._load_storage_state() is first
+
+    async def test_save_session_updates_memory_copy(self, client):
+        saved = {"cookies": [{"name": "sid", "value": "1", "domain": ".medium.com"}]}
+        client._context = MagicMock()
+        client._context.storage_state = AsyncMock(return_value=saved)
+        await client._save_session()
+        assert await client._load_storage_state() is saved
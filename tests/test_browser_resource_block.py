@@ -0,0 +1,32 @@
+"""fast_fetch 時のリクエスト遮断判定のテスト"""
+
+from medium_notion.browser import BrowserClient, _should_block_request
+
+
+class TestShouldBlockRequest:
+    def test_blocks_images_fonts_media(self):
+        for resource_type in ("image", "font", "media"):
+            assert _should_block_request(resource_type, "https://miro.medium.com/x") is True
+
+    def test_blocks_analytics_domains(self):
+        assert _should_block_request(
+            "script", "https://www.google-analytics.com/analytics.js"
+        ) is True
+
+    def test_allows_document_and_scripts(self):
+        assert _should_block_request("document", "https://medium.com/@u/post-abc") is False
+        assert _should_block_request("script", "https://medium.com/_/main.js") is False
+
+    def test_allows_stylesheets(self):
+        # リスト削除フローが要素サイズ・座標に依存するため CSS は通す
+        assert _should_block_request("stylesheet", "https://medium.com/x.css") is False
+
+
+class TestContextOptions:
+    def test_blocks_service_workers_when_fast_fetch(self, mock_config):
+        mock_config.fast_fetch = True
+        assert BrowserClient(mock_config)._build_context_options()["service_workers"] == "block"
+
+    def test_keeps_service_workers_without_fast_fetch(self, mock_config):
+        mock_config.fast_fetch = False
+        assert "service_workers" not in BrowserClient(mock_config)._build_context_options()
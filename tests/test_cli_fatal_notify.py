@@ -86,7 +86,7 @@ class TestFatalNotifyOnNotionFailure:
 
         with patch("medium_notion.cli.load_config", return_value=config_with_webhook), \
              patch("medium_notion.cli.Config.check_claude_code", return_value=True), \
-             patch("medium_notion.cli.NotionClient", return_value=notion_instance), \
+             patch("medium_notion.notion_client.NotionClient", return_value=notion_instance), \
              patch("medium_notion.slack.notify_fatal_error", notify_mock):
             exit_code = _run_bookmark()
 
@@ -100,8 +100,7 @@ class TestFatalNotifyOnRuntimeError:
         notify_mock = AsyncMock(return_value=True)
         notion_instance = MagicMock()
         notion_instance.check_access = MagicMock(return_value=True)
-        notion_instance.list_existing_urls = MagicMock(return_value=set())
-        notion_instance.list_existing_topics = MagicMock(return_value=[])
+        notion_instance.list_existing_urls_and_topics = MagicMock(return_value=(set(), []))
 
         browser_instance = MagicMock()
         browser_instance.initialize = AsyncMock(
@@ -111,8 +110,8 @@ class TestFatalNotifyOnRuntimeError:
 
         with patch("medium_notion.cli.load_config", return_value=config_with_webhook), \
              patch("medium_notion.cli.Config.check_claude_code", return_value=True), \
-             patch("medium_notion.cli.NotionClient", return_value=notion_instance), \
-             patch("medium_notion.cli.BrowserClient", return_value=browser_instance), \
+             patch("medium_notion.notion_client.NotionClient", return_value=notion_instance), \
+             patch("medium_notion.browser.BrowserClient", return_value=browser_instance), \
              patch("medium_notion.cli._load_article_index", return_value=[]), \
              patch("medium_notion.slack.notify_fatal_error", notify_mock):
             exit_code = _run_bookmark()
@@ -130,8 +129,7 @@ class TestNoFatalNotifyOnEmptyList:
         notify_mock = AsyncMock(return_value=True)
         notion_instance = MagicMock()
         notion_instance.check_access = MagicMock(return_value=True)
-        notion_instance.list_existing_urls = MagicMock(return_value=set())
-        notion_instance.list_existing_topics = MagicMock(return_value=[])
+        notion_instance.list_existing_urls_and_topics = MagicMock(return_value=(set(), []))
 
         browser_instance = MagicMock()
         browser_instance.initialize = AsyncMock()
@@ -142,8 +140,8 @@ class TestNoFatalNotifyOnEmptyList:
 
         with patch("medium_notion.cli.load_config", return_value=config_with_webhook), \
              patch("medium_notion.cli.Config.check_claude_code", return_value=True), \
-             patch("medium_notion.cli.NotionClient", return_value=notion_instance), \
-             patch("medium_notion.cli.BrowserClient", return_value=browser_instance), \
+             patch("medium_notion.notion_client.NotionClient", return_value=notion_instance), \
+             patch("medium_notion.browser.BrowserClient", return_value=browser_instance), \
              patch("medium_notion.cli._load_article_index", return_value=[]), \
              patch("medium_notion.slack.notify_fatal_error", notify_mock), \
              patch("medium_notion.slack.notify_slack", success_notify):
@@ -0,0 +1,17 @@
+"""CLI の起動時 import のテスト"""
+
+import subprocess
+import sys
+
+
+def test_cli_import_does_not_load_heavy_modules():
+    """`medium-notion -h` 等で Playwright / Notion / radar を読み込まない"""
+    code = (
+        "import sys, medium_notion.cli; "
+        "print(','.join(m for m in ('playwright', 'notion_client', 'feedparser', "
+        "'medium_notion.browser', 'medium_notion.translator') if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == ""
@@ -0,0 +1,50 @@
+"""`medium-notion test` の翻訳バックエンド確認"""
+
+import os
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from medium_notion.cli import cli
+from medium_notion.config import Config
+
+
+def _run_test_command(cfg: Config, env: dict[str, str]):
+    notion = MagicMock()
+    notion.check_access.return_value = True
+    with patch("medium_notion.cli.load_config", return_value=cfg), \
+         patch("medium_notion.notion_client.NotionClient", return_value=notion), \
+         patch("medium_notion.config.Config.check_claude_code", return_value=False), \
+         patch("medium_notion.config.importlib.util.find_spec", return_value=object()), \
+         patch.dict(os.environ, env):
+        return CliRunner().invoke(cli, ["test"])
+
+
+def test_api_backend_does_not_require_claude_cli(tmp_path):
+    """CLAUDE_BACKEND=api なら claude コマンドが無くても API の行を成功として表示する"""
+    cfg = Config(
+        notion_api_key="ntn_real_key",
+        notion_database_id="a" * 32,
+        claude_backend="api",
+        session_path=tmp_path / "medium-session.json",
+    )
+
+    result = _run_test_command(cfg, {"ANTHROPIC_API_KEY": "sk-test"})
+
+    assert result.exit_code == 0
+    assert "Anthropic API" in result.output
+    assert "Claude Code CLI" not in result.output
+
+
+def test_cli_backend_reports_missing_claude(tmp_path):
+    cfg = Config(
+        notion_api_key="ntn_real_key",
+        notion_database_id="a" * 32,
+        session_path=tmp_path / "medium-session.json",
+    )
+
+    result = _run_test_command(cfg, {})
+
+    assert result.exit_code == 0
+    assert "Claude Code CLI" in result.output
+    assert "npm install -g @anthropic-ai/claude-code" in result.output
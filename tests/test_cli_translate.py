@@ -0,0 +1,118 @@
+"""translate コマンド（複数 URL）のテスト"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from medium_notion.cli import _translate
+
+
+def _clients(existing_urls: set[str]):
+    notion = MagicMock()
+    notion.check_access = MagicMock(return_value=True)
+    notion.list_existing_urls_and_topics = MagicMock(return_value=(existing_urls, []))
+    notion.create_page = MagicMock(return_value=MagicMock(url="https://notion.so/p"))
+
+    browser = MagicMock()
+    browser.initialize = AsyncMock()
+    browser.fetch_article = AsyncMock(
+        side_effect=lambda url: MagicMock(url=url, is_preview_only=False)
+    )
+    browser.close = AsyncMock()
+
+    translator = MagicMock()
+    translator.translate_article = MagicMock(
+        side_effect=lambda article, **kw: MagicMock(
+            original=article, japanese_title=f"訳: {article.url}", categories=[], topics=[]
+        )
+    )
+    return notion, browser, translator
+
+
+def _run(config, urls, notion, browser, translator):
+    with patch("medium_notion.cli.load_config", return_value=config), \
+         patch("medium_notion.cli.Config.check_claude_code", return_value=True), \
+         patch("medium_notion.notion_client.NotionClient", return_value=notion), \
+         patch("medium_notion.browser.BrowserClient", return_value=browser) as browser_cls, \
+         patch("medium_notion.translator.TranslationService", return_value=translator), \
+         patch("medium_notion.browser_daemon.fetch_via_daemon", AsyncMock(return_value=None)), \
+         patch("medium_notion.cli._load_article_index", return_value=[]), \
+         patch("medium_notion.cli._append_to_index") as append, \
+         patch("medium_notion.cli._show_result"):
+        asyncio.run(_translate(urls, None, True))
+    return browser_cls, append
+
+
+class TestTranslateMultipleUrls:
+    def test_shares_one_browser(self, mock_config):
+        urls = ["https://medium.com/@a/one-1", "https://medium.com/@a/two-2"]
+        notion, browser, translator = _clients(set())
+
+        browser_cls, append = _run(mock_config, urls, notion, browser, translator)
+
+        browser_cls.assert_called_once()
+        assert [c.args[0] for c in browser.fetch_article.await_args_list] == urls
+        assert notion.create_page.call_count == 2
+        assert append.call_count == 2
+        browser.close.assert_awaited_once()
+
+    def test_skips_urls_already_in_notion(self, mock_config):
+        done = "https://medium.com/@a/done-1"
+        todo = "https://medium.com/@a/todo-2"
+        notion, browser, translator = _clients({done})
+
+        _run(mock_config, [done, todo, todo], notion, browser, translator)
+
+        browser.fetch_article.assert_awaited_once_with(todo)
+        notion.create_page.assert_called_once()
+
+    def test_later_articles_see_earlier_ones_in_index(self, mock_config):
+        urls = ["https://medium.com/@a/one-1", "https://medium.com/@a/two-2"]
+        notion, browser, translator = _clients(set())
+        seen: list[list[str]] = []
+        translate = translator.translate_article.side_effect
+
+        def record(article, **kw):
+            seen.append([a["url"] for a in kw["existing_articles"]])
+            return translate(article, **kw)
+
+        translator.translate_article.side_effect = record
+
+        _run(mock_config, urls, notion, browser, translator)
+
+        assert seen == [[], [urls[0]]]
+
+    def test_fetch_error_keeps_earlier_articles(self, mock_config):
+        """途中の記事取得に失敗しても、取得済みの記事は Notion に保存してから終了する"""
+        urls = ["https://medium.com/@a/one-1", "https://medium.com/@a/two-2"]
+        notion, browser, translator = _clients(set())
+        browser.fetch_article = AsyncMock(
+            side_effect=[MagicMock(url=urls[0], is_preview_only=False), RuntimeError("403")]
+        )
+
+        with pytest.raises(SystemExit) as exc:
+            _run(mock_config, urls, notion, browser, translator)
+
+        assert exc.value.code == 1
+        notion.create_page.assert_called_once()
+        browser.close.assert_awaited_once()
+
+    def test_article_concurrency_overlaps_translations(self, mock_config):
+        """ARTICLE_CONCURRENCY > 1 なら複数記事の翻訳が重なること"""
+        mock_config.article_concurrency = 2
+        urls = ["https://medium.com/@a/one-1", "https://medium.com/@a/two-2"]
+        notion, browser, translator = _clients(set())
+        translate = translator.translate_article.side_effect
+        both_started = threading.Barrier(2, timeout=5)
+
+        def wait_for_other(article, **kw):
+            both_started.wait()
+            return translate(article, **kw)
+
+        translator.translate_article.side_effect = wait_for_other
+
+        _run(mock_config, urls, notion, browser, translator)
+
+        assert notion.create_page.call_count == 2
@@ -3,7 +3,7 @@
 import os
 from unittest.mock import patch
 
-from medium_notion.config import load_config
+from medium_notion.config import DEFAULT_CLAUDE_CACHE_DIR, load_config
 
 
 class TestLoadConfig:
@@ -19,3 +19,44 @@ class TestLoadConfig:
             config = load_config(str(env_file))
 
         assert config.notion_api_key == "ntn_from_dotenv_file"
+
+    def test_claude_cache_dir_default_and_off(self, tmp_path):
+        """CLAUDE_CACHE_DIR 未設定なら既定の置き場所、"off" ならキャッシュ無効になること"""
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "NOTION_API_KEY=ntn_from_dotenv_file\n"
+            "NOTION_DATABASE_ID=dbid_from_dotenv_file\n"
+        )
+
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("CLAUDE_CACHE_DIR", None)
+            config = load_config(str(env_file))
+        assert config.claude_cache_dir == DEFAULT_CLAUDE_CACHE_DIR.expanduser()
+
+        with patch.dict(os.environ, {"CLAUDE_CACHE_DIR": "off"}):
+            config = load_config(str(env_file))
+        assert config.claude_cache_dir is None
+
+
+class TestTranslationBackendError:
+    def test_cli_backend_requires_claude_binary(self, mock_config):
+        with patch("medium_notion.config.Config.check_claude_code", return_value=False):
+            assert "Claude Code CLI" in mock_config.translation_backend_error()
+        with patch("medium_notion.config.Config.check_claude_code", return_value=True):
+            assert mock_config.translation_backend_error() is None
+
+    def test_api_backend_does_not_need_claude_binary(self, mock_config):
+        """api バックエンドでは claude コマンドではなく SDK と API キーを確認すること"""
+        mock_config.claude_backend = "api"
+        with patch("medium_notion.config.Config.check_claude_code", return_value=False), \
+             patch("medium_notion.config.importlib.util.find_spec", return_value=object()):
+            with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "sk-test"}):
+                assert mock_config.translation_backend_error() is None
+            with patch.dict(os.environ, {}, clear=False):
+                os.environ.pop("ANTHROPIC_API_KEY", None)
+                assert "ANTHROPIC_API_KEY" in mock_config.translation_backend_error()
+
+    def test_api_backend_without_sdk(self, mock_config):
+        mock_config.claude_backend = "api"
+        with patch("medium_notion.config.importlib.util.find_spec", return_value=None):
+            assert "anthropic" in mock_config.translation_backend_error()
@@ -11,6 +11,7 @@ import pytest
 
 from medium_notion.browser import (
     _load_list_url_cache,
+    _match_list_link,
     _save_list_url,
 )
 
@@ -66,3 +67,25 @@ class TestSaveListUrl:
         _save_list_url(cache_path, "toNotion", url_with_tracking)
         loaded = json.loads(cache_path.read_text())
         assert loaded["toNotion"] == "https://medium.com/@user/list/foo-abc"
+
+
+class TestMatchListLink:
+    LINKS = [
+        {"href": "https://medium.com/@me/list/reading-list", "text": "Reading list"},
+        {"href": "https://medium.com/@me/list/tonotion-abc123", "text": ""},
+        {"href": "https://medium.com/@me/list/tonotion-abc123", "text": "toNotion12 stories"},
+        {"href": "https://medium.com/@me/list/ai-papers-def456", "text": "AI Papers"},
+    ]
+
+    def test_exact_text_match(self):
+        assert _match_list_link("AI Papers", self.LINKS).endswith("ai-papers-def456")
+
+    def test_text_contains_name(self):
+        assert _match_list_link("toNotion", self.LINKS).endswith("tonotion-abc123")
+
+    def test_fuzzy_match(self):
+        assert _match_list_link("AI Papres", self.LINKS).endswith("ai-papers-def456")
+
+    def test_skips_reading_list_and_returns_none(self):
+        assert _match_list_link("Reading list", self.LINKS) is None
+        assert _match_list_link("Cooking", self.LINKS) is None
@@ -1,5 +1,9 @@
 """データモデルのテスト"""
 
+from dataclasses import FrozenInstanceError
+
+import pytest
+
 from medium_notion.models import MediumArticle, TranslationResult
 
 
@@ -33,3 +37,25 @@ class TestTranslationResult:
         )
         assert result.topics == ["Kubernetes", "モジューラーモノリス", "運用負荷"]
         assert len(result.topics) == 3
+
+
+class TestMediumArticle:
+    def test_frozen(self):
+        """取得後の記事は変更できないこと"""
+        article = MediumArticle(url="https://medium.com/@test/a", title="T", content="c")
+        with pytest.raises(FrozenInstanceError):
+            article.title = "changed"
+
+    def test_hashable_with_tags(self):
+        """tags（list）を持っていても set に入れられること"""
+        article = MediumArticle(
+            url="https://medium.com/@test/a", title="T", content="c", tags=["AI"]
+        )
+        assert article in {article}
+
+    def test_word_count_cached(self):
+        """word_count は初回アクセス時に数えた値を使い回すこと"""
+        article = MediumArticle(url="https://medium.com/@test/a", title="T", content="a b  c\nd")
+        assert article.word_count == 4
+        assert article._word_count == 4
+        assert article.word_count == 4
@@ -3,9 +3,18 @@
 from datetime import date
 from unittest.mock import patch, MagicMock
 
+import httpx
+import orjson
 import pytest
-
-from medium_notion.notion_client import NotionClient, _text_obj
+from notion_client.errors import APIResponseError
+
+from medium_notion.notion_client import (
+    NotionClient,
+    NotionSDKClient,
+    _classify_paragraph,
+    _normalize_code_language,
+    _text_obj,
+)
 from medium_notion.models import TranslationResult
 
 
@@ -93,6 +102,12 @@ class TestNotionClient:
         assert len(result) > 1
         assert all(len(chunk) <= 2000 for chunk in result)
 
+    def test_split_text_sentence_boundaries(self, notion_client):
+        """句点・". " で区切り、続くチャンクの前後の空白を落とすこと"""
+        text = "あいう。 えお. かきくけこ  \n"
+        result = notion_client._split_text(text, 6)
+        assert result == ["あいう。", "えお.", "かきくけこ"]
+
     def test_heading_block(self, notion_client):
         """見出しブロックの生成"""
         block = notion_client._heading_block("テスト見出し", level=2)
@@ -247,6 +262,74 @@ class TestNotionAPIDataSource:
         }
         mock_sdk.data_sources.query.assert_called_once()
 
+    def test_list_existing_urls_requests_only_url_property(self, notion_client):
+        """スキーマ取得済みなら URL プロパティだけを filter_properties で要求すること"""
+        mock_sdk = notion_client.client
+        mock_sdk.data_sources.retrieve.return_value = {
+            "title": [],
+            "properties": {"URL": {"id": "u%3D1"}, "名前": {"id": "title"}},
+        }
+        mock_sdk.data_sources.query.return_value = {"results": [], "has_more": False}
+        notion_client.check_access()
+
+        notion_client.list_existing_urls()
+
+        call_kwargs = mock_sdk.data_sources.query.call_args[1]
+        assert call_kwargs["filter_properties"] == ["u%3D1"]
+
+    def test_find_existing_urls_stops_when_all_found(self, notion_client):
+        """全候補が見つかったら残りのページを取得しないこと"""
+        mock_sdk = notion_client.client
+        mock_sdk.data_sources.query.return_value = {
+            "results": [
+                {"properties": {"URL": {"url": "https://medium.com/a"}}},
+                {"properties": {"URL": {"url": "https://medium.com/b"}}},
+            ],
+            "has_more": True,
+            "next_cursor": "cursor-2",
+        }
+        found = notion_client.find_existing_urls({"https://medium.com/a"})
+
+        assert found == {"https://medium.com/a"}
+        mock_sdk.data_sources.query.assert_called_once()
+
+    def test_find_existing_urls_scans_all_pages_for_new_urls(self, notion_client):
+        """未登録の候補があれば最後までたどり、登録済みの分だけ返すこと"""
+        mock_sdk = notion_client.client
+        mock_sdk.data_sources.query.side_effect = [
+            {
+                "results": [{"properties": {"URL": {"url": "https://medium.com/a"}}}],
+                "has_more": True,
+                "next_cursor": "cursor-2",
+            },
+            {
+                "results": [{"properties": {"URL": {"url": "https://medium.com/b"}}}],
+                "has_more": False,
+                "next_cursor": None,
+            },
+        ]
+        found = notion_client.find_existing_urls(
+            {"https://medium.com/b", "https://medium.com/new"}
+        )
+
+        assert found == {"https://medium.com/b"}
+        assert mock_sdk.data_sources.query.call_count == 2
+
+    def test_find_existing_urls_empty_candidates(self, notion_client):
+        """候補が空なら DB に問い合わせないこと"""
+        assert notion_client.find_existing_urls(set()) == set()
+        notion_client.client.data_sources.query.assert_not_called()
+
+    def test_filter_properties_omitted_when_schema_unavailable(self, notion_client):
+        """スキーマが取れなければ filter_properties を付けずに全プロパティを取得すること"""
+        mock_sdk = notion_client.client
+        mock_sdk.data_sources.retrieve.side_effect = RuntimeError("boom")
+        mock_sdk.data_sources.query.return_value = {"results": [], "has_more": False}
+
+        notion_client.list_existing_urls()
+
+        assert "filter_properties" not in mock_sdk.data_sources.query.call_args[1]
+
     def test_create_page_uses_data_source_parent(
         self, notion_client, sample_translation
     ):
@@ -324,6 +407,39 @@ class TestListExistingTopics:
 
         assert topics == []
 
+    def test_list_existing_urls_and_topics_single_scan(self, notion_client):
+        """URL と Topics を 1 回のページ送りで両方集めること"""
+        mock_sdk = notion_client.client
+        mock_sdk.data_sources.query.side_effect = [
+            {
+                "results": [
+                    {"properties": {
+                        "URL": {"url": "https://medium.com/a"},
+                        "Topics": {"multi_select": [{"name": "RAG"}]},
+                    }},
+                ],
+                "has_more": True,
+                "next_cursor": "cursor-2",
+            },
+            {
+                "results": [
+                    {"properties": {
+                        "URL": {"url": "https://medium.com/b"},
+                        "Topics": {"multi_select": [{"name": "Agent"}, {"name": "RAG"}]},
+                    }},
+                ],
+                "has_more": False,
+                "next_cursor": None,
+            },
+        ]
+        urls, topics = notion_client.list_existing_urls_and_topics()
+
+        assert urls == {"https://medium.com/a", "https://medium.com/b"}
+        assert topics == ["Agent", "RAG"]
+        assert mock_sdk.data_sources.query.call_count == 2
+        second_call = mock_sdk.data_sources.query.call_args_list[1][1]
+        assert second_call["start_cursor"] == "cursor-2"
+
 
 class TestBackfillMethods:
     """バックフィル用メソッドのテスト"""
@@ -434,3 +550,90 @@ class TestBackfillMethods:
                 }
             },
         )
+
+
+class TestNormalizeCodeLanguage:
+    @pytest.mark.parametrize("language, expected", [
+        ("Python", "python"),
+        ("js", "javascript"),
+        ("python3", "python"),
+        ("javascript1.8", "javascript"),
+        ("c++17", "c++"),
+        ("pyth", "python"),
+        ("brainfuck", "plain text"),
+        ("", "plain text"),
+    ])
+    def test_normalize(self, language, expected):
+        assert _normalize_code_language(language) == expected
+
+
+class TestClassifyParagraph:
+    @pytest.mark.parametrize("para, expected", [
+        ("### 小見出し", "heading_3"),
+        ("## 中見出し", "heading_2"),
+        ("# 大見出し", "heading_1"),
+        ("#タグ", "paragraph"),
+        ("```python\nprint(1)\n```", "code"),
+        ("> 引用", "quote"),
+        ("1. 項目", "numbered"),
+        ("2024年の話", "paragraph"),
+        ("- 項目", "bulleted"),
+        ("* 項目", "bulleted"),
+        ("*斜体*で始まる段落", "paragraph"),
+        ("[画像: 図1]", "image_caption"),
+        ("[リンク](https://example.com)", "paragraph"),
+        ("普通の段落", "paragraph"),
+    ])
+    def test_classify(self, para, expected):
+        assert _classify_paragraph(para) == expected
+
+
+class TestParseInlineMarkdown:
+    def test_repeated_text_returns_fresh_dicts(self):
+        """キャッシュされた結果を返しても、呼び出し側が変更できる別オブジェクトであること"""
+        first = NotionClient._parse_inline_markdown("**重要** な点")
+        first[0]["annotations"]["bold"] = False
+
+        second = NotionClient._parse_inline_markdown("**重要** な点")
+        assert second[0] == {
+            "type": "text",
+            "text": {"content": "重要"},
+            "annotations": {"bold": True},
+        }
+
+
+class TestOrjsonSDKClient:
+    def test_json_body_serialized_with_orjson(self):
+        """JSON ボディが orjson で UTF-8 のまま送られ、認証・ヘッダは SDK 既定のままであること"""
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, json={"object": "page", "id": "p"})
+
+        client = NotionSDKClient(
+            auth="secret", client=httpx.Client(transport=httpx.MockTransport(handler))
+        )
+        body = {"parent": {"data_source_id": "x"}, "properties": {"名前": {"title": []}}}
+        assert client.pages.create(**body)["id"] == "p"
+
+        request = sent[0]
+        assert str(request.url) == "https://api.notion.com/v1/pages"
+        assert request.headers["content-type"] == "application/json"
+        assert request.headers["authorization"] == "Bearer secret"
+        assert "notion-version" in request.headers
+        assert request.content == orjson.dumps(body)
+
+    def test_error_response_still_raises_api_error(self):
+        """エラー応答は SDK と同じ APIResponseError に変換されること"""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                404,
+                json={"object": "error", "status": 404, "code": "object_not_found", "message": "nope"},
+            )
+
+        client = NotionSDKClient(
+            auth="secret", client=httpx.Client(transport=httpx.MockTransport(handler))
+        )
+        with pytest.raises(APIResponseError):
+            client.data_sources.query(data_source_id="x")
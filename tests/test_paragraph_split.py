@@ -11,7 +11,7 @@
 コードブロック内の空行は段落区切りとして扱わない。
 """
 
-from medium_notion.notion_client import _split_paragraphs
+from medium_notion.notion_client import _split_paragraphs, _tokenize_paragraphs
 
 
 class TestSplitParagraphs:
@@ -87,3 +87,17 @@ class TestSplitParagraphs:
         """通常段落の連続空行は1つの区切りとして扱う"""
         text = "A\n\n\n\nB"
         assert _split_paragraphs(text) == ["A", "B"]
+
+
+class TestTokenizeParagraphs:
+    def test_kinds_and_trimmed_lines(self):
+        text = "  ## 見出し\n\n- a\n- b  \n\n```py\nx = 1\n\ny = 2\n```\n\n本文"
+        assert _tokenize_paragraphs(text) == [
+            ("heading_2", ["## 見出し"]),
+            ("bulleted", ["- a", "- b"]),
+            ("code", ["```py", "x = 1", "", "y = 2", "```"]),
+            ("paragraph", ["本文"]),
+        ]
+
+    def test_unclosed_code_block_drops_trailing_blank_lines(self):
+        assert _tokenize_paragraphs("```\nfoo\n\n\n") == [("code", ["```", "foo"])]
@@ -16,8 +16,8 @@ def test_radar_dry_run_prints_digest(tmp_path, monkeypatch):
     digest = Digest(highlights=[ScoredItem(item=fi, score=9, jp_title="刺さる記事")], others=[])
 
     with patch("medium_notion.cli.load_config", return_value=cfg), \
-         patch("medium_notion.cli.load_radar_config", return_value=radar_cfg), \
-         patch("medium_notion.cli.run_radar", return_value=digest) as mock_run:
+         patch("medium_notion.radar.config.load_radar_config", return_value=radar_cfg), \
+         patch("medium_notion.radar.pipeline.run_radar", return_value=digest) as mock_run:
         result = CliRunner().invoke(cli, ["radar", "--dry-run"])
 
     assert result.exit_code == 0
@@ -31,7 +31,7 @@ def test_radar_missing_feeds_yml_exits_1(tmp_path, monkeypatch):
     cfg = Config(notion_api_key="ntn_real_key", notion_database_id="a" * 32)
 
     with patch("medium_notion.cli.load_config", return_value=cfg), \
-         patch("medium_notion.cli.load_radar_config",
+         patch("medium_notion.radar.config.load_radar_config",
                side_effect=FileNotFoundError("feeds.yml")):
         result = CliRunner().invoke(cli, ["radar", "--dry-run"])
 
@@ -48,8 +48,8 @@ def test_radar_reports_slack_failure(tmp_path, monkeypatch):
     digest.slack_status = "failed"
 
     with patch("medium_notion.cli.load_config", return_value=cfg), \
-         patch("medium_notion.cli.load_radar_config", return_value=radar_cfg), \
-         patch("medium_notion.cli.run_radar", return_value=digest):
+         patch("medium_notion.radar.config.load_radar_config", return_value=radar_cfg), \
+         patch("medium_notion.radar.pipeline.run_radar", return_value=digest):
         result = CliRunner().invoke(cli, ["radar"])
 
     assert result.exit_code == 0
@@ -65,8 +65,8 @@ def test_radar_no_deepdive_flag_passed_through(tmp_path, monkeypatch):
     digest = Digest(highlights=[], others=[])
 
     with patch("medium_notion.cli.load_config", return_value=cfg), \
-         patch("medium_notion.cli.load_radar_config", return_value=radar_cfg), \
-         patch("medium_notion.cli.run_radar", return_value=digest) as mock_run:
+         patch("medium_notion.radar.config.load_radar_config", return_value=radar_cfg), \
+         patch("medium_notion.radar.pipeline.run_radar", return_value=digest) as mock_run:
         result = CliRunner().invoke(cli, ["radar", "--no-deepdive"])
 
     assert result.exit_code == 0
@@ -86,8 +86,8 @@ def test_radar_reports_actual_written_count(tmp_path, monkeypatch):
     digest.slack_status = "sent"
 
     with patch("medium_notion.cli.load_config", return_value=cfg), \
-         patch("medium_notion.cli.load_radar_config", return_value=radar_cfg), \
-         patch("medium_notion.cli.run_radar", return_value=digest):
+         patch("medium_notion.radar.config.load_radar_config", return_value=radar_cfg), \
+         patch("medium_notion.radar.pipeline.run_radar", return_value=digest):
         result = CliRunner().invoke(cli, ["radar"])
 
     assert result.exit_code == 0
@@ -71,3 +71,21 @@ def test_fetch_uses_timed_http_get(monkeypatch):
     assert captured["url"] == "https://example.com/rss"
     assert captured["timeout"] is not None  # タイムアウトが必ず指定される
     assert len(items) == 2
+
+
+def test_fetch_uses_shared_client():
+    """共有クライアントを渡すとそれで取得し、タイムアウトはクライアント側に設定されている"""
+    from unittest.mock import MagicMock
+
+    from medium_notion.radar.sources.rss import feed_client
+
+    client = MagicMock()
+    client.get.return_value = MagicMock(content=FIXTURE.read_bytes())
+
+    spec = FeedSpec(name="Sample Blog", url="https://example.com/rss", layer="一次情報")
+    items = RssSource(spec, client=client).fetch()
+
+    client.get.assert_called_once_with("https://example.com/rss")
+    assert len(items) == 2
+    with feed_client() as real:
+        assert real.timeout.read is not None
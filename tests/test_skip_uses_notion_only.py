@@ -20,13 +20,16 @@ from medium_notion.config import Config
 
 
 @pytest.fixture
-def config():
+def config(tmp_path):
+    # インデックスの書き出し先は tmp_path にして、カレントディレクトリに残さない
     return Config(
         notion_api_key="ntn_test_key_12345",
         notion_database_id="2a354f2bd9f080c6ad76f4c0caa22b65",
         headless=True,
         log_level="DEBUG",
         claude_model="sonnet",
+        index_path=tmp_path / "article-index.json",
+        index_jsonl_path=tmp_path / "article-index.jsonl",
     )
 
 
@@ -53,8 +56,7 @@ class TestSkipUsesNotionOnly:
 
         notion_instance = MagicMock()
         notion_instance.check_access = MagicMock(return_value=True)
-        notion_instance.list_existing_urls = MagicMock(return_value=set())
-        notion_instance.list_existing_topics = MagicMock(return_value=[])
+        notion_instance.list_existing_urls_and_topics = MagicMock(return_value=(set(), []))
         notion_instance.create_page = MagicMock(return_value=MagicMock(url="https://notion.so/p1"))
 
         article = MagicMock()
@@ -85,9 +87,9 @@ class TestSkipUsesNotionOnly:
 
         with patch("medium_notion.cli.load_config", return_value=config), \
              patch("medium_notion.cli.Config.check_claude_code", return_value=True), \
-             patch("medium_notion.cli.NotionClient", return_value=notion_instance), \
-             patch("medium_notion.cli.BrowserClient", return_value=browser_instance), \
-             patch("medium_notion.cli.TranslationService", return_value=translator_instance), \
+             patch("medium_notion.notion_client.NotionClient", return_value=notion_instance), \
+             patch("medium_notion.browser.BrowserClient", return_value=browser_instance), \
+             patch("medium_notion.translator.TranslationService", return_value=translator_instance), \
              patch("medium_notion.cli._load_article_index", return_value=stale_index):
             _run_bookmark()
 
@@ -101,8 +103,7 @@ class TestSkipUsesNotionOnly:
 
         notion_instance = MagicMock()
         notion_instance.check_access = MagicMock(return_value=True)
-        notion_instance.list_existing_urls = MagicMock(return_value={existing_url})
-        notion_instance.list_existing_topics = MagicMock(return_value=[])
+        notion_instance.list_existing_urls_and_topics = MagicMock(return_value=({existing_url}, []))
         notion_instance.create_page = MagicMock()
 
         browser_instance = MagicMock()
@@ -117,9 +118,9 @@ class TestSkipUsesNotionOnly:
 
         with patch("medium_notion.cli.load_config", return_value=config), \
              patch("medium_notion.cli.Config.check_claude_code", return_value=True), \
-             patch("medium_notion.cli.NotionClient", return_value=notion_instance), \
-             patch("medium_notion.cli.BrowserClient", return_value=browser_instance), \
-             patch("medium_notion.cli.TranslationService", return_value=translator_instance), \
+             patch("medium_notion.notion_client.NotionClient", return_value=notion_instance), \
+             patch("medium_notion.browser.BrowserClient", return_value=browser_instance), \
+             patch("medium_notion.translator.TranslationService", return_value=translator_instance), \
              patch("medium_notion.cli._load_article_index", return_value=[]):
             _run_bookmark()
 
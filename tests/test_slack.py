@@ -3,7 +3,7 @@
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from medium_notion.slack import notify_fatal_error
+from medium_notion.slack import _build_summary_text, notify_fatal_error
 
 
 def _run(coro):
@@ -95,3 +95,24 @@ class TestNotifyFatalError:
         assert any(
             marker in text for marker in [":rotating_light:", "致命的", "Fatal"]
         )
+
+
+class TestBuildSummaryText:
+    """翻訳結果サマリーの本文"""
+
+    def test_lists_successes_and_truncated_failures(self):
+        long_url = "https://medium.com/@author/" + "x" * 80
+        text = _build_summary_text(
+            successes=[("https://medium.com/a", "記事A", "https://notion.so/a")],
+            failures=[(long_url, "timeout")],
+        )
+        assert text.split("\n") == [
+            "*Medium → Notion 翻訳完了*  (2件処理)",
+            "",
+            ":white_check_mark: 成功: 1件",
+            ":x: 失敗: 1件",
+            "",
+            ":link: <https://notion.so/a|記事A>",
+            "",
+            f":warning: {long_url[:60]}...",
+        ]
@@ -1,11 +1,22 @@
 """翻訳モジュールのテスト"""
 
 import json
+import sys
+import threading
+import time
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-from medium_notion.translator import TranslationService
+from medium_notion.models import MediumArticle
+from medium_notion.translator import (
+    MAX_CHUNK_SIZE,
+    METADATA_PROMPT_BUDGET,
+    MIN_CONTENT_PREVIEW,
+    TRANSLATE_PROMPT,
+    TranslationService,
+)
 
 
 class TestParseJson:
@@ -47,6 +58,15 @@ class TestParseJson:
 
         assert result == data
 
+    def test_parse_json_skips_non_json_braces(self, mock_config):
+        """JSON でない { } の後ろにあるオブジェクトを拾えること"""
+        service = TranslationService(mock_config)
+
+        text = '例: {name} を置換します。\n{"key": "value"} 以上です'
+        result = service._parse_json(text)
+
+        assert result == {"key": "value"}
+
 
 class TestExtractMetadata:
     def test_extract_metadata_with_topics(self, mock_config, sample_article):
@@ -152,6 +172,41 @@ class TestExtractMetadata:
         assert summary is None
         assert topics == []
 
+    def test_content_preview_uses_remaining_budget(self, mock_config, sample_article):
+        """本文プレビューは既存記事・Topics を除いた残りの枠まで載せること"""
+        service = TranslationService(mock_config)
+        long_article = MediumArticle(
+            url=sample_article.url, title=sample_article.title, content="z" * 50000
+        )
+        few_topics = ["t"] * 10
+        many_topics = [f"topic_{i:03d}" for i in range(200)]
+
+        with patch.object(service, "_call_claude", return_value="{}") as mock_claude:
+            service._extract_metadata(long_article, [], few_topics)
+            service._extract_metadata(long_article, [], many_topics)
+        short_ctx, long_ctx = (c.args[0].count("z") for c in mock_claude.call_args_list)
+
+        assert METADATA_PROMPT_BUDGET // 2 < long_ctx < short_ctx < METADATA_PROMPT_BUDGET
+
+    def test_content_preview_capped_at_content_length(self):
+        """短い記事では本文の長さを超えるプレビュー長を返さないこと"""
+        assert TranslationService._preview_chars("short", "", "") == len("short")
+        assert TranslationService._preview_chars("z" * 50000, "", "") >= MIN_CONTENT_PREVIEW
+
+    def test_format_context_reused_for_same_lists(self, mock_config):
+        """同じリストで長さも変わらなければ前回のテキストを使い、追記されたら作り直すこと"""
+        service = TranslationService(mock_config)
+        articles = [{"title": "A", "categories": ["AI"]}]
+        topics = ["Kubernetes"]
+
+        first = service._format_context(articles, topics)
+        assert service._format_context(articles, topics) is first
+
+        articles.append({"title": "B", "categories": []})
+        second = service._format_context(articles, topics)
+        assert second is not first
+        assert "- B []" in second[0]
+
 
 class TestExtractTopicsOnly:
     def test_extract_topics_returns_list(self, mock_config):
@@ -202,11 +257,12 @@ class TestExtractTopicsOnly:
 
 
 class TestCallClaude:
-    """_call_claude のテスト"""
+    """_call_claude のテスト（--output-format text）"""
 
     @patch("medium_notion.translator.subprocess.run")
     def test_call_claude_success(self, mock_run, mock_config):
         """Claude Code CLI の正常呼び出し"""
+        mock_config.claude_stream = False
         service = TranslationService(mock_config)
 
         mock_run.return_value = MagicMock(
@@ -221,8 +277,474 @@ class TestCallClaude:
     @patch("medium_notion.translator.subprocess.run")
     def test_call_claude_not_found(self, mock_run, mock_config):
         """Claude Code CLI が見つからない場合"""
+        mock_config.claude_stream = False
         service = TranslationService(mock_config)
         mock_run.side_effect = FileNotFoundError()
 
         with pytest.raises(RuntimeError, match="Claude Code CLI が見つかりません"):
             service._call_claude("test prompt")
+
+
+def _stream_proc(events: list, returncode: int = 0, stderr: str = "") -> MagicMock:
+    """stream-json を 1 行ずつ返す Popen のモック"""
+    proc = MagicMock()
+    proc.stdout = iter(
+        (e if isinstance(e, str) else json.dumps(e, ensure_ascii=False)) + "\n"
+        for e in events
+    )
+    proc.stderr.read.return_value = stderr
+    proc.wait.return_value = returncode
+    proc.poll.return_value = returncode
+    return proc
+
+
+class TestCallClaudeStream:
+    """_call_claude のテスト（--output-format stream-json）"""
+
+    @patch("medium_notion.translator.subprocess.Popen")
+    def test_result_event_is_returned(self, mock_popen, mock_config):
+        """result イベントの本文を応答とし、プロンプトは stdin に書くこと"""
+        proc = _stream_proc([
+            {"type": "system", "subtype": "init"},
+            {"type": "assistant", "message": {"content": [{"type": "text", "text": "訳"}]}},
+            {"type": "result", "subtype": "success", "is_error": False, "result": "訳文"},
+        ])
+        mock_popen.return_value = proc
+
+        result = TranslationService(mock_config)._call_claude("prompt")
+
+        assert result == "訳文"
+        assert "stream-json" in mock_popen.call_args.args[0]
+        proc.stdin.write.assert_called_once_with("prompt")
+
+    @patch("medium_notion.translator.subprocess.Popen")
+    def test_assistant_text_used_without_result(self, mock_popen, mock_config):
+        """result イベントが無ければ assistant の text を連結し、壊れた行は読み飛ばすこと"""
+        mock_popen.return_value = _stream_proc([
+            {"type": "assistant", "message": {"content": [{"type": "text", "text": "前半"}]}},
+            "not json",
+            {"type": "assistant", "message": {"content": [
+                {"type": "tool_use", "name": "x"},
+                {"type": "text", "text": "後半"},
+            ]}},
+        ])
+
+        assert TranslationService(mock_config)._call_claude("prompt") == "前半後半"
+
+    @patch("medium_notion.translator.subprocess.Popen")
+    def test_error_result_raises(self, mock_popen, mock_config):
+        """is_error の result や非ゼロ終了は RuntimeError にすること"""
+        mock_popen.return_value = _stream_proc(
+            [{"type": "result", "is_error": True, "result": "rate limited"}],
+            returncode=1,
+            stderr="boom",
+        )
+
+        with pytest.raises(RuntimeError, match="exit code: 1"):
+            TranslationService(mock_config)._call_claude("prompt")
+
+    @patch("medium_notion.translator.subprocess.Popen")
+    def test_not_found(self, mock_popen, mock_config):
+        """Claude Code CLI が見つからない場合"""
+        mock_popen.side_effect = FileNotFoundError()
+
+        with pytest.raises(RuntimeError, match="Claude Code CLI が見つかりません"):
+            TranslationService(mock_config)._call_claude("prompt")
+
+
+class TestApiBackend:
+    """CLAUDE_BACKEND=api（Anthropic SDK）での呼び出し"""
+
+    def test_cli_backend_has_no_client(self, mock_config):
+        """既定の cli バックエンドでは SDK クライアントを作らないこと"""
+        assert TranslationService(mock_config)._client is None
+
+    def test_missing_sdk_falls_back_to_cli(self, mock_config):
+        """anthropic が入っていなければ CLI にフォールバックすること"""
+        mock_config.claude_backend = "api"
+        with patch.dict(sys.modules, {"anthropic": None}):
+            assert TranslationService(mock_config)._client is None
+
+    @patch("medium_notion.translator.subprocess.Popen")
+    def test_api_client_used_instead_of_cli(self, mock_popen, mock_config):
+        """クライアントがあれば CLI を起動せず、エイリアスをモデル ID に読み替えて呼ぶこと"""
+        service = TranslationService(mock_config)
+        service._client = MagicMock()
+        service._client.messages.create.return_value = SimpleNamespace(
+            stop_reason="end_turn",
+            content=[SimpleNamespace(type="text", text="訳文")],
+        )
+
+        assert service._call_claude("prompt") == "訳文"
+        assert service._call_claude("prompt2") == "訳文"
+
+        mock_popen.assert_not_called()
+        kwargs = service._client.messages.create.call_args.kwargs
+        assert kwargs["model"] == "claude-sonnet-4-5"
+        assert kwargs["messages"] == [{"role": "user", "content": "prompt2"}]
+
+    def test_truncated_response_is_an_error(self, mock_config, tmp_path):
+        """max_tokens で打ち切られた応答はエラーにし、キャッシュしないこと"""
+        mock_config.claude_cache_dir = tmp_path
+        service = TranslationService(mock_config)
+        service._client = MagicMock()
+        service._client.messages.create.return_value = SimpleNamespace(
+            stop_reason="max_tokens",
+            content=[SimpleNamespace(type="text", text="途中までの訳")],
+        )
+
+        with pytest.raises(RuntimeError, match="出力上限"):
+            service._call_claude("prompt")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_empty_response_message_mentions_api(self, mock_config):
+        """API バックエンドの空応答では claude login を案内しないこと"""
+        service = TranslationService(mock_config)
+        service._client = MagicMock()
+        service._client.messages.create.return_value = SimpleNamespace(
+            stop_reason="end_turn", content=[]
+        )
+
+        with pytest.raises(RuntimeError, match="Anthropic API から空の応答") as exc:
+            service._call_claude("prompt")
+        assert "claude login" not in str(exc.value)
+
+    def test_api_error_becomes_runtime_error(self, mock_config):
+        """SDK の例外は RuntimeError として扱うこと"""
+        service = TranslationService(mock_config)
+        service._client = MagicMock()
+        service._client.messages.create.side_effect = ValueError("overloaded")
+
+        with pytest.raises(RuntimeError, match="Anthropic API エラー"):
+            service._call_claude("prompt")
+
+
+class TestClaudeResponseCache:
+    """Claude Code CLI 応答のディスクキャッシュ"""
+
+    @patch.object(TranslationService, "_run_claude", return_value="訳文")
+    def test_second_call_served_from_cache(self, mock_run, mock_config, tmp_path):
+        """同じプロンプトの 2 回目は CLI を呼ばずにキャッシュから返すこと"""
+        mock_config.claude_cache_dir = tmp_path
+        service = TranslationService(mock_config)
+
+        assert service._call_claude("prompt") == "訳文"
+        assert service._call_claude("prompt") == "訳文"
+
+        mock_run.assert_called_once()
+        assert [p.suffix for p in tmp_path.iterdir()] == [".txt"]
+
+    @patch.object(TranslationService, "_run_claude", return_value="訳文")
+    def test_cache_key_includes_model(self, mock_run, mock_config, tmp_path):
+        """モデルが変わればキャッシュを使わないこと"""
+        mock_config.claude_cache_dir = tmp_path
+
+        TranslationService(mock_config)._call_claude("prompt")
+        mock_config.claude_model = "opus"
+        TranslationService(mock_config)._call_claude("prompt")
+
+        assert mock_run.call_count == 2
+
+    @patch.object(TranslationService, "_run_claude")
+    def test_failures_are_not_cached(self, mock_run, mock_config, tmp_path):
+        """CLI エラーはキャッシュせず、次回は CLI を呼び直すこと"""
+        mock_config.claude_cache_dir = tmp_path
+        service = TranslationService(mock_config)
+        mock_run.side_effect = [RuntimeError("boom"), "訳文"]
+
+        with pytest.raises(RuntimeError):
+            service._call_claude("prompt")
+        assert service._call_claude("prompt") == "訳文"
+        assert mock_run.call_count == 2
+
+    @patch.object(TranslationService, "_run_claude", return_value="訳文")
+    def test_disabled_cache_always_calls_cli(self, mock_run, mock_config):
+        """claude_cache_dir が None なら毎回 CLI を呼ぶこと"""
+        assert mock_config.claude_cache_dir is None
+        service = TranslationService(mock_config)
+
+        service._call_claude("prompt")
+        service._call_claude("prompt")
+
+        assert mock_run.call_count == 2
+
+
+def _combined_response(translation: str, title: str) -> str:
+    meta = {"japanese_title": title, "categories": ["AI"], "topics": ["LLM"], "summary": {}}
+    return f"<translation>\n{translation}\n</translation>\n{json.dumps(meta, ensure_ascii=False)}"
+
+
+def _fake_two_step(combined: str, translation: str, metadata: str):
+    """プロンプトの種類（一括 / Step 1 / Step 2）ごとに応答を返す _call_claude の代役
+
+    Step 1 と Step 2 は並行に呼ばれるため、呼び出し順ではなくプロンプトで見分ける。
+    """
+    def fake(prompt: str) -> str:
+        if "<translation>" in prompt:
+            return combined
+        if prompt.startswith(TRANSLATE_PROMPT[:30]):
+            return translation
+        return metadata
+
+    return fake
+
+
+class TestMetadataCache:
+    """記事単位のメタデータキャッシュ"""
+
+    def test_retry_skips_metadata_extraction(self, mock_config, sample_article, tmp_path):
+        """同じ記事の再翻訳では Step 2 を省き、前回のメタデータを使うこと"""
+        mock_config.claude_cache_dir = tmp_path
+        service = TranslationService(mock_config)
+
+        with patch.object(
+            service, "_call_claude", return_value=_combined_response("訳", "題")
+        ):
+            first = service.translate_article(sample_article, existing_topics=["LLM"])
+
+        with patch.object(service, "_call_claude", return_value="訳2") as mock_claude:
+            second = service.translate_article(sample_article, existing_topics=["LLM"])
+
+        mock_claude.assert_called_once()
+        assert "<translation>" not in mock_claude.call_args.args[0]
+        assert second.japanese_content == "訳2"
+        assert second.japanese_title == first.japanese_title
+        assert second.topics == first.topics == ["LLM"]
+
+    def test_topics_rederived_when_existing_topics_change(
+        self, mock_config, sample_article, tmp_path
+    ):
+        """既存 Topics 一覧が変わっていれば、タイトル等は使い回し Topics だけ取り直すこと"""
+        mock_config.claude_cache_dir = tmp_path
+        service = TranslationService(mock_config)
+
+        with patch.object(
+            service, "_call_claude", return_value=_combined_response("訳", "題")
+        ):
+            first = service.translate_article(sample_article)
+
+        def fake(prompt: str) -> str:
+            if "Topics）を抽出し" in prompt:
+                return '{"topics": ["大規模言語モデル"]}'
+            return "訳2"
+
+        with patch.object(service, "_call_claude", side_effect=fake) as mock_claude:
+            second = service.translate_article(
+                sample_article, existing_topics=["大規模言語モデル"]
+            )
+
+        assert mock_claude.call_count == 2
+        assert second.japanese_title == first.japanese_title
+        assert second.topics == ["大規模言語モデル"]
+
+    def test_failed_metadata_is_not_cached(self, mock_config, sample_article, tmp_path):
+        """メタデータが取れなかった記事はキャッシュしないこと"""
+        mock_config.claude_cache_dir = tmp_path
+        service = TranslationService(mock_config)
+
+        service._save_metadata(sample_article, (None, [], None, []), [])
+
+        assert service._load_cached_metadata(sample_article, []) is None
+
+
+class TestTranslateChunked:
+    """長文記事のチャンク並行翻訳"""
+
+    def test_chunks_translated_concurrently_in_original_order(self, mock_config, sample_article):
+        """チャンクは並行に翻訳され、結果は元の順に連結されること"""
+        paragraphs = [f"P{i}" + "x" * (MAX_CHUNK_SIZE - 10) for i in range(3)]
+        article = MediumArticle(
+            url=sample_article.url,
+            title=sample_article.title,
+            author=sample_article.author,
+            content="\n\n".join(paragraphs),
+        )
+        service = TranslationService(mock_config)
+
+        lock = threading.Lock()
+        active = 0
+        max_active = 0
+
+        def fake_call(prompt: str) -> str:
+            nonlocal active, max_active
+            with lock:
+                active += 1
+                max_active = max(max_active, active)
+            # 先頭チャンクほど遅く終わらせ、完了順と入力順をずらす
+            index = next(i for i in range(3) if f"P{i}x" in prompt)
+            time.sleep(0.05 * (3 - index))
+            with lock:
+                active -= 1
+            return f"訳{index}"
+
+        with patch.object(service, "_call_claude", side_effect=fake_call):
+            result = service._translate_chunked(article)
+
+        assert result == "訳0\n\n訳1\n\n訳2"
+        assert max_active > 1
+
+    def test_split_chunks_packs_paragraphs_in_order(self):
+        """段落は順序を保って MAX_CHUNK_SIZE まで詰めること"""
+        paragraphs = ["a" * 6000, "b" * 6000, "c" * 2000, "d" * 6000]
+
+        chunks = TranslationService._split_chunks("\n\n".join(paragraphs))
+
+        assert chunks == [
+            "\n\n".join(paragraphs[:3]),
+            paragraphs[3],
+        ]
+
+    def test_split_chunks_splits_oversize_paragraph_by_sentence(self):
+        """MAX_CHUNK_SIZE を超える段落は文の切れ目で分け、前後の空きにも詰めること"""
+        sentences = [f"Sentence number {i} is here." for i in range(1500)]
+        content = "intro\n\n" + " ".join(sentences) + "\n\noutro"
+
+        chunks = TranslationService._split_chunks(content)
+
+        assert all(len(c) <= MAX_CHUNK_SIZE for c in chunks)
+        assert chunks[0].startswith("intro\n\nSentence number 0 is here.")
+        assert chunks[-1].endswith(".\n\noutro")
+        # 文の途中では切らない
+        assert all(c.endswith(".") or c.endswith("outro") for c in chunks)
+        assert " ".join(chunks).replace("\n\n", " ") == content.replace("\n\n", " ")
+
+    def test_metadata_extraction_overlaps_translation(self, mock_config, sample_article):
+        """長文記事では Step 2 が Step 1 の完了を待たずに走ること"""
+        mock_config.translate_concurrency = 1
+        article = MediumArticle(
+            url=sample_article.url,
+            title=sample_article.title,
+            content="P0" + "x" * MAX_CHUNK_SIZE,
+        )
+        service = TranslationService(mock_config)
+        both_started = threading.Barrier(2, timeout=5)
+        meta = json.dumps({"japanese_title": "題", "categories": [], "summary": {}})
+
+        def fake_call(prompt: str) -> str:
+            # 先頭チャンクと Step 2 が同時に実行中であることを確かめる
+            if "P0" in prompt or not prompt.startswith(TRANSLATE_PROMPT[:30]):
+                both_started.wait()
+            return "訳" if prompt.startswith(TRANSLATE_PROMPT[:30]) else meta
+
+        with patch.object(service, "_call_claude", side_effect=fake_call):
+            result = service.translate_article(article)
+
+        assert result.japanese_content == "訳\n\n訳"
+        assert result.japanese_title == f"題 | {article.title}"
+
+    def test_chunk_prompts_match_translate_prompt(self, mock_config, sample_article):
+        """チャンクのプロンプトは TRANSLATE_PROMPT.format と同じ文字列になること"""
+        paragraphs = [f"P{i} {{x}}" + "x" * (MAX_CHUNK_SIZE - 10) for i in range(2)]
+        article = MediumArticle(
+            url=sample_article.url,
+            title="Title {with} braces",
+            author=sample_article.author,
+            content="\n\n".join(paragraphs),
+        )
+        service = TranslationService(mock_config)
+
+        with patch.object(service, "_call_claude", return_value="訳") as mock_claude:
+            service._translate_chunked(article)
+
+        prompts = [c.args[0] for c in mock_claude.call_args_list]
+        assert prompts == [
+            TRANSLATE_PROMPT.format(title=article.title, content=p) for p in paragraphs
+        ]
+
+    def test_concurrency_one_runs_serially(self, mock_config, sample_article):
+        """translate_concurrency=1 なら 1 件ずつ翻訳すること"""
+        mock_config.translate_concurrency = 1
+        article = MediumArticle(
+            url=sample_article.url,
+            title=sample_article.title,
+            author=sample_article.author,
+            content="\n\n".join(["a" * MAX_CHUNK_SIZE, "b" * MAX_CHUNK_SIZE]),
+        )
+        service = TranslationService(mock_config)
+
+        with patch.object(service, "_call_claude", side_effect=["訳a", "訳b"]) as call:
+            assert service._translate_chunked(article) == "訳a\n\n訳b"
+        assert call.call_count == 2
+
+
+    def test_longest_chunks_submitted_first(self, mock_config, sample_article):
+        """長いチャンクから翻訳に回し、結果は元の順に連結すること"""
+        mock_config.translate_concurrency = 1
+        article = MediumArticle(
+            url=sample_article.url,
+            title=sample_article.title,
+            content="\n\n".join(["a" * 9000, "b" * 9000, "c" * 100]),
+        )
+        service = TranslationService(mock_config)
+        started: list[str] = []
+
+        def fake_call(prompt: str) -> str:
+            letter = next(ch for ch in "abc" if ch * 100 in prompt)
+            started.append(letter)
+            return f"訳{letter}"
+
+        with patch.object(service, "_call_claude", side_effect=fake_call):
+            result = service._translate_chunked(article)
+
+        # チャンクは ["a", "b\n\nc"]。長い方の 2 番目から投入される
+        assert started == ["b", "a"]
+        assert result == "訳a\n\n訳b"
+
+
+class TestTranslateCombined:
+    """翻訳とメタデータ抽出の一括呼び出し"""
+
+    METADATA = {
+        "japanese_title": "テスト記事",
+        "categories": ["AI"],
+        "topics": ["Kubernetes"],
+        "summary": {"overview": "概要", "learnings": "", "use_cases": "", "connections": ""},
+    }
+
+    def test_single_call_for_short_article(self, mock_config, sample_article):
+        """短い記事は 1 回の呼び出しで訳文とメタデータを得ること"""
+        service = TranslationService(mock_config)
+        raw = (
+            "<translation>\n# 見出し\n\n本文の訳\n</translation>\n"
+            + json.dumps(self.METADATA, ensure_ascii=False)
+        )
+
+        with patch.object(service, "_call_claude", return_value=raw) as mock_claude:
+            result = service.translate_article(sample_article, [], ["Kubernetes"])
+
+        mock_claude.assert_called_once()
+        assert "Kubernetes" in mock_claude.call_args[0][0]
+        assert result.japanese_content == "# 見出し\n\n本文の訳"
+        assert result.japanese_title == f"テスト記事 | {sample_article.title}"
+        assert result.categories == ["AI"]
+        assert result.topics == ["Kubernetes"]
+        assert "概要" in result.summary
+
+    def test_missing_metadata_falls_back_to_step2_only(self, mock_config, sample_article):
+        """JSON が取れなければメタデータだけ取り直すこと"""
+        service = TranslationService(mock_config)
+        responses = [
+            "<translation>本文の訳</translation>\nJSON なし",
+            json.dumps(self.METADATA, ensure_ascii=False),
+        ]
+
+        with patch.object(service, "_call_claude", side_effect=responses) as mock_claude:
+            result = service.translate_article(sample_article)
+
+        assert mock_claude.call_count == 2
+        assert result.japanese_content == "本文の訳"
+        assert result.categories == ["AI"]
+
+    def test_missing_envelope_falls_back_to_two_steps(self, mock_config, sample_article):
+        """訳文のタグが無ければ 2 ステップで翻訳し直すこと"""
+        service = TranslationService(mock_config)
+        fake = _fake_two_step(
+            "タグなしの応答", "本文の訳", json.dumps(self.METADATA, ensure_ascii=False)
+        )
+
+        with patch.object(service, "_call_claude", side_effect=fake) as mock_claude:
+            result = service.translate_article(sample_article)
+
+        assert mock_claude.call_count == 3
+        assert result.japanese_content == "本文の訳"
+        assert result.topics == ["Kubernetes"]